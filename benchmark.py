@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Benchmark przepustowości tur "Wśród Miliona Gwiazd"
+
+Uruchamia ziarniste (powtarzalne) scenariusze headless Simulation i mierzy:
+- Galaxy.generate (generowania/s),
+- Simulation.end_turn (tury/s),
+- CombatManager.process_combat_turn (tury/s, faza "combat"),
+- AIController.make_turn_decisions (tury/s dla wszystkich AI i decyzje/s),
+- Battle.execute_full_battle dla jednej bitwy wszystkich statków scenariusza
+  (resolver tablicowy, bitwy/s).
+
+Wyniki są zapisywane do JSON razem z commitem i wersjami bibliotek, więc
+przebiegi z różnych commitów można porównać (--compare).
+
+Przykłady:
+    python benchmark.py                          # small + medium
+    python benchmark.py --scenarios small medium large
+    python benchmark.py --output new.json --compare old.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+# Dodaj katalog projektu do ścieżki
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from src.combat.battle import Battle
+from src.game_logic import Simulation
+from src.models.galaxy import Galaxy
+from src.models.ship import Ship, ShipType
+
+# Skład dodatkowych flot (typ, waga)
+FLEET_COMPOSITION = [
+    (ShipType.SCOUT, 2),
+    (ShipType.FIGHTER, 4),
+    (ShipType.CRUISER, 2),
+    (ShipType.BATTLESHIP, 1),
+    (ShipType.TRANSPORT, 1),
+]
+
+# Spadek przepustowości (w %) uznawany przy --compare za regresję
+REGRESSION_THRESHOLD = 10.0
+
+
+@dataclass
+class Scenario:
+    """Parametry jednego scenariusza benchmarku"""
+    name: str
+    systems: int
+    empires: int     # Łącznie z graczem
+    ships: int       # Docelowa łączna liczba statków
+    turns: int       # Liczba mierzonych tur
+    seed: int = 1234
+
+
+SCENARIOS = {
+    "small": Scenario("small", systems=40, empires=4, ships=100, turns=50),
+    "medium": Scenario("medium", systems=500, empires=16, ships=10_000, turns=3),
+    "large": Scenario("large", systems=5_000, empires=64, ships=100_000, turns=1),
+}
+DEFAULT_SCENARIOS = ["small", "medium"]
+
+
+def build_simulation(scenario: Scenario) -> Simulation:
+    """
+    Zbuduj symulację dla scenariusza
+
+    Galaktyka jest generowana w trybie "poisson" (zawsze dokładnie
+    scenario.systems systemów). Statki ponad startowe są rozdzielane po
+    imperiach po kolei i rozstawiane w losowych systemach, więc w pierwszych
+    turach dochodzi do bitew.
+
+    Args:
+        scenario: Parametry scenariusza
+
+    Returns:
+        Simulation: Gotowa symulacja (bez scenariusza testowego z piratami)
+    """
+    sim = Simulation(verbose=False, seed=scenario.seed)
+    sim.initialize_new_game(
+        with_test_scenario=False,
+        num_systems=scenario.systems,
+        num_ai_empires=scenario.empires - 1,
+        galaxy_mode="poisson",
+    )
+    rng = sim.rng.stream("benchmark")
+
+    ship_types = [ship_type for ship_type, _ in FLEET_COMPOSITION]
+    weights = [weight for _, weight in FLEET_COMPOSITION]
+    systems = sim.galaxy.systems
+    for i in range(max(0, scenario.ships - len(sim.ships))):
+        empire = sim.empires[i % len(sim.empires)]
+        system = rng.choice(systems)
+        ship = Ship.create_ship(
+            ship_id=sim.next_ship_id,
+            ship_type=rng.choices(ship_types, weights)[0],
+            owner_id=empire.id,
+            x=system.x,
+            y=system.y,
+        )
+        sim.ships.append(ship)
+        sim.next_ship_id += 1
+
+    return sim
+
+
+def benchmark_galaxy_generation(scenario: Scenario, repeats: int = 3) -> dict:
+    """
+    Zmierz Galaxy.generate (najlepszy z `repeats` przebiegów)
+
+    Returns:
+        dict: {'seconds', 'per_second', 'systems'}
+    """
+    best = float("inf")
+    systems = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        galaxy = Galaxy.generate(scenario.systems, mode="poisson", seed=scenario.seed)
+        best = min(best, time.perf_counter() - start)
+        systems = len(galaxy.systems)
+    return {"seconds": best, "per_second": 1.0 / best, "systems": systems}
+
+
+def benchmark_large_battle(scenario: Scenario, repeats: int = 3) -> dict:
+    """
+    Zmierz jedną bitwę scenario.ships statków (2/3 myśliwców przeciw 1/3
+    krążowników) - najlepszy z `repeats` przebiegów
+
+    Returns:
+        dict: {'seconds', 'per_second', 'ships', 'rounds'}
+    """
+    attackers_count = scenario.ships * 2 // 3
+    best = float("inf")
+    rounds = 0
+    for _ in range(repeats):
+        attackers = [Ship.create_ship(i, ShipType.FIGHTER, 0, 0, 0) for i in range(attackers_count)]
+        defenders = [
+            Ship.create_ship(attackers_count + i, ShipType.CRUISER, 1, 0, 0)
+            for i in range(scenario.ships - attackers_count)
+        ]
+        battle = Battle(attackers, defenders, 0, 0, rng=random.Random(scenario.seed))
+        start = time.perf_counter()
+        result = battle.execute_full_battle()
+        best = min(best, time.perf_counter() - start)
+        rounds = result.rounds
+    return {"seconds": best, "per_second": 1.0 / best, "ships": scenario.ships, "rounds": rounds}
+
+
+def benchmark_turns(scenario: Scenario, turns: int) -> dict:
+    """
+    Zmierz przetwarzanie tur (end_turn i jego fazy) profilerem symulacji
+
+    Returns:
+        dict: Przepustowość end_turn, combat i AI oraz czasy wszystkich faz
+    """
+    sim = build_simulation(scenario)
+    ships_at_start = len(sim.ships)
+    num_ai = len(sim.ai_controllers)
+
+    sim.profiler.enable()
+    for _ in range(turns):
+        sim.end_turn()
+    sim.profiler.disable()
+
+    traces = sim.profiler.traces
+    turn_time = sum(trace.wall_time for trace in traces)
+    phases = sim.profiler.phase_totals()
+    combat_time = phases["combat"].wall_time
+    ai_time = phases["ai"].wall_time
+
+    return {
+        "turns": len(traces),
+        "ships_at_start": ships_at_start,
+        "ships_at_end": len(sim.ships),
+        "end_turn": {
+            "seconds": turn_time,
+            "turns_per_second": len(traces) / turn_time,
+        },
+        "process_combat_turn": {
+            "seconds": combat_time,
+            "turns_per_second": len(traces) / combat_time,
+        },
+        "make_turn_decisions": {
+            "seconds": ai_time,
+            "turns_per_second": len(traces) / ai_time,
+            "decisions_per_second": len(traces) * num_ai / ai_time,
+        },
+        "phases": {name: stats.wall_time for name, stats in phases.items()},
+    }
+
+
+def run_scenario(scenario: Scenario, turns: Optional[int] = None) -> dict:
+    """Uruchom wszystkie pomiary scenariusza"""
+    turns = turns if turns is not None else scenario.turns
+    result = {"scenario": asdict(scenario)}
+    result["galaxy_generate"] = benchmark_galaxy_generation(scenario)
+    result["large_battle"] = benchmark_large_battle(scenario)
+    result.update(benchmark_turns(scenario, turns))
+    return result
+
+
+def environment_info() -> dict:
+    """Informacje o commicie i środowisku (do porównywania przebiegów)"""
+    root = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+    }
+
+
+def compare_results(current: dict, baseline: dict) -> list[str]:
+    """
+    Porównaj przepustowość z poprzednim przebiegiem
+
+    Returns:
+        list[str]: Linie raportu (regresje oznaczone "REGRESJA")
+    """
+    metrics = [
+        ("galaxy_generate", "per_second"),
+        ("end_turn", "turns_per_second"),
+        ("process_combat_turn", "turns_per_second"),
+        ("make_turn_decisions", "turns_per_second"),
+        ("large_battle", "per_second"),
+    ]
+    lines = [f"Porównanie z {baseline['environment'].get('commit')}:"]
+    for name, result in current["scenarios"].items():
+        old = baseline["scenarios"].get(name)
+        if old is None:
+            continue
+        for metric, key in metrics:
+            if metric not in old:
+                continue  # Pomiar dodany po poprzednim przebiegu
+            before = old[metric][key]
+            after = result[metric][key]
+            change = (after - before) / before * 100
+            flag = "  REGRESJA" if change < -REGRESSION_THRESHOLD else ""
+            lines.append(f"  {name:<8}{metric:<22}{before:>12.2f} -> {after:>12.2f} ({change:+.1f}%){flag}")
+    return lines
+
+
+def print_result(result: dict):
+    """Wypisz wyniki scenariusza"""
+    scenario = result["scenario"]
+    print(f"\n[{scenario['name']}] {scenario['systems']} systemów, "
+          f"{scenario['empires']} imperiów, {result['ships_at_start']} statków, "
+          f"{result['turns']} tur")
+    print(f"  Galaxy.generate      {result['galaxy_generate']['seconds'] * 1000:10.1f} ms")
+    print(f"  end_turn             {result['end_turn']['turns_per_second']:10.2f} tur/s")
+    print(f"  process_combat_turn  {result['process_combat_turn']['turns_per_second']:10.2f} tur/s")
+    print(f"  make_turn_decisions  {result['make_turn_decisions']['turns_per_second']:10.2f} tur/s "
+          f"({result['make_turn_decisions']['decisions_per_second']:.1f} decyzji/s)")
+    print(f"  large_battle         {result['large_battle']['seconds'] * 1000:10.1f} ms "
+          f"({result['large_battle']['ships']} statków, {result['large_battle']['rounds']} rund)")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark przepustowości tur")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS),
+                        default=DEFAULT_SCENARIOS, help="Scenariusze do uruchomienia")
+    parser.add_argument("--turns", type=int, default=None,
+                        help="Liczba mierzonych tur (domyślnie zależna od scenariusza)")
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="Plik wynikowy JSON")
+    parser.add_argument("--compare", default=None,
+                        help="Poprzedni plik wynikowy do porównania")
+    args = parser.parse_args(argv)
+
+    results = {"environment": environment_info(), "scenarios": {}}
+    for name in args.scenarios:
+        result = run_scenario(SCENARIOS[name], args.turns)
+        results["scenarios"][name] = result
+        print_result(result)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nZapisano wyniki: {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        report = compare_results(results, baseline)
+        print("\n".join(report))
+        if any(line.endswith("REGRESJA") for line in report):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Seria headless gier AI-vs-AI w wielu procesach (do strojenia balansu)
+
+Każda gra kończy się zwycięstwem (podbój lub dominacja) albo po limicie
+tur. Podsumowania gier są zapisywane na bieżąco kolumnami do pliku .npz
+(odczyt: numpy.load).
+
+Przykład:
+    python run_batch.py --games 1000 --turns 300 --seed 1 --output batch_results.npz
+"""
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+# Dodaj katalog projektu do ścieżki
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.game_logic.batch import BatchConfig, run_batch
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Seria gier AI-vs-AI")
+    parser.add_argument("--games", type=int, default=100, help="Liczba gier")
+    parser.add_argument("--turns", type=int, default=BatchConfig.max_turns, help="Limit tur na grę")
+    parser.add_argument("--systems", type=int, default=BatchConfig.systems, help="Liczba systemów")
+    parser.add_argument("--empires", type=int, default=BatchConfig.empires, help="Liczba imperiów AI")
+    parser.add_argument("--galaxy-mode", default=BatchConfig.galaxy_mode, choices=["random", "poisson"])
+    parser.add_argument("--seed", type=int, default=0, help="Ziarno serii")
+    parser.add_argument("--workers", type=int, default=None, help="Liczba procesów (domyślnie wszystkie rdzenie)")
+    parser.add_argument("--flush-every", type=int, default=50, help="Co ile gier zapisywać plik")
+    parser.add_argument("--output", default="batch_results.npz", help="Plik wynikowy (.npz)")
+    args = parser.parse_args(argv)
+
+    config = BatchConfig(
+        systems=args.systems,
+        empires=args.empires,
+        max_turns=args.turns,
+        galaxy_mode=args.galaxy_mode,
+    )
+
+    start = time.perf_counter()
+    writer = run_batch(
+        args.games, config, args.output,
+        base_seed=args.seed, workers=args.workers, flush_every=args.flush_every,
+    )
+    elapsed = time.perf_counter() - start
+
+    victories = Counter(victory or "limit tur" for victory in writer.columns.get("victory", []))
+    print(f"Rozegrano {writer.rows} gier w {elapsed:.1f} s -> {args.output}")
+    print("  " + ", ".join(f"{name}: {count}" for name, count in sorted(victories.items())))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
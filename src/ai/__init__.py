@@ -2,5 +2,11 @@
 System AI dla imperiow komputerowych
 """
 from src.ai.ai_controller import AIController
+from src.ai.world_snapshot import WorldSnapshot
+from src.ai.colonization import ColonizationPlanner
+from src.ai.budget import TimeBudget
+from src.ai.orders import MoveOrder, EnqueueOrder, ResearchOrder, apply_orders
+from src.ai.parallel import ParallelAI
 
-__all__ = ['AIController']
+__all__ = ['AIController', 'WorldSnapshot', 'ColonizationPlanner', 'TimeBudget',
+           'MoveOrder', 'EnqueueOrder', 'ResearchOrder', 'apply_orders', 'ParallelAI']
@@ -1,14 +1,20 @@
 """
 Kontroler AI dla imperiów komputerowych
 """
-import math
 import random
 from typing import Optional
 from src.models.empire import Empire
 from src.models.galaxy import Galaxy, StarSystem
 from src.models.ship import Ship, ShipType
+from src.models.ship_registry import ShipRegistry
 from src.models.planet import Planet
-from src.config import TECHNOLOGIES, BUILDINGS, COLONIZABLE_PLANET_TYPES, PlanetType
+from src.ai.world_snapshot import WorldSnapshot
+from src.ai.assignment import ASSIGNMENT_MODES
+from src.ai.colonization import ColonizationPlanner
+from src.ai.budget import TimeBudget
+from src.ai.orders import Order, MoveOrder, EnqueueOrder, ResearchOrder
+from src.config import TECHNOLOGIES, BUILDINGS, AI_SCOUT_ASSIGNMENT
+import numpy as np
 
 
 class AIController:
@@ -16,9 +22,37 @@ class AIController:
     Kontroler AI - zarządza działaniami imperium AI
     """
 
-    def __init__(self, empire: Empire, galaxy: Galaxy):
+    def __init__(self, empire: Empire, galaxy: Galaxy, rng: Optional[random.Random] = None,
+                 scout_assignment: str = AI_SCOUT_ASSIGNMENT, time_budget_ms: Optional[float] = None):
+        """
+        Args:
+            empire: Imperium sterowane przez AI
+            galaxy: Galaktyka
+            rng: Własny generator liczb losowych AI (domyślnie globalny moduł random)
+            scout_assignment: Przydział celów scoutom - "batched" (najkrótsze
+                              pary scout-system najpierw) lub "nearest" (każdy
+                              scout po kolei bierze najbliższy wolny system)
+            time_budget_ms: Limit czasu na decyzje w turze w milisekundach
+                            (None = bez limitu, patrz make_turn_decisions)
+        """
+        if scout_assignment not in ASSIGNMENT_MODES:
+            raise ValueError(f"Nieznany tryb przydziału scoutów: {scout_assignment}")
         self.empire = empire
         self.galaxy = galaxy
+        self.rng = rng or random
+        self.scout_assignment = scout_assignment
+        self.colonization = ColonizationPlanner(empire.id)
+        self.time_budget_ms = time_budget_ms
+
+        # Praca przerwana przez budżet czasu - wznawiana w następnej turze
+        self._resume_step = 0  # Krok decyzji, od którego zaczynamy turę
+        self._production_cursor = 0  # Planeta, od której wznawiamy produkcję
+        # Niewysłane statki: (ID statku, ID systemu, indeks planety do kolonizacji lub None)
+        self._pending_exploration: list[tuple[int, int, Optional[int]]] = []
+        self._pending_colonization: list[tuple[int, int, Optional[int]]] = []
+
+        # Rozkazy wydane w bieżącej turze (zwracane przez make_turn_decisions)
+        self._orders: list[Order] = []
 
         # Parametry zachowania bazując na personality
         self._setup_personality_params()
@@ -63,107 +97,250 @@ class AIController:
             self.scout_count_target = 3
             self.military_ratio = 0.4
 
-    def make_turn_decisions(self, all_ships: list[Ship]):
+    def make_turn_decisions(self, all_ships: list[Ship] | ShipRegistry,
+                            snapshot: Optional[WorldSnapshot] = None,
+                            time_budget_ms: Optional[float] = None) -> list[Order]:
         """
         Wykonaj decyzje AI na turę
 
+        Decyzje od razu zmieniają stan gry, a kontroler zapisuje je też jako
+        rozkazy (MoveOrder, EnqueueOrder, ResearchOrder). Kopia kontrolera
+        w procesie roboczym (bez galaktyki) zmienia tylko kopie planet
+        i imperium - zwrócone rozkazy wykonuje na prawdziwym stanie główny
+        proces (patrz ParallelAI).
+
+        Z budżetem czasu decyzje są "anytime": kroki (eksploracja, kolonizacja,
+        badania, produkcja) wykonujemy po kolei, dopóki starcza czasu.
+        Rozkazy wydane przed upływem budżetu obowiązują, a przerwany krok
+        (produkcję - od planety, na której skończyliśmy) i kroki po nim
+        kontroler wykonuje na początku następnej tury. Eksploracja
+        i kolonizacja przerwane w połowie pamiętają przydziały statków,
+        których nie zdążyły wysłać, a produkcja - planetę, na której
+        skończyła. Co najmniej jeden krok (i jeden rozkaz lub jedna planeta
+        w kroku) wykonuje się w każdej turze.
+
         Args:
-            all_ships: Lista wszystkich statków w grze
+            all_ships: Wszystkie statki w grze (lista lub rejestr)
+            snapshot: Migawka świata wspólna dla wszystkich AI w tej turze
+                      (None = zbuduj migawkę tylko dla tego imperium)
+            time_budget_ms: Limit czasu na tę turę w milisekundach
+                            (None = self.time_budget_ms)
+
+        Returns:
+            list: Rozkazy wydane w tej turze (w kolejności wydania)
+        """
+        budget = TimeBudget(self.time_budget_ms if time_budget_ms is None else time_budget_ms)
+        self._orders = []
+        if snapshot is None:
+            snapshot = WorldSnapshot.build(self.galaxy, all_ships, [self.empire])
+        my_ships = snapshot.ships_of(self.empire.id)
+
+        steps = (
+            lambda: self._handle_exploration(my_ships, snapshot, budget),   # 1. Eksploracja
+            lambda: self._handle_colonization(my_ships, snapshot, budget),  # 2. Kolonizacja
+            self._handle_research,                                          # 3. Badania
+            lambda: self._handle_production(snapshot, budget),              # 4. Produkcja na planetach
+        )
+        for offset in range(len(steps)):
+            step = (self._resume_step + offset) % len(steps)
+            # Krok zwraca False, jeśli budżet przerwał go w połowie
+            if (offset > 0 and budget.expired()) or steps[step]() is False:
+                self._resume_step = step
+                return self._orders
+        self._resume_step = 0
+        return self._orders
+
+    def decision_state(self) -> dict:
+        """
+        Stan kontrolera przenoszony między turami (generator losowy, praca
+        przerwana przez budżet, zajęte cele kolonizacji) - proces roboczy
+        odsyła go głównemu procesowi razem z rozkazami
         """
-        # Pobierz statki tego imperium
-        my_ships = [s for s in all_ships if s.owner_id == self.empire.id]
+        return {
+            "rng": self.rng.getstate(),
+            "resume_step": self._resume_step,
+            "production_cursor": self._production_cursor,
+            "pending_exploration": self._pending_exploration,
+            "pending_colonization": self._pending_colonization,
+            "colonization_claims": self.colonization.claims,
+        }
+
+    def load_decision_state(self, state: dict):
+        """
+        Przywróć stan zwrócony przez decision_state (np. z procesu roboczego)
 
-        # 1. Eksploracja
-        self._handle_exploration(my_ships)
+        Args:
+            state: Stan kontrolera
+        """
+        self.rng.setstate(state["rng"])
+        self._resume_step = state["resume_step"]
+        self._production_cursor = state["production_cursor"]
+        self._pending_exploration = state["pending_exploration"]
+        self._pending_colonization = state["pending_colonization"]
+        self.colonization.claims = state["colonization_claims"]
+
+    def __getstate__(self) -> dict:
+        # Kopia dla procesu roboczego nie niesie galaktyki (czyta migawkę,
+        # a rozkazy ruchu tylko zapisuje - patrz _order_move)
+        state = self.__dict__.copy()
+        state["galaxy"] = None
+        return state
+
+    def _order_move(self, ship: Ship, snapshot: WorldSnapshot, system_index: int,
+                    planet_index: Optional[int] = None):
+        """
+        Wyślij statek do systemu (po hiperliniach, jeśli galaktyka je ma)
+
+        Args:
+            ship: Statek
+            snapshot: Migawka świata na tę turę
+            system_index: Indeks systemu docelowego w migawce
+            planet_index: Planeta, którą statek kolonistów ma skolonizować
+                          (Planet.galaxy_index, None = dowolna w systemie)
+        """
+        if self.galaxy is not None and self.galaxy.order_move(ship, snapshot.systems[system_index]):
+            ship.target_planet_index = planet_index
+        self._orders.append(MoveOrder(ship.id, int(snapshot.system_ids[system_index]), planet_index))
+
+    def _enqueue_building(self, planet: Planet, building_id: str):
+        """Dodaj budynek do kolejki produkcji planety"""
+        building_cost = BUILDINGS[building_id].cost
+        planet.add_building_to_queue(building_id, building_cost)
+        self._orders.append(EnqueueOrder(planet.galaxy_index, "building",
+                                         building_id=building_id, building_cost=building_cost))
+
+    def _enqueue_ship(self, planet: Planet, ship_type: ShipType):
+        """Dodaj statek do kolejki produkcji planety"""
+        planet.add_ship_to_queue(ship_type)
+        self._orders.append(EnqueueOrder(planet.galaxy_index, "ship", ship_type=ship_type))
 
-        # 2. Kolonizacja
-        self._handle_colonization(my_ships)
+    def _start_research(self, tech_id: str):
+        """Rozpocznij badanie technologii"""
+        self.empire.start_research(tech_id)
+        self._orders.append(ResearchOrder(tech_id))
 
-        # 3. Badania
-        self._handle_research()
+    def _send_pending(self, pending: list[tuple[int, int, Optional[int]]], my_ships: list[Ship],
+                      snapshot: WorldSnapshot, budget: Optional[TimeBudget] = None) -> bool:
+        """
+        Wyślij statki do przydzielonych systemów (w kolejności przydziału)
 
-        # 4. Produkcja na planetach
-        self._handle_production()
+        Args:
+            pending: Przydziały (ID statku, ID systemu, indeks planety do kolonizacji
+                     lub None) - wysłane znikają z listy
+            my_ships: Statki tego imperium
+            snapshot: Migawka świata na tę turę
+            budget: Budżet czasu (None = bez limitu)
 
-    def _handle_exploration(self, my_ships: list[Ship]):
+        Returns:
+            bool: False jeśli budżet się skończył - reszta przydziałów
+                  zostaje na liście do następnej tury
+        """
+        ships_by_id = {ship.id: ship for ship in my_ships}
+        for index, (ship_id, system_id, planet_index) in enumerate(pending):
+            if index > 0 and budget is not None and budget.expired():
+                del pending[:index]
+                return False
+            # Statek mógł zginąć lub dostać inny rozkaz od czasu przydziału
+            ship = ships_by_id.get(ship_id)
+            if ship is not None and not ship.is_moving and system_id in snapshot.system_index:
+                self._order_move(ship, snapshot, snapshot.system_index[system_id], planet_index)
+        pending.clear()
+        return True
+
+    def _handle_exploration(self, my_ships: list[Ship], snapshot: WorldSnapshot,
+                            budget: Optional[TimeBudget] = None) -> bool:
         """
         Zarządzaj eksploracją (wysyłaj scouty do nieodkrytych systemów)
 
         Args:
             my_ships: Statki tego imperium
+            snapshot: Migawka świata na tę turę
+            budget: Budżet czasu (None = bez limitu)
+
+        Returns:
+            bool: False jeśli budżet się skończył - następne wywołanie
+                  wyśle najpierw scouty, które dostały już cele
         """
+        # Przerwane wysyłanie - dokończ (bez systemów odkrytych w międzyczasie)
+        if self._pending_exploration:
+            explored = snapshot.explored[self.empire.id]
+            self._pending_exploration = [
+                (ship_id, system_id, planet_index) for ship_id, system_id, planet_index in self._pending_exploration
+                if system_id in snapshot.system_index and not explored[snapshot.system_index[system_id]]
+            ]
+            return self._send_pending(self._pending_exploration, my_ships, snapshot, budget)
+
         # Policz scouti
         scouts = [s for s in my_ships if s.ship_type == ShipType.SCOUT]
         idle_scouts = [s for s in scouts if not s.is_moving]
-
-        # Znajdź nieodkryte systemy
-        unexplored_systems = [
-            system for system in self.galaxy.systems
-            if not self.empire.has_explored(system.id)
+        if not idle_scouts:
+            return True
+
+        # Nieodkryte systemy, do których nie leci już żaden nasz scout
+        # (cele lecących scoutów pozostają zajęte w kolejnych turach)
+        unexplored = ~snapshot.explored[self.empire.id]
+        for scout in scouts:
+            if scout.is_moving and scout.target_system_id in snapshot.system_index:
+                unexplored[snapshot.system_index[scout.target_system_id]] = False
+        targets = np.flatnonzero(unexplored)
+
+        if len(targets) == 0:
+            return True  # Wszystko odkryte lub już ktoś tam leci
+
+        # Przydziel scoutom cele naraz (macierz odległości scout x system)
+        scout_x = np.array([scout.x for scout in idle_scouts])
+        scout_y = np.array([scout.y for scout in idle_scouts])
+        assign = ASSIGNMENT_MODES[self.scout_assignment]
+        scout_indices, target_indices = assign(
+            scout_x, scout_y, snapshot.system_x[targets], snapshot.system_y[targets]
+        )
+
+        # Wyślij scouty (po hiperliniach, jeśli galaktyka je ma) - dopóki starcza czasu
+        self._pending_exploration = [
+            (idle_scouts[scout_index].id, int(snapshot.system_ids[targets[target_index]]), None)
+            for scout_index, target_index in zip(scout_indices.tolist(), target_indices.tolist())
         ]
+        return self._send_pending(self._pending_exploration, my_ships, snapshot, budget)
 
-        if not unexplored_systems:
-            return  # Wszystko odkryte
-
-        # Wyślij idle scouty do eksploracji
-        for scout in idle_scouts[:len(unexplored_systems)]:
-            # Wybierz najbliższy nieodkryty system
-            closest_system = min(unexplored_systems, key=lambda s: self._distance(scout.x, scout.y, s.x, s.y))
-
-            # Wyślij scouta
-            scout.move_to(closest_system.x, closest_system.y, closest_system.id)
-            unexplored_systems.remove(closest_system)
-
-            if not unexplored_systems:
-                break
-
-    def _handle_colonization(self, my_ships: list[Ship]):
+    def _handle_colonization(self, my_ships: list[Ship], snapshot: WorldSnapshot,
+                             budget: Optional[TimeBudget] = None) -> bool:
         """
         Zarządzaj kolonizacją (wysyłaj colony ships do dobrych planet)
 
         Args:
             my_ships: Statki tego imperium
+            snapshot: Migawka świata na tę turę
+            budget: Budżet czasu (None = bez limitu)
+
+        Returns:
+            bool: False jeśli budżet się skończył - następne wywołanie
+                  wyśle najpierw statki, które dostały już cele
         """
-        # Pobierz colony ships
+        # Pobierz colony ships (cele lecących statków pozostają zajęte)
         colony_ships = [s for s in my_ships if s.ship_type == ShipType.COLONY_SHIP]
         idle_colony_ships = [s for s in colony_ships if not s.is_moving]
+        self.colonization.refresh_claims(colony_ships)
 
-        if not idle_colony_ships:
-            return
-
-        # Znajdź dobre planety do kolonizacji
-        colonizable_types = set(COLONIZABLE_PLANET_TYPES)
-
-        # Dodaj zaawansowane typy jeśli AI ma technologie
-        if "ice_colonization" in self.empire.researched_technologies:
-            colonizable_types.add(PlanetType.ICE)
-        if "rock_colonization" in self.empire.researched_technologies:
-            colonizable_types.add(PlanetType.ROCK)
-
-        # Znajdź wolne planety w odkrytych systemach
-        good_planets = []
-        for system in self.galaxy.systems:
-            if self.empire.has_explored(system.id):
-                for planet in system.get_colonizable_planets(list(colonizable_types)):
-                    # Sprawdź czy nie ma już colony shipa w drodze
-                    already_targeted = any(
-                        cs.is_moving and cs.target_system_id == system.id
-                        for cs in colony_ships
-                    )
-                    if not already_targeted:
-                        good_planets.append((system, planet))
-
-        if not good_planets:
-            return
-
-        # Wyślij colony ships do najlepszych planet
-        for colony_ship in idle_colony_ships[:len(good_planets)]:
-            system, planet = random.choice(good_planets)  # Losowy wybór (można ulepszyć)
-            colony_ship.move_to(system.x, system.y, system.id)
-            good_planets.remove((system, planet))
+        # Przerwane wysyłanie - dokończ przed planowaniem nowych celów
+        # (bez planet skolonizowanych w międzyczasie)
+        if self._pending_colonization:
+            self._pending_colonization = [
+                entry for entry in self._pending_colonization if snapshot.planet_owner[entry[2]] < 0
+            ]
+            return self._send_pending(self._pending_colonization, my_ships, snapshot, budget)
 
-            if not good_planets:
-                break
+        if not idle_colony_ships:
+            return True
+
+        # Wolne planety w odkrytych systemach (typy, które imperium umie kolonizować) -
+        # planista wybiera najlepsze (po jednej na system, bez systemów, do których
+        # ktoś już leci), a statek leci skolonizować właśnie wybraną planetę
+        candidates = snapshot.colonizable_indices(self.empire.id, self.empire.get_colonizable_planet_types())
+        self._pending_colonization = [
+            (colony_ship.id, int(snapshot.system_ids[snapshot.planet_system[planet_index]]), planet_index)
+            for colony_ship, planet_index in self.colonization.plan(snapshot, candidates, idle_colony_ships)
+        ]
+        return self._send_pending(self._pending_colonization, my_ships, snapshot, budget)
 
     def _handle_research(self):
         """Zarządzaj badaniami technologicznymi"""
@@ -184,7 +361,7 @@ class AIController:
         # Wybierz technologię bazując na personality
         chosen_tech = self._choose_research(available_techs)
         if chosen_tech:
-            self.empire.start_research(chosen_tech)
+            self._start_research(chosen_tech)
 
     def _choose_research(self, available_techs: list[tuple[str, any]]) -> Optional[str]:
         """
@@ -205,37 +382,51 @@ class AIController:
         if personality == "aggressive":
             military_techs = [t for t in available_techs if "battleship" in t[0].lower() or "weapon" in t[0].lower()]
             if military_techs:
-                return random.choice(military_techs)[0]
+                return self.rng.choice(military_techs)[0]
 
         # Scientific - priorytet badań
         elif personality == "scientific":
             science_techs = [t for t in available_techs if t[1].category == "Komputery" or "laboratory" in t[0].lower()]
             if science_techs:
-                return random.choice(science_techs)[0]
+                return self.rng.choice(science_techs)[0]
 
         # Expansionist - priorytet kolonizacji
         elif personality == "expansionist":
             expansion_techs = [t for t in available_techs if "colonization" in t[0].lower()]
             if expansion_techs:
-                return random.choice(expansion_techs)[0]
+                return self.rng.choice(expansion_techs)[0]
 
         # Peaceful/Balanced - wszystkie tech równo
-        return random.choice(available_techs)[0]
-
-    def _handle_production(self):
-        """Zarządzaj produkcją na planetach"""
-        # Pobierz planety AI
-        my_planets = []
-        for system in self.galaxy.systems:
-            for planet in system.planets:
-                if planet.is_colonized and planet.owner_id == self.empire.id:
-                    my_planets.append((system, planet))
-
-        # Dla każdej planety zdecyduj co budować
-        for system, planet in my_planets:
+        return self.rng.choice(available_techs)[0]
+
+    def _handle_production(self, snapshot: WorldSnapshot, budget: Optional[TimeBudget] = None) -> bool:
+        """
+        Zarządzaj produkcją na planetach
+
+        Args:
+            snapshot: Migawka świata na tę turę
+            budget: Budżet czasu (None = bez limitu)
+
+        Returns:
+            bool: False jeśli budżet się skończył - następne wywołanie
+                  zacznie od pierwszej nieobsłużonej planety
+        """
+        # Planety AI z migawki (indeks własności galaktyki)
+        my_planets = snapshot.planets_of(self.empire.id)
+        start = min(self._production_cursor, len(my_planets))
+
+        # Dla każdej planety zdecyduj co budować (od planety, na której przerwaliśmy)
+        for index in range(start, len(my_planets)):
+            if index > start and budget is not None and budget.expired():
+                self._production_cursor = index
+                return False
+            system, planet = my_planets[index]
             if len(planet.production_queue) < 3:  # Maksymalnie 3 itemy w kolejce
                 self._decide_planet_production(system, planet)
 
+        self._production_cursor = 0
+        return True
+
     def _decide_planet_production(self, system: StarSystem, planet: Planet):
         """
         Zdecyduj co budować na planecie
@@ -245,30 +436,25 @@ class AIController:
             planet: Planeta
         """
         # Losuj co budować bazując na priority
-        roll = random.random()
+        roll = self.rng.random()
 
         # Najpierw sprawdź czy potrzebujemy podstawowych budynków
         if len(planet.buildings) < 2:
             # Buduj podstawowe budynki (farma, fabryka)
             available_buildings = self._get_available_buildings()
             if available_buildings:
-                building_id = random.choice(available_buildings)
-                building_cost = BUILDINGS[building_id].cost
-                planet.add_building_to_queue(building_id, building_cost)
+                self._enqueue_building(planet, self.rng.choice(available_buildings))
                 return
 
         # Zdecyduj: budynek vs statek
         if roll < 0.3:  # 30% szans na budynek
             available_buildings = self._get_available_buildings()
             if available_buildings:
-                building_id = random.choice(available_buildings)
-                building_cost = BUILDINGS[building_id].cost
-                planet.add_building_to_queue(building_id, building_cost)
+                self._enqueue_building(planet, self.rng.choice(available_buildings))
                 return
 
         # Buduj statki
-        ship_type = self._choose_ship_to_build()
-        planet.add_ship_to_queue(ship_type)
+        self._enqueue_ship(planet, self._choose_ship_to_build())
 
     def _get_available_buildings(self) -> list[str]:
         """Pobierz listę budynków które AI może budować"""
@@ -289,7 +475,7 @@ class AIController:
             ShipType: Typ statku
         """
         personality = self.empire.ai_personality or "balanced"
-        roll = random.random()
+        roll = self.rng.random()
 
         # Aggressive - dużo wojska
         if personality == "aggressive":
@@ -343,7 +529,3 @@ class AIController:
                 if "rare_metal_extraction" in self.empire.researched_technologies:
                     return ShipType.BATTLESHIP
                 return ShipType.CRUISER
-
-    def _distance(self, x1: float, y1: float, x2: float, y2: float) -> float:
-        """Oblicz dystans między dwoma punktami"""
-        return math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
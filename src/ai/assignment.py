@@ -0,0 +1,95 @@
+"""
+Przydział celów jednostkom AI (np. scoutów do nieodkrytych systemów)
+"""
+import numpy as np
+
+
+def distance_matrix(unit_x: np.ndarray, unit_y: np.ndarray,
+                    target_x: np.ndarray, target_y: np.ndarray) -> np.ndarray:
+    """Macierz odległości euklidesowych [jednostka, cel]"""
+    return np.sqrt((target_x[None, :] - unit_x[:, None])**2 + (target_y[None, :] - unit_y[:, None])**2)
+
+
+def assign_nearest(unit_x: np.ndarray, unit_y: np.ndarray,
+                   target_x: np.ndarray, target_y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Jednostki po kolei wybierają najbliższy wolny cel
+
+    Wynik jak w pętli `min(cele, key=odległość)` + `cele.remove(...)`,
+    ale odległości liczymy wektorowo, a zajęte cele maskujemy.
+
+    Args:
+        unit_x, unit_y: Pozycje jednostek (w kolejności wyboru)
+        target_x, target_y: Pozycje celów
+
+    Returns:
+        tuple: (indeksy jednostek, indeksy celów) przydzielonych par
+    """
+    count = min(len(unit_x), len(target_x))
+    distances = distance_matrix(unit_x[:count], unit_y[:count], target_x, target_y)
+    targets = np.empty(count, dtype=np.intp)
+    for unit in range(count):
+        target = int(np.argmin(distances[unit]))  # Przy remisie pierwszy cel (jak min)
+        targets[unit] = target
+        distances[:, target] = np.inf
+    return np.arange(count), targets
+
+
+def assign_greedy(unit_x: np.ndarray, unit_y: np.ndarray,
+                  target_x: np.ndarray, target_y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Zachłanne skojarzenie jednostek z celami: najkrótsze pary najpierw
+
+    W przeciwieństwie do assign_nearest kolejność jednostek nie ma znaczenia -
+    cel dostaje jednostka, która ma do niego najbliżej. Jednostka może
+    stracić co najwyżej (jednostki - 1) celi na rzecz innych, więc jej
+    przydział leży zawsze wśród tylu najbliższych celów - wystarczy posortować
+    jednostki x min(jednostki, cele) par zamiast całej macierzy kosztów.
+    Cele w remisie z ostatnim z najbliższych też zostają kandydatami - inaczej
+    argpartition zostawiłby dowolne z nich, a nie te o niższym indeksie
+    (jak w kolejności (odległość, jednostka, cel)).
+
+    Args:
+        unit_x, unit_y: Pozycje jednostek
+        target_x, target_y: Pozycje celów
+
+    Returns:
+        tuple: (indeksy jednostek, indeksy celów) przydzielonych par,
+               w kolejności przydziału (rosnąca odległość)
+    """
+    units, targets = len(unit_x), len(target_x)
+    if units == 0 or targets == 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+    distances = distance_matrix(unit_x, unit_y, target_x, target_y)
+    nearest = min(units, targets)
+    if nearest < targets:
+        boundary = np.partition(distances, nearest - 1, axis=1)[:, nearest - 1]
+        pair_unit, pair_target = np.nonzero(distances <= boundary[:, None])
+    else:
+        pair_unit = np.repeat(np.arange(units), targets)
+        pair_target = np.tile(np.arange(targets), units)
+
+    # Pary uporządkowane po (jednostka, cel) - stabilne sortowanie po odległości
+    # rozstrzyga remisy tak samo jak sortowanie po (odległość, jednostka, cel)
+    order = np.argsort(distances[pair_unit, pair_target], kind="stable")
+
+    assigned_units, assigned_targets = [], []
+    unit_taken = [False] * units
+    target_taken = [False] * targets
+    for unit, target in zip(pair_unit[order].tolist(), pair_target[order].tolist()):
+        if unit_taken[unit] or target_taken[target]:
+            continue
+        unit_taken[unit] = target_taken[target] = True
+        assigned_units.append(unit)
+        assigned_targets.append(target)
+        if len(assigned_units) == nearest:
+            break
+    return np.array(assigned_units, dtype=np.intp), np.array(assigned_targets, dtype=np.intp)
+
+
+# Tryby przydziału (AI_SCOUT_ASSIGNMENT)
+ASSIGNMENT_MODES = {
+    "nearest": assign_nearest,
+    "batched": assign_greedy,
+}
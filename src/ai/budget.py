@@ -0,0 +1,37 @@
+"""
+Budżet czasu na decyzje AI w turze
+"""
+import time
+from typing import Callable, Optional
+
+
+class TimeBudget:
+    """
+    Limit czasu na decyzje AI (liczony od utworzenia budżetu).
+
+    Planiści AI sprawdzają expired() między kolejnymi porcjami pracy
+    i przerywają, gdy czas minął - to, co zdążyli zrobić, obowiązuje,
+    a resztę kontroler dokończy w następnej turze. Budżet None oznacza
+    brak limitu (expired() zawsze False), a 0 - budżet już wyczerpany.
+    """
+
+    def __init__(self, milliseconds: Optional[float] = None,
+                 clock: Callable[[], float] = time.perf_counter):
+        """
+        Args:
+            milliseconds: Dostępny czas w milisekundach (None = bez limitu)
+            clock: Zegar w sekundach (do testów - domyślnie time.perf_counter)
+        """
+        self.clock = clock
+        self.limited = milliseconds is not None
+        self.deadline = clock() + milliseconds / 1000 if self.limited else None
+
+    def expired(self) -> bool:
+        """Czy czas minął"""
+        return self.limited and self.clock() >= self.deadline
+
+    def remaining_ms(self) -> Optional[float]:
+        """Pozostały czas w milisekundach (None = bez limitu)"""
+        if not self.limited:
+            return None
+        return max(0.0, (self.deadline - self.clock()) * 1000)
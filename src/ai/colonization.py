@@ -0,0 +1,128 @@
+"""
+Planowanie kolonizacji AI - ocena planet i wybór celów dla statków kolonistów
+"""
+import heapq
+import numpy as np
+
+from src.ai.assignment import assign_greedy, distance_matrix
+from src.ai.world_snapshot import WorldSnapshot
+from src.models.ship import Ship
+from src.config import (
+    COLONY_SCORE_SIZE, COLONY_SCORE_RICHNESS, COLONY_SCORE_RARE_METALS,
+    COLONY_SCORE_CRYSTALS, COLONY_SCORE_DISTANCE
+)
+
+
+def score_planets(traits: dict[str, np.ndarray], planets: np.ndarray) -> np.ndarray:
+    """
+    Ocena planet niezależna od odległości (rozmiar, bogactwo, rzadkie zasoby)
+
+    Args:
+        traits: Cechy planet (WorldSnapshot.planet_traits)
+        planets: Indeksy ocenianych planet
+
+    Returns:
+        np.ndarray: Punkty planet
+    """
+    return (
+        COLONY_SCORE_SIZE * traits["size"][planets]
+        + COLONY_SCORE_RICHNESS * traits["richness"][planets]
+        + COLONY_SCORE_RARE_METALS * traits["rare_metals"][planets]
+        + COLONY_SCORE_CRYSTALS * traits["crystals"][planets]
+    )
+
+
+class ColonizationPlanner:
+    """
+    Planista kolonizacji jednego imperium.
+
+    Pamięta zajęte cele: system, do którego leci statek kolonistów, jest
+    zajęty, dopóki statek tam leci - kolejne statki wybierają inne systemy.
+    Wolne planety w odkrytych systemach dostają punkty za rozmiar,
+    bogactwo, rzadkie zasoby i (ujemne) za odległość od najbliższego
+    wolnego statku, wszystko na tablicach migawki. Najlepsze cele (po
+    jednym na system) zdejmujemy z kopca, a statki przydzielamy do nich
+    zachłannie po odległości (assign_greedy).
+    """
+
+    def __init__(self, empire_id: int):
+        """
+        Args:
+            empire_id: ID imperium
+        """
+        self.empire_id = empire_id
+        self.claims: dict[int, int] = {}  # ID statku -> ID systemu docelowego
+
+    @property
+    def claimed_systems(self) -> set[int]:
+        """Systemy, do których lecą już statki kolonistów imperium"""
+        return set(self.claims.values())
+
+    def refresh_claims(self, colony_ships: list[Ship]):
+        """
+        Zaktualizuj zajęte cele (statki, które dotarły, zginęły lub zmieniły
+        cel, zwalniają swój system)
+
+        Args:
+            colony_ships: Wszystkie statki kolonistów imperium
+        """
+        self.claims = {
+            ship.id: ship.target_system_id for ship in colony_ships
+            if ship.is_moving and ship.target_system_id is not None
+        }
+
+    def plan(self, snapshot: WorldSnapshot, candidates: np.ndarray,
+             idle_ships: list[Ship]) -> list[tuple[Ship, int]]:
+        """
+        Wybierz cele dla wolnych statków kolonistów i zajmij je
+
+        Args:
+            snapshot: Migawka świata na tę turę
+            candidates: Indeksy wolnych planet, które imperium umie kolonizować
+            idle_ships: Statki kolonistów bez rozkazu
+
+        Returns:
+            list: Pary (statek, indeks planety) w kolejności przydziału
+        """
+        if not idle_ships or len(candidates) == 0:
+            return []
+
+        # Pomiń planety w systemach, do których ktoś już leci
+        claimed = [snapshot.system_index[system_id] for system_id in self.claimed_systems
+                   if system_id in snapshot.system_index]
+        planet_system = snapshot.planet_system
+        if claimed:
+            candidates = candidates[~np.isin(planet_system[candidates], claimed)]
+            if len(candidates) == 0:
+                return []
+
+        # Punkty: cechy planety minus odległość od najbliższego wolnego statku
+        ship_x = np.array([ship.x for ship in idle_ships])
+        ship_y = np.array([ship.y for ship in idle_ships])
+        systems = planet_system[candidates]
+        nearest = distance_matrix(ship_x, ship_y, snapshot.system_x[systems], snapshot.system_y[systems]).min(axis=0)
+        scores = score_planets(snapshot.planet_traits, candidates) - COLONY_SCORE_DISTANCE * nearest
+
+        # Najlepsze cele z kopca - po jednym na system (statek kolonizuje system)
+        heap = list(zip((-scores).tolist(), candidates.tolist()))
+        heapq.heapify(heap)
+        chosen, chosen_systems = [], set()
+        while heap and len(chosen) < len(idle_ships):
+            _, planet = heapq.heappop(heap)
+            system = int(planet_system[planet])
+            if system not in chosen_systems:
+                chosen_systems.add(system)
+                chosen.append(planet)
+
+        # Statki do celów: najkrótsze pary najpierw
+        chosen = np.array(chosen)
+        target_systems = planet_system[chosen]
+        ship_indices, target_indices = assign_greedy(
+            ship_x, ship_y, snapshot.system_x[target_systems], snapshot.system_y[target_systems]
+        )
+        orders = []
+        for ship_index, target_index in zip(ship_indices.tolist(), target_indices.tolist()):
+            ship, planet = idle_ships[ship_index], int(chosen[target_index])
+            self.claims[ship.id] = int(snapshot.system_ids[target_systems[target_index]])
+            orders.append((ship, planet))
+        return orders
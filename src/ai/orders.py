@@ -0,0 +1,66 @@
+"""
+Rozkazy AI - decyzje kontrolera zapisane jako komendy do wykonania na stanie gry
+"""
+from dataclasses import dataclass
+from typing import Optional, Union
+
+from src.models.empire import Empire
+from src.models.galaxy import Galaxy
+from src.models.ship import ShipType
+from src.models.ship_registry import ShipRegistry
+
+
+@dataclass(frozen=True, slots=True)
+class MoveOrder:
+    """Wyślij statek do systemu (Galaxy.order_move), statek kolonistów - do wybranej planety"""
+    ship_id: int
+    system_id: int
+    planet_index: Optional[int] = None  # Planet.galaxy_index planety do kolonizacji
+
+    def apply(self, galaxy: Galaxy, ships: ShipRegistry, empire: Empire):
+        ship = ships.get(self.ship_id)
+        if ship is not None and galaxy.order_move(ship, galaxy.find_system_by_id(self.system_id)):
+            ship.target_planet_index = self.planet_index
+
+
+@dataclass(frozen=True, slots=True)
+class EnqueueOrder:
+    """Dodaj budynek lub statek do kolejki produkcji planety"""
+    planet_index: int  # Planet.galaxy_index
+    item_type: str     # "building" lub "ship" (jak ProductionItem.item_type)
+    building_id: Optional[str] = None
+    building_cost: int = 0
+    ship_type: Optional[ShipType] = None
+
+    def apply(self, galaxy: Galaxy, ships: ShipRegistry, empire: Empire):
+        _, planet = galaxy.planet_entries()[self.planet_index]
+        if self.item_type == "building":
+            planet.add_building_to_queue(self.building_id, self.building_cost)
+        else:
+            planet.add_ship_to_queue(self.ship_type)
+
+
+@dataclass(frozen=True, slots=True)
+class ResearchOrder:
+    """Rozpocznij badanie technologii"""
+    tech_id: str
+
+    def apply(self, galaxy: Galaxy, ships: ShipRegistry, empire: Empire):
+        empire.start_research(self.tech_id)
+
+
+Order = Union[MoveOrder, EnqueueOrder, ResearchOrder]
+
+
+def apply_orders(orders: list[Order], galaxy: Galaxy, ships: ShipRegistry, empire: Empire):
+    """
+    Wykonaj rozkazy imperium na stanie gry (w kolejności wydania)
+
+    Args:
+        orders: Rozkazy zwrócone przez AIController.make_turn_decisions
+        galaxy: Galaktyka
+        ships: Wszystkie statki w grze
+        empire: Imperium, które wydało rozkazy
+    """
+    for order in orders:
+        order.apply(galaxy, ships, empire)
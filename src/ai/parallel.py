@@ -0,0 +1,103 @@
+"""
+Równoległe decyzje AI - kontrolery imperiów w puli procesów
+"""
+import math
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from src.ai.ai_controller import AIController
+from src.ai.budget import TimeBudget
+from src.ai.orders import Order
+from src.ai.world_snapshot import WorldSnapshot
+from src.config import PARALLEL_AI_WORKERS
+
+
+def _decide_in_worker(payload: bytes, empire_ids: list[int],
+                      time_budget_ms: Optional[float]) -> list[tuple[int, list[Order], dict]]:
+    """
+    Podejmij decyzje kilku imperiów w procesie roboczym (kopia świata z pickle)
+
+    Args:
+        payload: Lekka migawka i kontrolery AI zserializowane razem (ParallelAI.decide)
+        empire_ids: Imperia, które decydują w tym procesie (po kolei)
+        time_budget_ms: Czas dla wszystkich imperiów tego procesu (None = bez limitu)
+
+    Returns:
+        list: (ID imperium, rozkazy, stan kontrolera) w kolejności empire_ids
+    """
+    snapshot, controllers = pickle.loads(payload)
+    budget = TimeBudget(time_budget_ms)
+    decisions = []
+    for index, empire_id in enumerate(empire_ids):
+        ai_controller = controllers[empire_id]
+        remaining = budget.remaining_ms()
+        share = None if remaining is None else remaining / (len(empire_ids) - index)
+        orders = ai_controller.make_turn_decisions(snapshot.ships_of(empire_id), snapshot, share)
+        decisions.append((empire_id, orders, ai_controller.decision_state()))
+    return decisions
+
+
+class ParallelAI:
+    """
+    Decyzje wielu imperiów AI równolegle w puli procesów.
+
+    Kontrolery są niezależne - każdy czyta migawkę z początku fazy AI
+    i zmienia tylko swoje statki, planety i badania. Lekką migawkę
+    (WorldSnapshot.for_workers - tablice zamiast obiektów galaktyki) razem
+    z kontrolerami serializujemy raz na turę i rozsyłamy do procesów
+    (każdy proces dostaje ciągły blok imperiów). Procesy zwracają rozkazy
+    i stan kontrolerów (generator losowy, przerwana praca); stan wraca
+    do kontrolerów w głównym procesie, a rozkazy wykonuje wywołujący
+    w kolejności ID imperiów - gra przebiega tak samo jak przy decyzjach
+    po kolei w głównym procesie.
+    """
+
+    def __init__(self, workers: int = PARALLEL_AI_WORKERS):
+        """
+        Args:
+            workers: Procesy do równoległych decyzji AI (0 = sekwencyjnie)
+        """
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def decide(self, controllers: list[AIController], snapshot: WorldSnapshot,
+               time_budget_ms: Optional[float] = None) -> dict[int, list[Order]]:
+        """
+        Podejmij decyzje wszystkich kontrolerów w puli procesów
+
+        Args:
+            controllers: Kontrolery AI (ich stan zostanie zaktualizowany)
+            snapshot: Migawka świata na tę turę
+            time_budget_ms: Czas na decyzje w milisekundach - procesy działają
+                            równolegle, więc każdy dostaje cały budżet
+                            (None = bez limitu)
+
+        Returns:
+            dict: ID imperium -> rozkazy do wykonania (patrz apply_orders)
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        by_id = {ai_controller.empire.id: ai_controller for ai_controller in controllers}
+        payload = pickle.dumps((snapshot.for_workers(), by_id), protocol=pickle.HIGHEST_PROTOCOL)
+
+        empire_ids = sorted(by_id)
+        chunk = math.ceil(len(empire_ids) / self.workers)
+        futures = [
+            self._executor.submit(_decide_in_worker, payload, empire_ids[start:start + chunk], time_budget_ms)
+            for start in range(0, len(empire_ids), chunk)
+        ]
+
+        orders = {}
+        for future in futures:
+            for empire_id, empire_orders, state in future.result():
+                by_id[empire_id].load_decision_state(state)
+                orders[empire_id] = empire_orders
+        return orders
+
+    def close(self):
+        """Zamknij pulę procesów (jeśli była używana)"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
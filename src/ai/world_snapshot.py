@@ -0,0 +1,183 @@
+"""
+Migawka świata na turę - wspólne dane wejściowe dla wszystkich kontrolerów AI
+"""
+import copy
+from dataclasses import dataclass, replace
+from typing import Iterable
+import numpy as np
+
+from src.config import PlanetType
+from src.models.empire import Empire
+from src.models.galaxy import Galaxy, StarSystem
+from src.models.planet import Planet, PLANET_TYPE_CODES
+from src.models.ship import Ship
+from src.models.ship_registry import ShipRegistry
+
+
+@dataclass
+class WorldSnapshot:
+    """
+    Stan świata potrzebny AI, zbudowany raz na turę (WorldSnapshot.build).
+
+    Bez migawki każdy z E kontrolerów AI filtrowałby wszystkie statki
+    i przeglądał wszystkie systemy i planety galaktyki. Migawka robi to raz
+    dla wszystkich imperiów: statki są pogrupowane po właścicielu, planety
+    leżą w tablicach (system, typ, właściciel) utrzymywanych przez galaktykę,
+    a odkryte systemy każdego imperium to maska bitowa nad listą systemów.
+    Budowa nie przegląda planet ani systemów w Pythonie, a zapytania
+    kontrolera kosztują tyle, ile jego własne statki i planety (plus jedna
+    operacja wektorowa na tablicach).
+
+    Migawka opisuje stan z początku fazy AI - decyzje AI w tej fazie
+    (rozkazy ruchu, kolejki produkcji) nie zmieniają zawartych w niej danych.
+    """
+    systems: list[StarSystem]
+    system_index: dict[int, int]  # ID systemu -> indeks w systems (i w maskach)
+    system_ids: np.ndarray        # ID systemów (w kolejności systems)
+    system_x: np.ndarray          # Pozycje systemów (w kolejności systems)
+    system_y: np.ndarray
+
+    # Statki i planety imperiów
+    ships_by_owner: dict[int, list[Ship]]
+    planets_by_owner: dict[int, list[tuple[StarSystem, Planet]]]
+
+    # Wszystkie planety (indeks = Planet.galaxy_index) i ich tablice
+    planets: list[tuple[StarSystem, Planet]]
+    planet_system: np.ndarray  # Indeks systemu planety
+    planet_type: np.ndarray    # Kod typu planety (PLANET_TYPE_CODES)
+    planet_owner: np.ndarray   # ID właściciela na początku tury (-1 = wolna)
+    planet_traits: dict[str, np.ndarray]  # Stałe cechy: size, richness, rare_metals, crystals
+
+    # Odkryte systemy: empire_id -> maska bitowa nad systems
+    explored: dict[int, np.ndarray]
+
+    @classmethod
+    def build(cls, galaxy: Galaxy, ships: Iterable[Ship] | ShipRegistry,
+              empires: Iterable[Empire]) -> 'WorldSnapshot':
+        """
+        Zbuduj migawkę świata
+
+        Args:
+            galaxy: Galaktyka
+            ships: Wszystkie statki w grze (lista lub rejestr)
+            empires: Imperia, dla których AI będzie czytać migawkę
+
+        Returns:
+            WorldSnapshot: Migawka na bieżącą turę
+        """
+        empires = list(empires)
+        systems = galaxy.systems
+        system_index = galaxy.system_index()
+
+        # Statki po właścicielu (rejestr: jedno stabilne sortowanie kolumny)
+        ships_by_owner = {empire.id: [] for empire in empires}
+        if isinstance(ships, ShipRegistry):
+            owners = ships.column("owner_id")
+            order = np.argsort(owners, kind="stable")
+            sorted_owners = owners[order]
+            for empire_id in ships_by_owner:
+                start, end = np.searchsorted(sorted_owners, [empire_id, empire_id + 1])
+                ships_by_owner[empire_id] = ships.ships_at(np.sort(order[start:end]))
+        else:
+            for ship in ships:
+                owned = ships_by_owner.get(ship.owner_id)
+                if owned is not None:
+                    owned.append(ship)
+
+        planet_arrays = galaxy.planet_arrays()
+        system_x, system_y = galaxy.system_positions()
+
+        # Odkryte systemy jako maski bitowe
+        explored = {}
+        for empire in empires:
+            mask = np.zeros(len(systems), dtype=bool)
+            indices = [system_index[system_id] for system_id in empire.explored_systems if system_id in system_index]
+            mask[indices] = True
+            explored[empire.id] = mask
+
+        return cls(
+            systems=systems,
+            system_index=system_index,
+            system_ids=np.fromiter(system_index, dtype=np.int64, count=len(system_index)),
+            system_x=system_x,
+            system_y=system_y,
+            ships_by_owner=ships_by_owner,
+            planets_by_owner={empire.id: galaxy.get_owned_planets(empire.id) for empire in empires},
+            planets=galaxy.planet_entries(),
+            planet_system=planet_arrays["system"],
+            planet_type=planet_arrays["type"],
+            planet_owner=planet_arrays["owner"].copy(),
+            planet_traits={name: planet_arrays[name] for name in ("size", "richness", "rare_metals", "crystals")},
+            explored=explored
+        )
+
+    def for_workers(self) -> 'WorldSnapshot':
+        """
+        Lekka kopia migawki do wysłania procesom roboczym (ParallelAI)
+
+        Bez obiektów systemów i planet galaktyki (systems i planets są puste) -
+        kontrolery AI czytają tablice, a systemy wskazują przez indeks
+        i system_ids. Zostają tylko planety imperiów (kopie bez obserwatora
+        galaktyki, w parach z None zamiast systemu), na których AI decyduje
+        o produkcji.
+
+        Returns:
+            WorldSnapshot: Kopia tańsza do serializacji niż cała galaktyka
+        """
+        planets_by_owner = {}
+        for empire_id, owned in self.planets_by_owner.items():
+            planets_by_owner[empire_id] = entries = []
+            for _, planet in owned:
+                planet = copy.copy(planet)
+                planet._owner_listener = None
+                entries.append((None, planet))
+        return replace(self, systems=[], planets=[], planets_by_owner=planets_by_owner)
+
+    def ships_of(self, empire_id: int) -> list[Ship]:
+        """Statki imperium (w kolejności statków w grze)"""
+        return self.ships_by_owner.get(empire_id, [])
+
+    def planets_of(self, empire_id: int) -> list[tuple[StarSystem, Planet]]:
+        """Planety imperium jako pary (system, planeta) w kolejności galaktyki"""
+        return self.planets_by_owner.get(empire_id, [])
+
+    def unexplored_indices(self, empire_id: int) -> np.ndarray:
+        """Indeksy (w systems) systemów nieodkrytych przez imperium, rosnąco"""
+        return np.flatnonzero(~self.explored[empire_id])
+
+    def unexplored_systems(self, empire_id: int) -> list[StarSystem]:
+        """Systemy nieodkryte przez imperium (w kolejności galaktyki)"""
+        systems = self.systems
+        return [systems[index] for index in self.unexplored_indices(empire_id).tolist()]
+
+    def colonizable_indices(self, empire_id: int, planet_types: Iterable[PlanetType]) -> np.ndarray:
+        """
+        Indeksy (Planet.galaxy_index) wolnych planet podanych typów w systemach
+        odkrytych przez imperium, rosnąco
+
+        Args:
+            empire_id: ID imperium
+            planet_types: Typy planet, które imperium umie kolonizować
+        """
+        type_codes = [PLANET_TYPE_CODES[planet_type] for planet_type in planet_types]
+        matching = (
+            (self.planet_owner < 0)
+            & np.isin(self.planet_type, type_codes)
+            & self.explored[empire_id][self.planet_system]
+        )
+        return np.flatnonzero(matching)
+
+    def colonizable_planets(self, empire_id: int,
+                            planet_types: Iterable[PlanetType]) -> list[tuple[StarSystem, Planet]]:
+        """
+        Wolne planety podanych typów w systemach odkrytych przez imperium
+
+        Args:
+            empire_id: ID imperium
+            planet_types: Typy planet, które imperium umie kolonizować
+
+        Returns:
+            list: Pary (system, planeta) w kolejności galaktyki
+        """
+        planets = self.planets
+        return [planets[index] for index in self.colonizable_indices(empire_id, planet_types).tolist()]
@@ -1,16 +1,24 @@
 """
 System walki i bitew
 """
-from src.combat.battle import Battle, BattleResult
+from src.combat.battle import Battle, BattleResult, BattleRecord
 from src.combat.combat_manager import CombatManager
+from src.combat.detection import find_engagements, hostile_pairs
+from src.combat.resolver import ArrayBattle, ScalarBattle
+from src.combat.lanchester import LanchesterBattle, expected_damage
 
-# Combat effects require pygame - import only if available
-try:
-    from src.combat.combat_effects import CombatEffectsManager, LaserBeam, Explosion
-    __all__ = ['Battle', 'BattleResult', 'CombatManager', 'CombatEffectsManager', 'LaserBeam', 'Explosion']
-except ImportError:
-    # pygame not available, skip visual effects
-    CombatEffectsManager = None
-    LaserBeam = None
-    Explosion = None
-    __all__ = ['Battle', 'BattleResult', 'CombatManager']
+__all__ = ['Battle', 'BattleResult', 'BattleRecord', 'CombatManager', 'find_engagements', 'hostile_pairs', 'ArrayBattle', 'ScalarBattle', 'LanchesterBattle', 'expected_damage', 'CombatEffectsManager', 'LaserBeam', 'Explosion']
+
+_EFFECTS = ('CombatEffectsManager', 'LaserBeam', 'Explosion')
+
+
+def __getattr__(name):
+    # Combat effects require pygame - import lazily so the headless
+    # simulation never pulls pygame in; None if pygame is not available
+    if name in _EFFECTS:
+        try:
+            from src.combat import combat_effects
+        except ImportError:
+            return None
+        return getattr(combat_effects, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
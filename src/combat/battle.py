@@ -5,12 +5,21 @@ from dataclasses import dataclass, field
 from typing import Optional
 import random
 import math
+import numpy as np
 from src.models.ship import Ship
+from src.combat.detection import find_engagements, hostile_pairs
+from src.combat.resolver import ArrayBattle, ScalarBattle
+from src.combat.lanchester import LanchesterBattle
 
 
 @dataclass
 class BattleResult:
-    """Wynik bitwy"""
+    """
+    Wynik bitwy
+
+    Pola attacker_*/defender_* opisują dwie pierwsze frakcje bitwy;
+    survivors i losses obejmują wszystkie frakcje (bitwy wielostronne).
+    """
     attacker_empire_id: int
     defender_empire_id: int
     attacker_won: bool
@@ -19,48 +28,188 @@ class BattleResult:
     attacker_survivors: list[Ship]
     defender_survivors: list[Ship]
     rounds: int
+    survivors: dict[int, list[Ship]] = field(default_factory=dict)  # Imperium -> ocalałe statki
+    losses: dict[int, int] = field(default_factory=dict)  # Imperium -> zniszczone statki
+
+    @property
+    def empire_ids(self) -> list[int]:
+        """Imperia biorące udział w bitwie"""
+        return list(self.losses) or [self.attacker_empire_id, self.defender_empire_id]
+
+    @property
+    def winner_id(self) -> int:
+        """Imperium z największą liczbą ocalałych statków (-1 = remis)"""
+        if not self.survivors:
+            return self.attacker_empire_id if self.attacker_won else self.defender_empire_id
+        counts = sorted(((len(ships), empire_id) for empire_id, ships in self.survivors.items()), reverse=True)
+        if len(counts) > 1 and counts[0][0] == counts[1][0]:
+            return -1
+        return counts[0][1]
 
     @property
     def total_ships_destroyed(self) -> int:
+        if self.losses:
+            return sum(self.losses.values())
         return self.attacker_ships_destroyed + self.defender_ships_destroyed
 
 
+@dataclass(frozen=True, slots=True)
+class BattleRecord:
+    """
+    Skrócony zapis bitwy do historii (bez obiektów statków)
+
+    Kolejne pozycje empire_ids, initial_counts i losses dotyczą tej samej frakcji.
+    """
+    turn: int
+    location_x: float
+    location_y: float
+    empire_ids: tuple[int, ...]
+    initial_counts: tuple[int, ...]
+    losses: tuple[int, ...]
+    winner_id: int  # -1 = remis
+    rounds: int
+
+    @property
+    def total_ships_destroyed(self) -> int:
+        return sum(self.losses)
+
+    @classmethod
+    def from_battle(cls, battle: 'Battle', turn: int) -> 'BattleRecord':
+        """
+        Utwórz zapis zakończonej bitwy
+
+        Args:
+            battle: Zakończona bitwa (z wynikiem)
+            turn: Tura, w której się odbyła
+
+        Returns:
+            BattleRecord: Zapis bitwy
+        """
+        result = battle.result
+        empire_ids = tuple(battle.factions)
+        return cls(
+            turn=turn,
+            location_x=battle.location_x,
+            location_y=battle.location_y,
+            empire_ids=empire_ids,
+            initial_counts=tuple(battle.initial_counts[empire_id] for empire_id in empire_ids),
+            losses=tuple(result.losses.get(empire_id, 0) for empire_id in empire_ids),
+            winner_id=result.winner_id,
+            rounds=result.rounds,
+        )
+
+
 class Battle:
     """
-    Pojedyncza bitwa między dwiema flotami
+    Bitwa między flotami dwóch lub więcej imperiów (frakcji)
+
+    Frakcje strzelają kolejno w każdej rundzie; każdy statek wybiera losowy
+    cel spośród żywych statków frakcji, z którymi jego imperium jest
+    w stanie wojny. Bitwa trwa, dopóki żyją statki co najmniej dwóch
+    wrogich sobie frakcji.
     """
 
     COMBAT_RANGE = 100.0  # Zasięg inicjowania bitwy
     MAX_ROUNDS = 50  # Maksymalna liczba rund (zapobieganie infinite loop)
+    VECTORIZED_MIN_SHIPS = 100  # Od tylu statków bitwa jest rozstrzygana tablicowo (resolver)
+
+    # Sposoby rozstrzygania bitwy (Battle.resolution)
+    EXACT = "exact"  # Runda po rundzie, strzał po strzale
+    LANCHESTER = "lanchester"  # Szacowanie modelem Lanchestera (patrz LanchesterBattle)
 
     def __init__(self, attacker_ships: list[Ship], defender_ships: list[Ship],
-                 location_x: float, location_y: float):
+                 location_x: float, location_y: float,
+                 rng: Optional[random.Random] = None):
         """
-        Inicjalizuj bitwę
+        Inicjalizuj bitwę dwóch flot
 
         Args:
             attacker_ships: Lista statków atakujących
             defender_ships: Lista statków obrońców
             location_x, location_y: Pozycja bitwy
+            rng: Generator liczb losowych (domyślnie globalny moduł random)
         """
-        self.attacker_ships = [s for s in attacker_ships if s.is_alive]
-        self.defender_ships = [s for s in defender_ships if s.is_alive]
+        self.rng = rng or random
         self.location_x = location_x
         self.location_y = location_y
         self.round = 0
         self.is_over = False
         self.result: Optional[BattleResult] = None
+        self.resolution = self.EXACT  # Sposób rozstrzygania w execute_full_battle
+
+        # Frakcje: imperium -> statki (kolejność = kolejność strzelania)
+        self.factions: dict[int, list[Ship]] = {}
+        self.hostile: Optional[set[tuple[int, int]]] = None  # None = wszystkie frakcje są wrogami
+        for ships in (attacker_ships, defender_ships):
+            alive = [s for s in ships if s.is_alive]
+            if alive:
+                self.factions.setdefault(alive[0].owner_id, []).extend(alive)
+        self._record_initial_state()
+
+    @classmethod
+    def multi_faction(cls, factions: dict[int, list[Ship]], location_x: float, location_y: float,
+                      hostile: Optional[set[tuple[int, int]]] = None,
+                      rng: Optional[random.Random] = None) -> 'Battle':
+        """
+        Utwórz jedną bitwę wielu imperiów (jedno starcie)
 
-        # Statystyki początkowe
-        self.initial_attacker_count = len(self.attacker_ships)
-        self.initial_defender_count = len(self.defender_ships)
+        Args:
+            factions: Imperium -> jego statki w starciu
+            location_x, location_y: Pozycja bitwy
+            hostile: Pary (min_id, max_id) imperiów w stanie wojny (None = wszystkie)
+            rng: Generator liczb losowych
 
-        if self.attacker_ships and self.defender_ships:
-            self.attacker_empire_id = self.attacker_ships[0].owner_id
-            self.defender_empire_id = self.defender_ships[0].owner_id
+        Returns:
+            Battle: Bitwa wszystkich frakcji
+        """
+        battle = cls([], [], location_x, location_y, rng=rng)
+        for empire_id, ships in factions.items():
+            alive = [s for s in ships if s.is_alive]
+            if alive:
+                battle.factions[empire_id] = alive
+        battle.hostile = hostile
+        battle._record_initial_state()
+        return battle
+
+    def _record_initial_state(self):
+        """Zapamiętaj liczebność frakcji i dwie pierwsze frakcje (atakujący/obrońca)"""
+        self.initial_counts = {empire_id: len(ships) for empire_id, ships in self.factions.items()}
+        empire_ids = list(self.factions)
+        if len(empire_ids) >= 2:
+            self.attacker_empire_id, self.defender_empire_id = empire_ids[0], empire_ids[1]
         else:
             self.attacker_empire_id = -1
             self.defender_empire_id = -1
+        self.initial_attacker_count = len(self.attacker_ships)
+        self.initial_defender_count = len(self.defender_ships)
+
+        # Wrogowie każdej frakcji i wrogie pary (stałe przez całą bitwę)
+        self._hostile_factions = [
+            (a, b) for i, a in enumerate(empire_ids) for b in empire_ids[i + 1:] if self.are_hostile(a, b)
+        ]
+        self._enemies = {
+            a: [ship for b in empire_ids if self.are_hostile(a, b) for ship in self.factions[b]]
+            for a in empire_ids
+        }
+
+        # Liczba żywych statków frakcji (aktualizowana przy zniszczeniu)
+        self._faction_of = {ship.id: empire_id for empire_id, ships in self.factions.items() for ship in ships}
+        self._count_survivors()
+
+    @property
+    def ships(self) -> list[Ship]:
+        """Wszystkie statki bitwy"""
+        return [ship for ships in self.factions.values() for ship in ships]
+
+    @property
+    def attacker_ships(self) -> list[Ship]:
+        """Statki pierwszej frakcji"""
+        return self.factions.get(self.attacker_empire_id, [])
+
+    @property
+    def defender_ships(self) -> list[Ship]:
+        """Statki drugiej frakcji"""
+        return self.factions.get(self.defender_empire_id, [])
 
     @property
     def attacker_survivors(self) -> list[Ship]:
@@ -72,41 +221,55 @@ class Battle:
         """Żywi obrońcy"""
         return [s for s in self.defender_ships if s.is_alive]
 
+    def survivors(self, empire_id: int) -> list[Ship]:
+        """Żywe statki frakcji"""
+        return [s for s in self.factions.get(empire_id, []) if s.is_alive]
+
+    def are_hostile(self, empire1: int, empire2: int) -> bool:
+        """Czy dwie frakcje bitwy walczą ze sobą"""
+        if empire1 == empire2:
+            return False
+        return self.hostile is None or (min(empire1, empire2), max(empire1, empire2)) in self.hostile
+
+    def _enemy_ships(self, empire_id: int) -> list[Ship]:
+        """Statki wszystkich frakcji wrogich danej"""
+        return self._enemies.get(empire_id, [])
+
+    def _count_survivors(self):
+        """Przelicz żywe statki każdej frakcji"""
+        self._alive_counts = {
+            empire_id: sum(1 for s in ships if s.is_alive) for empire_id, ships in self.factions.items()
+        }
+
+    def _has_hostile_survivors(self) -> bool:
+        """Czy żyją statki co najmniej dwóch wrogich sobie frakcji"""
+        counts = self._alive_counts
+        return any(counts[a] and counts[b] for a, b in self._hostile_factions)
+
     def can_continue(self) -> bool:
         """Czy bitwa może się toczyć dalej"""
         if self.is_over:
             return False
         if self.round >= self.MAX_ROUNDS:
             return False
-        if not self.attacker_survivors:
-            return False
-        if not self.defender_survivors:
-            return False
-        return True
+        self._count_survivors()
+        return self._has_hostile_survivors()
 
     def execute_round(self):
-        """Wykonaj jedną rundę walki"""
+        """Wykonaj jedną rundę walki (frakcje strzelają po kolei)"""
         if not self.can_continue():
             self.finish_battle()
             return
 
         self.round += 1
 
-        # Faza 1: Atakujący strzelają
-        self._execute_attacks(self.attacker_survivors, self.defender_survivors)
-
-        # Sprawdź czy obrońcy przetrwali
-        if not self.defender_survivors:
-            self.finish_battle()
-            return
+        for empire_id in self.factions:
+            self._execute_attacks(self.survivors(empire_id), self._enemy_ships(empire_id))
 
-        # Faza 2: Obrońcy odpowiadają
-        self._execute_attacks(self.defender_survivors, self.attacker_survivors)
-
-        # Sprawdź czy atakujący przetrwali
-        if not self.attacker_survivors:
-            self.finish_battle()
-            return
+            # Sprawdź czy ktoś jeszcze ma z kim walczyć
+            if not self._has_hostile_survivors():
+                self.finish_battle()
+                return
 
         # Sprawdź limit rund
         if self.round >= self.MAX_ROUNDS:
@@ -120,25 +283,30 @@ class Battle:
             attackers: Statki atakujące
             targets: Statki będące celami
         """
+        # Lista żywych celów aktualizowana przy zniszczeniu (bez przebudowy co strzał)
+        alive_targets = [t for t in targets if t.is_alive]
+
         for attacker in attackers:
             if not attacker.is_alive:
                 continue
 
-            if not targets:
-                break
-
-            # Wybierz losowy cel spośród żywych
-            alive_targets = [t for t in targets if t.is_alive]
             if not alive_targets:
                 break
 
-            target = random.choice(alive_targets)
+            # Wybierz losowy cel spośród żywych
+            index = self.rng.randrange(len(alive_targets))
+            target = alive_targets[index]
 
             # Oblicz obrażenia
             damage = self._calculate_damage(attacker, target)
 
             # Zadaj obrażenia
             target.take_damage(damage)
+            if not target.is_alive:
+                alive_targets.pop(index)
+                faction = self._faction_of.get(target.id)
+                if faction is not None:
+                    self._alive_counts[faction] -= 1
 
     def _calculate_damage(self, attacker: Ship, defender: Ship) -> float:
         """
@@ -161,7 +329,7 @@ class Battle:
         damage_after_defense = base_damage * (1 - defense_reduction)
 
         # RNG factor (80% - 120%)
-        rng_factor = random.uniform(0.8, 1.2)
+        rng_factor = self.rng.uniform(0.8, 1.2)
 
         final_damage = damage_after_defense * rng_factor
 
@@ -171,29 +339,57 @@ class Battle:
         """Zakończ bitwę i oblicz wynik"""
         self.is_over = True
 
-        attacker_won = len(self.attacker_survivors) > len(self.defender_survivors)
-
-        attacker_destroyed = self.initial_attacker_count - len(self.attacker_survivors)
-        defender_destroyed = self.initial_defender_count - len(self.defender_survivors)
+        survivors = {empire_id: self.survivors(empire_id) for empire_id in self.factions}
+        losses = {
+            empire_id: self.initial_counts[empire_id] - len(alive)
+            for empire_id, alive in survivors.items()
+        }
+        attacker_survivors = survivors.get(self.attacker_empire_id, [])
+        defender_survivors = survivors.get(self.defender_empire_id, [])
 
         self.result = BattleResult(
             attacker_empire_id=self.attacker_empire_id,
             defender_empire_id=self.defender_empire_id,
-            attacker_won=attacker_won,
-            attacker_ships_destroyed=attacker_destroyed,
-            defender_ships_destroyed=defender_destroyed,
-            attacker_survivors=self.attacker_survivors,
-            defender_survivors=self.defender_survivors,
-            rounds=self.round
+            attacker_won=len(attacker_survivors) > len(defender_survivors),
+            attacker_ships_destroyed=losses.get(self.attacker_empire_id, 0),
+            defender_ships_destroyed=losses.get(self.defender_empire_id, 0),
+            attacker_survivors=attacker_survivors,
+            defender_survivors=defender_survivors,
+            rounds=self.round,
+            survivors=survivors,
+            losses=losses
         )
 
     def execute_full_battle(self) -> BattleResult:
         """
         Wykonaj całą bitwę do końca (auto-resolve)
 
+        Duże bitwy (od VECTORIZED_MIN_SHIPS statków) są rozgrywane przez
+        resolver tablicowy - ten sam model obrażeń i wyboru celów, ale
+        salwy liczone wektorowo w NumPy. Małe bitwy rozgrywa ScalarBattle
+        (wynik identyczny jak execute_round, ale na listach zamiast pól
+        statków). Bitwy z resolution == LANCHESTER
+        są tylko szacowane (bez pętli po statkach), ze zgodnymi średnio
+        stratami i liczbą rund.
+
         Returns:
             BattleResult: Wynik bitwy
         """
+        if self.can_continue():
+            empire_ids = list(self.factions)
+            factions = [self.survivors(empire_id) for empire_id in empire_ids]
+            hostile = np.array([[self.are_hostile(a, b) for b in empire_ids] for a in empire_ids])
+            remaining_rounds = self.MAX_ROUNDS - self.round
+
+            if self.resolution == self.LANCHESTER:
+                self.round += LanchesterBattle(factions, hostile).resolve(remaining_rounds, self.rng)
+                self.finish_battle()
+            elif sum(self.initial_counts.values()) >= self.VECTORIZED_MIN_SHIPS:
+                generator = np.random.default_rng(self.rng.getrandbits(64))
+                self.round += ArrayBattle(factions, hostile, generator).resolve(remaining_rounds)
+            else:
+                self.round += ScalarBattle(factions, hostile, self.rng).resolve(remaining_rounds)
+
         while self.can_continue():
             self.execute_round()
 
@@ -203,62 +399,43 @@ class Battle:
         return self.result
 
     @staticmethod
-    def detect_battles(all_ships: list[Ship], empires_relations: dict[tuple[int, int], str]) -> list['Battle']:
+    def detect_battles(all_ships: list[Ship], empires_relations: dict[tuple[int, int], str],
+                       rng: Optional[random.Random] = None) -> list['Battle']:
         """
         Wykryj wszystkie potencjalne bitwy na mapie
 
+        Każde starcie (skupisko wrogich statków w zasięgu walki) to jedna
+        bitwa wszystkich obecnych w nim imperiów, więc statek bierze udział
+        w co najwyżej jednej bitwie na turę. Każda bitwa dostaje własny
+        generator z ziarnem losowanym z rng, więc jej wynik nie zależy od
+        kolejności rozstrzygania bitew (ani od procesu, który ją rozgrywa).
+
         Args:
             all_ships: Lista wszystkich statków w grze
             empires_relations: Słownik relacji między imperiami {(emp1_id, emp2_id): "war"/"peace"/"neutral"}
+            rng: Generator, z którego losowane są ziarna bitew (domyślnie globalny moduł random)
 
         Returns:
             list[Battle]: Lista bitew do rozegrania
         """
         battles = []
+        hostile = hostile_pairs(empires_relations)
+        rng = rng or random
 
-        # Grupuj statki według pozycji (zaokrąglone do 50 jednostek)
-        from collections import defaultdict
-        ship_groups = defaultdict(list)
-
-        for ship in all_ships:
-            if not ship.is_alive:
-                continue
-
-            # Zaokrąglij pozycję do siatki 50x50
-            grid_x = round(ship.x / 50) * 50
-            grid_y = round(ship.y / 50) * 50
-            ship_groups[(grid_x, grid_y)].append(ship)
-
-        # Sprawdź każdą grupę pod kątem wrogich statków
-        for location, ships_at_location in ship_groups.items():
-            if len(ships_at_location) < 2:
-                continue
+        # Skupiska wrogich statków w zasięgu walki (siatka + union-find)
+        for engagement in find_engagements(all_ships, hostile, Battle.COMBAT_RANGE):
+            location_x = sum(s.x for s in engagement) / len(engagement)
+            location_y = sum(s.y for s in engagement) / len(engagement)
 
             # Pogrupuj według właściciela
-            empire_groups = defaultdict(list)
-            for ship in ships_at_location:
-                empire_groups[ship.owner_id].append(ship)
-
-            # Sprawdź wszystkie pary imperiów
-            empire_ids = list(empire_groups.keys())
-            for i in range(len(empire_ids)):
-                for j in range(i + 1, len(empire_ids)):
-                    emp1 = empire_ids[i]
-                    emp2 = empire_ids[j]
-
-                    # Sprawdź czy są w stanie wojny
-                    relation_key = (min(emp1, emp2), max(emp1, emp2))
-                    relation = empires_relations.get(relation_key, "neutral")
-
-                    if relation == "war":
-                        # Stwórz bitwę
-                        battle = Battle(
-                            attacker_ships=empire_groups[emp1],
-                            defender_ships=empire_groups[emp2],
-                            location_x=location[0],
-                            location_y=location[1]
-                        )
-                        battles.append(battle)
+            empire_groups: dict[int, list[Ship]] = {}
+            for ship in engagement:
+                empire_groups.setdefault(ship.owner_id, []).append(ship)
+
+            battles.append(Battle.multi_faction(
+                empire_groups, location_x, location_y, hostile=hostile,
+                rng=random.Random(rng.getrandbits(64))
+            ))
 
         return battles
 
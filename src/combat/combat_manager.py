@@ -2,10 +2,30 @@
 Manager zarządzający bitwami w grze
 """
 import math
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
-from src.combat.battle import Battle, BattleResult
+from src.combat.battle import Battle, BattleResult, BattleRecord
 from src.models.ship import Ship
+from src.models.ship_registry import ShipRegistry
 from src.models.empire import Empire
+from src.models.galaxy import Galaxy
+from src.config import (
+    PARALLEL_BATTLE_WORKERS, PARALLEL_BATTLE_MIN, AI_BATTLE_RESOLUTION, LANCHESTER_MIN_SHIPS,
+    BATTLE_HISTORY_SIZE, BATTLE_VISIBILITY_RANGE
+)
+
+
+def _resolve_battle(battle: Battle) -> tuple[list[float], int]:
+    """
+    Rozegraj bitwę w procesie roboczym (kopia statków z pickle)
+
+    Returns:
+        tuple: (HP statków w kolejności battle.ships, liczba rund)
+    """
+    battle.execute_full_battle()
+    return [ship.current_hp for ship in battle.ships], battle.round
 
 
 class CombatManager:
@@ -13,18 +33,35 @@ class CombatManager:
     Zarządza systemem walki w grze
     """
 
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None, workers: int = PARALLEL_BATTLE_WORKERS,
+                 ai_battle_resolution: str = AI_BATTLE_RESOLUTION,
+                 history_size: int = BATTLE_HISTORY_SIZE):
+        """
+        Args:
+            rng: Generator liczb losowych dla bitew (domyślnie globalny moduł random)
+            workers: Procesy do równoległego rozstrzygania bitew (0 = sekwencyjnie)
+            ai_battle_resolution: Sposób rozstrzygania bitew, których gracz nie widzi
+                (Battle.EXACT lub Battle.LANCHESTER)
+            history_size: Ile ostatnich bitew pamiętać w historii
+        """
+        self.rng = rng or random
+        self.workers = workers
+        self.ai_battle_resolution = ai_battle_resolution
+        self._executor: Optional[ProcessPoolExecutor] = None
         self.active_battles: list[Battle] = []
-        self.battle_history: list[BattleResult] = []
+        # Bufor cykliczny skróconych zapisów - pełne wyniki (ze statkami) ma tylko ostatnia tura
+        self.battle_history: deque[BattleRecord] = deque(maxlen=history_size)
         self.pending_ship_removals: list[Ship] = []  # Statki do usunięcia po turze
 
-    def detect_and_create_battles(self, all_ships: list[Ship], empires: list[Empire]) -> int:
+    def detect_and_create_battles(self, all_ships: list[Ship], empires: list[Empire],
+                                  galaxy: Optional[Galaxy] = None) -> int:
         """
         Wykryj wszystkie potencjalne bitwy i utwórz je
 
         Args:
             all_ships: Lista wszystkich statków w grze
             empires: Lista wszystkich imperiów
+            galaxy: Galaktyka (do sprawdzenia, które bitwy widzi gracz)
 
         Returns:
             int: Liczba utworzonych bitew
@@ -38,88 +75,154 @@ class CombatManager:
                     relations[relation_key] = emp1.get_relation(emp2.id)
 
         # Wykryj bitwy
-        new_battles = Battle.detect_battles(all_ships, relations)
+        new_battles = Battle.detect_battles(all_ships, relations, self.rng)
+
+        # Duże bitwy, których gracz nie widzi, można tylko oszacować
+        player_ids = {empire.id for empire in empires if empire.is_player}
+        for battle in new_battles:
+            if len(battle.ships) >= LANCHESTER_MIN_SHIPS and not self._visible_to_player(battle, player_ids, galaxy):
+                battle.resolution = self.ai_battle_resolution
 
         # Dodaj nowe bitwy
         self.active_battles.extend(new_battles)
 
         return len(new_battles)
 
-    def resolve_all_battles(self) -> list[BattleResult]:
+    @staticmethod
+    def _visible_to_player(battle: Battle, player_ids: set[int], galaxy: Optional[Galaxy]) -> bool:
+        """
+        Czy gracz widzi bitwę - bierze w niej udział albo toczy się ona
+        w pobliżu systemu, który odkrył (poza nimi jest mgła wojny)
+
+        Args:
+            battle: Bitwa
+            player_ids: ID imperiów graczy (puste w grze samych AI)
+            galaxy: Galaktyka (None = nie wiemy, co widzi gracz - bitwa jest widoczna)
+        """
+        if not player_ids:
+            return False
+        if player_ids & battle.factions.keys() or galaxy is None:
+            return True
+        nearby = galaxy.get_systems_in_range(battle.location_x, battle.location_y, BATTLE_VISIBILITY_RANGE)
+        return any(player_ids & system.explored_by for system in nearby)
+
+    def resolve_all_battles(self, turn: int = 0) -> list[BattleResult]:
         """
         Rozwiąż wszystkie aktywne bitwy (auto-resolve)
 
+        Args:
+            turn: Numer tury (zapisywany w historii bitew)
+
         Returns:
             list[BattleResult]: Lista wyników bitew
         """
         results = []
 
-        for battle in self.active_battles:
-            if not battle.is_over:
-                result = battle.execute_full_battle()
-                results.append(result)
-                self.battle_history.append(result)
+        pending = [battle for battle in self.active_battles if not battle.is_over]
+        if self.workers > 0 and len(pending) >= PARALLEL_BATTLE_MIN:
+            self._resolve_in_pool(pending)
+
+        for battle in pending:
+            # Bitwy rozegrane w puli są już zakończone - zwracają gotowy wynik
+            result = battle.execute_full_battle()
+            results.append(result)
+            self.battle_history.append(BattleRecord.from_battle(battle, turn))
 
-                # Zaznacz zniszczone statki do usunięcia
-                for ship in battle.attacker_ships + battle.defender_ships:
-                    if not ship.is_alive:
-                        self.pending_ship_removals.append(ship)
+            # Zaznacz zniszczone statki do usunięcia
+            for ship in battle.ships:
+                if not ship.is_alive:
+                    self.pending_ship_removals.append(ship)
 
         # Wyczyść zakończone bitwy
         self.active_battles = [b for b in self.active_battles if not b.is_over]
 
         return results
 
-    def remove_destroyed_ships(self, all_ships: list[Ship]) -> int:
+    def _resolve_in_pool(self, battles: list[Battle]):
+        """
+        Rozegraj niezależne bitwy równolegle w puli procesów
+
+        Bitwy nie dzielą statków, a każda ma własny generator (patrz
+        Battle.detect_battles), więc wynik jest taki sam jak przy
+        rozgrywaniu po kolei. Procesy dostają kopie bitew; do statków
+        w głównym procesie wracają tylko HP i liczba rund.
+
+        Args:
+            battles: Bitwy do rozegrania
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        chunksize = max(1, len(battles) // (self.workers * 4))
+        outcomes = self._executor.map(_resolve_battle, battles, chunksize=chunksize)
+        for battle, (hp, rounds) in zip(battles, outcomes):
+            for ship, ship_hp in zip(battle.ships, hp):
+                ship.current_hp = ship_hp
+            battle.round = rounds
+            battle.finish_battle()
+
+    def close(self):
+        """Zamknij pulę procesów (jeśli była używana)"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def remove_destroyed_ships(self, all_ships: ShipRegistry) -> int:
         """
         Usuń zniszczone statki z gry
 
         Args:
-            all_ships: Lista wszystkich statków w grze (modyfikowana in-place)
+            all_ships: Rejestr wszystkich statków w grze (modyfikowany in-place)
 
         Returns:
             int: Liczba usuniętych statków
         """
         removed_count = 0
 
+        # O(1) na statek - rejestr nie przeszukuje listy
         for ship in self.pending_ship_removals:
-            if ship in all_ships:
-                all_ships.remove(ship)
+            if all_ships.discard(ship):
                 removed_count += 1
 
         self.pending_ship_removals.clear()
 
         return removed_count
 
-    def process_combat_turn(self, all_ships: list[Ship], empires: list[Empire]) -> dict:
+    def process_combat_turn(self, all_ships: ShipRegistry, empires: list[Empire], turn: int = 0,
+                            galaxy: Optional[Galaxy] = None) -> dict:
         """
         Przetworz całą turę walki (główna funkcja wywoływana co turę)
 
         Args:
-            all_ships: Lista wszystkich statków w grze
+            all_ships: Rejestr wszystkich statków w grze
             empires: Lista wszystkich imperiów
+            turn: Numer tury (zapisywany w historii bitew)
+            galaxy: Galaktyka (do sprawdzenia, które bitwy widzi gracz)
 
         Returns:
             dict: Statystyki tury {
                 'battles_created': int,
                 'battles_resolved': int,
                 'total_ships_destroyed': int,
+                'destroyed_ships': list[Ship],
                 'results': list[BattleResult]
             }
         """
         # Wykryj i utwórz nowe bitwy
-        battles_created = self.detect_and_create_battles(all_ships, empires)
+        battles_created = self.detect_and_create_battles(all_ships, empires, galaxy)
 
         # Rozwiąż wszystkie bitwy
-        results = self.resolve_all_battles()
+        results = self.resolve_all_battles(turn)
 
         # Usuń zniszczone statki
+        destroyed_ships = list(self.pending_ship_removals)
         ships_destroyed = self.remove_destroyed_ships(all_ships)
 
         return {
             'battles_created': battles_created,
             'battles_resolved': len(results),
             'total_ships_destroyed': ships_destroyed,
+            'destroyed_ships': destroyed_ships,
             'results': results
         }
 
@@ -140,7 +243,7 @@ class CombatManager:
                 return battle
         return None
 
-    def get_recent_battles(self, count: int = 10) -> list[BattleResult]:
+    def get_recent_battles(self, count: int = 10) -> list[BattleRecord]:
         """
         Pobierz ostatnie bitwy z historii
 
@@ -148,9 +251,10 @@ class CombatManager:
             count: Liczba bitew do pobrania
 
         Returns:
-            list[BattleResult]: Lista ostatnich bitew
+            list[BattleRecord]: Zapisy ostatnich bitew (od najstarszej)
         """
-        return self.battle_history[-count:] if self.battle_history else []
+        recent = [record for _, record in zip(range(count), reversed(self.battle_history))]
+        return recent[::-1]
 
     def clear_history(self):
         """Wyczyść historię bitew (do oszczędzania pamięci)"""
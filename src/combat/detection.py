@@ -0,0 +1,159 @@
+"""
+Wykrywanie starć - haszowanie przestrzenne i łączenie składowych (union-find)
+"""
+from typing import Iterable
+import numpy as np
+from src.models.ship import Ship
+from src.models.ship_registry import ShipRegistry
+
+# Połowa sąsiedztwa 3x3 - każda para komórek jest sprawdzana raz
+_HALF_NEIGHBOURHOOD = ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+
+def hostile_pairs(relations: dict[tuple[int, int], str]) -> set[tuple[int, int]]:
+    """Pary (min_id, max_id) imperiów w stanie wojny"""
+    return {key for key, relation in relations.items() if relation == "war"}
+
+
+def _connected_labels(count: int, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Etykiety spójnych składowych grafu (wektorowy union-find)
+
+    Każdy węzeł jest podpinany pod najmniejszą etykietę sąsiada, a potem
+    ścieżki są kompresowane (labels = labels[labels]), aż nic się nie zmieni.
+
+    Returns:
+        np.ndarray: Etykieta (najmniejszy indeks składowej) dla każdego węzła
+    """
+    labels = np.arange(count)
+    while True:
+        lowest = np.minimum(labels[first], labels[second])
+        hooked = labels.copy()
+        np.minimum.at(hooked, labels[first], lowest)
+        np.minimum.at(hooked, labels[second], lowest)
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
+
+
+def find_engagements(ships: Iterable[Ship], hostile: set[tuple[int, int]],
+                     combat_range: float) -> list[list[Ship]]:
+    """
+    Znajdź skupiska wrogich statków w zasięgu walki
+
+    Dwa statki wrogich imperiów w odległości <= combat_range są połączone;
+    starcie to spójna składowa takiego grafu (np. A widzi B, B widzi C).
+    Statki stojące w tym samym punkcie i należące do tego samego imperium
+    są najpierw łączone w stosy, więc wielka flota w jednym systemie to
+    jeden węzeł grafu. Stosy trafiają do siatki o boku combat_range
+    i porównujemy tylko sąsiednie komórki (wektorowo), więc czas jest
+    liniowy względem liczby statków przy ograniczonym zagęszczeniu.
+
+    Args:
+        ships: Statki (martwe są pomijane)
+        hostile: Pary wrogich imperiów (patrz hostile_pairs)
+        combat_range: Zasięg walki
+
+    Returns:
+        list[list[Ship]]: Statki każdego starcia
+    """
+    if isinstance(ships, ShipRegistry):
+        # Pozycje i właściciele prosto z kolumn rejestru
+        rows = np.flatnonzero(ships.column("current_hp") > 0)
+        alive = ships.ships_at(rows)
+        ship_x = ships.column("x")[rows]
+        ship_y = ships.column("y")[rows]
+        ship_owner = ships.column("owner_id")[rows].astype(np.int64)
+    else:
+        alive = [ship for ship in ships if ship.is_alive]
+        ship_x = np.fromiter((ship.x for ship in alive), dtype=float, count=len(alive))
+        ship_y = np.fromiter((ship.y for ship in alive), dtype=float, count=len(alive))
+        ship_owner = np.fromiter((ship.owner_id for ship in alive), dtype=np.int64, count=len(alive))
+
+    if len(alive) < 2 or not hostile:
+        return []
+    count = len(alive)
+
+    # Stosy: unikalne (x, y, właściciel); stack_of[i] = stos i-tego statku
+    by_stack = np.lexsort((ship_owner, ship_y, ship_x))
+    sorted_x, sorted_y, sorted_owner = ship_x[by_stack], ship_y[by_stack], ship_owner[by_stack]
+    new_stack = np.ones(count, dtype=bool)
+    new_stack[1:] = (
+        (sorted_x[1:] != sorted_x[:-1])
+        | (sorted_y[1:] != sorted_y[:-1])
+        | (sorted_owner[1:] != sorted_owner[:-1])
+    )
+    stack_of = np.empty(count, dtype=np.int64)
+    stack_of[by_stack] = np.cumsum(new_stack) - 1
+    xs = sorted_x[new_stack]
+    ys = sorted_y[new_stack]
+    owners = sorted_owner[new_stack]
+    count = len(xs)
+
+    # Macierz wojen po gęstych indeksach imperiów
+    empire_ids, owner_index = np.unique(owners, return_inverse=True)
+    position = {int(empire_id): index for index, empire_id in enumerate(empire_ids)}
+    at_war = np.zeros((len(empire_ids), len(empire_ids)), dtype=bool)
+    for a, b in hostile:
+        if a in position and b in position:
+            at_war[position[a], position[b]] = at_war[position[b], position[a]] = True
+
+    # Komórki siatki jako jeden klucz int64 (z marginesem na sąsiadów)
+    cell_x = np.floor(xs / combat_range).astype(np.int64)
+    cell_y = np.floor(ys / combat_range).astype(np.int64)
+    cell_x -= cell_x.min() - 1
+    cell_y -= cell_y.min() - 1
+    rows = int(cell_y.max()) + 2
+    cell_key = cell_x * rows + cell_y
+    order = np.argsort(cell_key, kind="stable")
+    sorted_keys = cell_key[order]
+
+    range_sq = combat_range * combat_range
+    first_parts, second_parts = [], []
+    for dx, dy in _HALF_NEIGHBOURHOOD:
+        neighbour_key = (cell_x + dx) * rows + (cell_y + dy)
+        start = np.searchsorted(sorted_keys, neighbour_key, side="left")
+        sizes = np.searchsorted(sorted_keys, neighbour_key, side="right") - start
+        total = int(sizes.sum())
+        if total == 0:
+            continue
+
+        # Wszystkie pary (stos, stos w sąsiedniej komórce)
+        first = np.repeat(np.arange(count), sizes)
+        offsets = np.arange(total) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        second = order[np.repeat(start, sizes) + offsets]
+
+        mask = at_war[owner_index[first], owner_index[second]]
+        if dx == 0 and dy == 0:
+            mask &= first < second  # W tej samej komórce każda para raz
+        mask &= (xs[first] - xs[second]) ** 2 + (ys[first] - ys[second]) ** 2 <= range_sq
+        first_parts.append(first[mask])
+        second_parts.append(second[mask])
+
+    if not first_parts:
+        return []
+    first = np.concatenate(first_parts)
+    second = np.concatenate(second_parts)
+    if first.size == 0:
+        return []
+
+    labels = _connected_labels(count, first, second)
+    engaged = np.zeros(count, dtype=bool)
+    engaged[first] = True
+    engaged[second] = True
+
+    # Statki zaangażowanych stosów pogrupowane po składowej (stabilnie)
+    ship_indices = np.flatnonzero(engaged[stack_of])
+    ship_labels = labels[stack_of[ship_indices]]
+    by_label = np.argsort(ship_labels, kind="stable")
+    ship_indices = ship_indices[by_label]
+    bounds = np.flatnonzero(np.diff(ship_labels[by_label])) + 1
+    return [
+        [alive[index] for index in chunk.tolist()]
+        for chunk in np.split(ship_indices, bounds)
+    ]
@@ -0,0 +1,209 @@
+"""
+Szybkie rozstrzyganie bitew - model Lanchestera dla losowego ognia
+"""
+import math
+import random
+import numpy as np
+from src.models.ship import Ship
+
+# Węzły kwadratury rozkładu mnożnika obrażeń U(0.8, 1.2) (jak w Battle._calculate_damage)
+_DAMAGE_FACTORS = 0.8 + 0.4 * (np.arange(32) + 0.5) / 32
+
+MAX_HITS = 1000  # Górna granica trafień potrzebnych do zniszczenia statku
+VOLLEY_STEPS = 2  # Na ile kroków dzielimy salwę (cele zniszczone w trakcie salwy)
+
+_LOG_FACTORIAL = np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, MAX_HITS + 2)))))
+
+
+def expected_damage(attack: np.ndarray, defense: np.ndarray) -> np.ndarray:
+    """
+    Oczekiwane obrażenia jednego strzału (Battle._calculate_damage i Ship.take_damage)
+
+    Args:
+        attack: Atak strzelców
+        defense: Obrona celów (broadcasting z attack)
+
+    Returns:
+        np.ndarray: Średnie HP zabierane celowi przez jeden strzał
+    """
+    attack, defense = np.broadcast_arrays(np.asarray(attack, dtype=float), np.asarray(defense, dtype=float))
+    reduction = np.minimum(0.8, defense / (defense + 50))
+    damage = np.maximum(1.0, (attack * (1 - reduction))[..., None] * _DAMAGE_FACTORS)
+    return np.maximum(0.0, damage - defense[..., None]).mean(axis=-1)
+
+
+def _poisson_cdf(k: np.ndarray, lam: np.ndarray) -> np.ndarray:
+    """
+    P(N <= k) dla N ~ Poisson(lam)
+
+    Args:
+        k: Progi całkowite, kształt (grupy, progi); k < 0 daje 0
+        lam: Średnie, kształt (grupy,)
+
+    Returns:
+        np.ndarray: Dystrybuanta w progach, kształt jak k
+    """
+    # Powyżej lam + 12 odchyleń masa rozkładu jest pomijalna (dystrybuanta = 1)
+    top = int(lam.max() + 12 * math.sqrt(lam.max()) + 20)
+    k = np.clip(k, -1, min(MAX_HITS, top)).astype(int)
+    m = np.arange(int(max(k.max(), 0)) + 1)
+    log_lam = np.log(np.maximum(lam, 1e-300))[:, None]
+    cdf = np.cumsum(np.exp(m * log_lam - lam[:, None] - _LOG_FACTORIAL[m]), axis=1)
+    result = np.take_along_axis(cdf, np.maximum(k, 0), axis=1)
+    return np.where(k < 0, 0.0, result)
+
+
+class LanchesterBattle:
+    """
+    Szacowanie przebiegu bitwy bez symulowania pojedynczych strzałów.
+
+    Statki każdej frakcji są grupowane po (atak, obrona, HP). W salwie
+    frakcji każdy żywy strzelec oddaje jeden strzał w losowy żywy wrogi
+    statek, więc każdy wrogi statek dostaje średnio mu = strzały / żywe
+    cele trafień, a liczba trafień ma rozkład Poissona. Statek przeżywa,
+    dopóki suma trafień jest mniejsza niż HP / średnie obrażenia trafienia.
+    To wersja prawa kwadratowego Lanchestera uwzględniająca rozproszenie
+    ognia: uszkodzone statki nadal strzelają z pełną siłą, jak w
+    Battle.execute_full_battle. Frakcje strzelają po kolei w każdej rundzie.
+
+    Koszt: O(statki) na grupowanie i zapis wyniku oraz O(rundy * frakcje *
+    grupy) na przebieg bitwy - niezależnie od liczby statków w grupie.
+    """
+
+    def __init__(self, factions: list[list[Ship]], hostile: np.ndarray):
+        """
+        Args:
+            factions: Statki kolejnych frakcji (w kolejności strzelania)
+            hostile: Macierz [frakcja, frakcja] - czy frakcje walczą ze sobą
+        """
+        self.factions = factions
+        self.hostile = hostile
+
+        # Grupy: unikalne (frakcja, atak, obrona, HP) w kolejności pojawienia się
+        keys: dict[tuple, int] = {}
+        self.group_of = [
+            keys.setdefault((index, s.attack, s.defense, s.current_hp), len(keys))
+            for index, ships in enumerate(factions) for s in ships
+        ]
+        groups = np.array(list(keys), dtype=float).reshape(-1, 4)
+        self.group_faction = groups[:, 0].astype(int)
+        self.group_hp = groups[:, 3]
+        self.group_size = np.bincount(self.group_of, minlength=len(groups)).astype(float)
+        self.damage_table = expected_damage(groups[:, 1][:, None], groups[:, 2][None, :])
+
+        # Oczekiwana liczba trafień i obrażeń na żywy statek grupy
+        self.hits = np.zeros(len(groups))
+        self.damage = np.zeros(len(groups))
+        self.eliminated = np.zeros(len(factions), dtype=bool)
+        self._refresh()
+
+    def _per_hit(self) -> np.ndarray:
+        """Średnie obrażenia jednego trafienia w statek grupy"""
+        return np.divide(self.damage, self.hits, out=np.zeros_like(self.damage), where=self.hits > 0)
+
+    def _refresh(self):
+        """Przelicz oczekiwaną liczbę żywych statków po nowych trafieniach"""
+        per_hit = self._per_hit()
+        needed = np.divide(self.group_hp, per_hit, out=np.full_like(per_hit, np.inf), where=per_hit > 0)
+        capped = np.minimum(needed, MAX_HITS)
+        floor = np.floor(capped)
+        weight = capped - floor
+
+        # Statek przeżywa, gdy trafień jest mniej niż potrzeba (interpolacja między progami)
+        below, at = _poisson_cdf(np.stack([floor - 1, floor], axis=1), self.hits).T
+        survival = np.where(np.isinf(needed) | (self.hits <= 0), 1.0, (1 - weight) * below + weight * at)
+
+        alive = self.group_size * survival
+        self.alive = np.where(self.eliminated[self.group_faction], 0.0, alive)
+        self.needed_hits = needed
+
+    def faction_alive(self) -> np.ndarray:
+        """Oczekiwana liczba żywych statków każdej frakcji"""
+        return np.bincount(self.group_faction, self.alive, minlength=len(self.factions))
+
+    def is_fighting(self) -> bool:
+        """Czy żyją statki co najmniej dwóch wrogich sobie frakcji"""
+        # Frakcje z mniej niż pół statku uznajemy za zniszczone
+        present = self.faction_alive() >= 0.5
+        if (self.eliminated != ~present).any():
+            self.eliminated |= ~present
+            self.alive = np.where(self.eliminated[self.group_faction], 0.0, self.alive)
+        return bool((self.hostile & np.outer(present, present)).any())
+
+    def volley(self, faction: int):
+        """Salwa frakcji w żywe wrogie statki (w VOLLEY_STEPS krokach)"""
+        targets = self.hostile[faction][self.group_faction]
+        for _ in range(VOLLEY_STEPS):
+            shooters = np.where(self.group_faction == faction, self.alive, 0.0)
+            target_alive = np.where(targets, self.alive, 0.0)
+            shots = shooters.sum()
+            if shots <= 0 or target_alive.sum() <= 0:
+                return
+
+            # Trafienia na żywy cel i średnie obrażenia trafienia (mieszanka strzelców)
+            hits = shots / VOLLEY_STEPS / target_alive.sum()
+            per_hit = shooters @ self.damage_table / shots
+            self.hits += np.where(targets, hits, 0.0)
+            self.damage += np.where(targets, hits * per_hit, 0.0)
+            self._refresh()
+
+    def estimate(self, max_rounds: int) -> int:
+        """
+        Przeprowadź bitwę na wartościach oczekiwanych
+
+        Args:
+            max_rounds: Maksymalna liczba rund
+
+        Returns:
+            int: Liczba rund
+        """
+        rounds = 0
+        while rounds < max_rounds and self.is_fighting():
+            rounds += 1
+            for faction in range(len(self.factions)):
+                if self.eliminated[faction]:
+                    continue
+                self.volley(faction)
+                if not self.is_fighting():
+                    break
+        return rounds
+
+    def apply(self, rng: random.Random):
+        """
+        Zapisz wynik w statkach: ocalałe statki losowo w każdej grupie
+
+        Liczba ocalałych grupy to oczekiwana liczba zaokrąglona losowo
+        (w górę z prawdopodobieństwem części ułamkowej). Ocalali tracą
+        oczekiwane obrażenia statku, który przeżył; pozostali mają 0 HP.
+        """
+        alive = self.alive
+        needed = np.ceil(np.minimum(self.needed_hits, MAX_HITS))
+        below, survived = _poisson_cdf(np.stack([needed - 2, needed - 1], axis=1), self.hits).T
+        expected_hits = self.hits * below / np.maximum(survived, 1e-12)
+        survivor_hp = np.maximum(1.0, self.group_hp - expected_hits * self._per_hit())
+
+        members: list[list[Ship]] = [[] for _ in range(len(self.group_hp))]
+        ships = (ship for ships in self.factions for ship in ships)
+        for ship, group in zip(ships, self.group_of):
+            members[group].append(ship)
+
+        for group, group_ships in enumerate(members):
+            count = min(len(group_ships), math.floor(alive[group]) + (rng.random() < alive[group] % 1))
+            hp = float(survivor_hp[group])
+            if count == len(group_ships):
+                survivor_ids = None  # Cała grupa przeżyła
+            else:
+                survivor_ids = {ship.id for ship in rng.sample(group_ships, count)}
+            for ship in group_ships:
+                ship.current_hp = hp if survivor_ids is None or ship.id in survivor_ids else 0.0
+
+    def resolve(self, max_rounds: int, rng: random.Random) -> int:
+        """
+        Oszacuj bitwę i zapisz wynik w statkach
+
+        Returns:
+            int: Liczba rund
+        """
+        rounds = self.estimate(max_rounds)
+        self.apply(rng)
+        return rounds
@@ -0,0 +1,219 @@
+"""
+Rozstrzyganie bitew na tablicach: pętla po listach dla małych bitew,
+wektorowo (NumPy) dla dużych flot
+"""
+import random
+import numpy as np
+from src.models.ship import Ship
+
+# Zakres losowego mnożnika obrażeń (jak w Battle._calculate_damage)
+DAMAGE_FACTOR_MIN = 0.8
+DAMAGE_FACTOR_MAX = 1.2
+
+
+class ScalarBattle:
+    """
+    Bitwa rozgrywana strzał po strzale jak Battle.execute_round, ale na
+    listach HP, ataku i obrony zamiast na polach statków.
+
+    Wynik jest identyczny jak w Battle.execute_round (te same losowania
+    w tej samej kolejności i te same działania na liczbach) - odczyt pól
+    statku z rejestru jest wolniejszy niż dostęp do listy, a mała bitwa
+    czyta je przy każdym strzale i przy każdym liczeniu żywych statków.
+    """
+
+    def __init__(self, factions: list[list[Ship]], hostile: np.ndarray, rng: random.Random):
+        """
+        Args:
+            factions: Statki kolejnych frakcji (w kolejności strzelania)
+            hostile: Macierz [frakcja, frakcja] - czy frakcje walczą ze sobą
+            rng: Generator bitwy (Battle.rng)
+        """
+        self.ships = [ship for ships in factions for ship in ships]
+        self.rng = rng
+        self.hp = [s.current_hp for s in self.ships]
+        self.attack = [s.attack for s in self.ships]
+        self.defense = [s.defense for s in self.ships]
+
+        bounds = np.cumsum([0] + [len(ships) for ships in factions]).tolist()
+        self.sides = [list(range(bounds[i], bounds[i + 1])) for i in range(len(factions))]
+        self.enemies = [
+            [index for j in np.flatnonzero(hostile[i]).tolist() for index in self.sides[j]]
+            for i in range(len(factions))
+        ]
+        self.faction_of = [i for i, side in enumerate(self.sides) for _ in side]
+        self.hostile_pairs = [
+            (a, b) for a in range(len(factions)) for b in range(a + 1, len(factions)) if hostile[a, b]
+        ]
+        self.alive_counts = [sum(1 for index in side if self.hp[index] > 0) for side in self.sides]
+
+    def is_fighting(self) -> bool:
+        """Czy żyją statki co najmniej dwóch wrogich sobie frakcji"""
+        counts = self.alive_counts
+        return any(counts[a] and counts[b] for a, b in self.hostile_pairs)
+
+    def volley(self, shooters: list[int], targets: list[int]):
+        """
+        Salwa: strzelcy po kolei strzelają w losowy żywy cel (Battle._execute_attacks)
+
+        Args:
+            shooters: Indeksy strzelających statków
+            targets: Indeksy statków, które mogą być celem
+        """
+        hp, attack, defense = self.hp, self.attack, self.defense
+        alive_targets = [t for t in targets if hp[t] > 0]
+
+        for shooter in shooters:
+            if not hp[shooter] > 0:
+                continue
+            if not alive_targets:
+                break
+
+            index = self.rng.randrange(len(alive_targets))
+            target = alive_targets[index]
+
+            # Battle._calculate_damage
+            target_defense = defense[target]
+            defense_reduction = min(0.8, target_defense / (target_defense + 50))
+            damage = attack[shooter] * (1 - defense_reduction) * self.rng.uniform(0.8, 1.2)
+            damage = max(1.0, damage)
+
+            # Ship.take_damage
+            hp[target] -= max(0, damage - target_defense)
+            if hp[target] < 0:
+                hp[target] = 0
+            if not hp[target] > 0:
+                alive_targets.pop(index)
+                self.alive_counts[self.faction_of[target]] -= 1
+
+    def resolve(self, max_rounds: int) -> int:
+        """
+        Rozegraj bitwę do końca (jak Battle.execute_round w pętli)
+
+        Args:
+            max_rounds: Maksymalna liczba rund
+
+        Returns:
+            int: Liczba rozegranych rund (HP statków są zaktualizowane)
+        """
+        rounds = 0
+        while rounds < max_rounds and self.is_fighting():
+            rounds += 1
+            for side, enemies in zip(self.sides, self.enemies):
+                self.volley([index for index in side if self.hp[index] > 0], enemies)
+                if not self.is_fighting():
+                    break
+
+        for ship, hp in zip(self.ships, self.hp):
+            ship.current_hp = hp
+        return rounds
+
+
+class ArrayBattle:
+    """
+    Stan bitwy w tablicach: HP, atak i obrona statków wszystkich frakcji.
+
+    Salwa frakcji działa jak w Battle._execute_attacks: każdy żywy strzelec
+    po kolei wybiera losowy żywy cel spośród wrogich frakcji i zadaje
+    obrażenia z Battle._calculate_damage, pomniejszone o obronę celu
+    (Ship.take_damage). Zamiast pętli po statkach wszystkie strzały salwy
+    są losowane naraz; strzały w cele, które zginęły wcześniej w tej samej
+    salwie (skumulowane obrażenia w kolejności strzelców), są losowane
+    ponownie wśród pozostałych celów.
+    """
+
+    def __init__(self, factions: list[list[Ship]], hostile: np.ndarray, rng: np.random.Generator):
+        """
+        Args:
+            factions: Statki kolejnych frakcji (w kolejności strzelania)
+            hostile: Macierz [frakcja, frakcja] - czy frakcje walczą ze sobą
+            rng: Generator liczb losowych
+        """
+        self.ships = [ship for ships in factions for ship in ships]
+        self.hostile = hostile
+        self.rng = rng
+        count = len(self.ships)
+        self.hp = np.fromiter((s.current_hp for s in self.ships), dtype=float, count=count)
+        self.attack = np.fromiter((s.attack for s in self.ships), dtype=float, count=count)
+        self.defense = np.fromiter((s.defense for s in self.ships), dtype=float, count=count)
+        self.reduction = np.minimum(0.8, self.defense / (self.defense + 50))
+
+        # Indeksy statków każdej frakcji i ich wrogów
+        bounds = np.cumsum([0] + [len(ships) for ships in factions])
+        self.sides = [np.arange(bounds[i], bounds[i + 1]) for i in range(len(factions))]
+        self.enemies = [
+            np.concatenate([self.sides[j] for j in np.flatnonzero(hostile[i])] or [np.empty(0, dtype=int)])
+            for i in range(len(factions))
+        ]
+
+    def alive(self, indices: np.ndarray) -> np.ndarray:
+        """Indeksy żywych statków spośród podanych"""
+        return indices[self.hp[indices] > 0]
+
+    def is_fighting(self) -> bool:
+        """Czy żyją statki co najmniej dwóch wrogich sobie frakcji"""
+        alive = np.array([bool((self.hp[side] > 0).any()) for side in self.sides])
+        return bool((self.hostile & np.outer(alive, alive)).any())
+
+    def volley(self, shooters: np.ndarray, targets: np.ndarray):
+        """
+        Salwa: strzelcy (w kolejności) ostrzeliwują żywe cele
+
+        Args:
+            shooters: Indeksy strzelających statków
+            targets: Indeksy statków, które mogą być celem
+        """
+        pending = shooters
+        while pending.size:
+            alive_targets = self.alive(targets)
+            if not alive_targets.size:
+                return
+
+            chosen = alive_targets[self.rng.integers(alive_targets.size, size=pending.size)]
+            factor = self.rng.uniform(DAMAGE_FACTOR_MIN, DAMAGE_FACTOR_MAX, size=pending.size)
+            damage = np.maximum(1.0, self.attack[pending] * (1 - self.reduction[chosen]) * factor)
+            damage = np.maximum(0.0, damage - self.defense[chosen])
+
+            # Obrażenia zadane celowi przez wcześniejsze strzały tej salwy
+            order = np.argsort(chosen, kind="stable")
+            sorted_targets = chosen[order]
+            cumulative = np.cumsum(damage[order])
+            group_start = np.flatnonzero(np.r_[True, sorted_targets[1:] != sorted_targets[:-1]])
+            group_offset = np.repeat(
+                cumulative[group_start] - damage[order][group_start],
+                np.diff(np.r_[group_start, sorted_targets.size])
+            )
+            before = np.empty_like(damage)
+            before[order] = cumulative - damage[order] - group_offset
+
+            # Strzał trafia tylko jeśli cel jeszcze żył; pozostałe losujemy ponownie
+            hits = before < self.hp[chosen]
+            np.subtract.at(self.hp, chosen[hits], damage[hits])
+            np.maximum(self.hp, 0.0, out=self.hp)
+            pending = pending[~hits]
+
+    def resolve(self, max_rounds: int) -> int:
+        """
+        Rozegraj bitwę do końca (jak Battle.execute_round w pętli)
+
+        Args:
+            max_rounds: Maksymalna liczba rund
+
+        Returns:
+            int: Liczba rozegranych rund (HP statków są zaktualizowane)
+        """
+        rounds = 0
+        while rounds < max_rounds and self.is_fighting():
+            rounds += 1
+            for side, enemies in zip(self.sides, self.enemies):
+                self.volley(self.alive(side), enemies)
+                if not self.is_fighting():
+                    break
+
+        self.write_back()
+        return rounds
+
+    def write_back(self):
+        """Zapisz HP z tablic do obiektów statków"""
+        for ship, hp in zip(self.ships, self.hp.tolist()):
+            ship.current_hp = hp
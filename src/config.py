@@ -46,11 +46,19 @@ class Colors:
     # Mgła wojny
     FOG_OF_WAR = (80, 80, 100)  # Jaśniejszy szaro-niebieski, lepiej widoczny
 
+    # Hiperlinie
+    HYPERLANE = (45, 55, 85)
+
 # === GALAKTYKA ===
 GALAXY_WIDTH = 3000  # Szerokość mapy galaktyki w pikselach
 GALAXY_HEIGHT = 2000  # Wysokość mapy galaktyki
 NUM_STAR_SYSTEMS = 40  # Liczba systemów gwiezdnych
 MIN_SYSTEM_DISTANCE = 150  # Minimalna odległość między systemami
+GALAXY_GENERATION_MODE = "random"  # "random" (losowanie z odrzucaniem) lub "poisson" (Poisson-disk)
+GALAXY_MARGIN = 100  # Odstęp systemów od krawędzi mapy
+GALAXY_HYPERLANES = False  # Sieć hiperlinii (loty po trasach zamiast w linii prostej)
+HYPERLANE_NEIGHBOURS = 8  # Ilu najbliższych sąsiadów rozważać jako hiperlinie systemu
+PATH_CACHE_SIZE = 4096  # Ile tras pamięta router hiperlinii (LRU)
 BACKGROUND_STARS = 200  # Liczba dekoracyjnych gwiazdek w tle
 
 # === SYSTEMY GWIEZDNE ===
@@ -109,6 +117,9 @@ SHIP_COST = {
     ShipType.TRANSPORT: 70,
 }
 
+# Okręty wojenne AI dołączają po zbudowaniu do floty garnizonu w systemie produkcji
+GARRISON_SHIP_TYPES = (ShipType.FIGHTER, ShipType.CRUISER, ShipType.BATTLESHIP)
+
 # === KAMERA ===
 CAMERA_MOVE_SPEED = 10
 CAMERA_ZOOM_MIN = 0.5
@@ -122,6 +133,23 @@ STARTING_SHIPS = {
 }
 
 NUM_AI_EMPIRES = 3  # Liczba imperiów AI
+VICTORY_PLANET_SHARE = 0.25  # Udział planet galaktyki dający zwycięstwo przez dominację
+AI_SCOUT_ASSIGNMENT = "batched"  # Przydział celów scoutom AI: "batched" (najkrótsze pary najpierw) lub "nearest" (scouty po kolei)
+AI_TURN_BUDGET_MS = None  # Czas na decyzje wszystkich AI w turze (ms, None = bez limitu; gra nie jest wtedy powtarzalna)
+PARALLEL_AI_WORKERS = 0  # Procesy do równoległych decyzji AI (0 = sekwencyjnie w głównym procesie)
+PARALLEL_AI_MIN = 4  # Minimalna liczba imperiów AI, od której używamy puli procesów
+
+# === WALKA ===
+PARALLEL_BATTLE_WORKERS = 0  # Procesy do równoległego rozstrzygania bitew (0 = sekwencyjnie)
+PARALLEL_BATTLE_MIN = 4  # Minimalna liczba bitew w turze, od której używamy puli procesów
+AI_BATTLE_RESOLUTION = "lanchester"  # Bitwy, których gracz nie widzi: "exact" lub "lanchester" (szybkie szacowanie)
+LANCHESTER_MIN_SHIPS = 200  # Szacowanie Lanchestera od tylu statków (rozmiar sprawdzany w test_lanchester_matches_exact)
+BATTLE_VISIBILITY_RANGE = 75  # Gracz widzi bitwy w tej odległości od odkrytych przez siebie systemów
+BATTLE_HISTORY_SIZE = 1000  # Ile ostatnich bitew pamięta historia (skrócone zapisy)
+
+# === PROFILER ===
+PROFILE_REPORT_INTERVAL = 10  # Co ile tur wypisywać podsumowanie kroczące (F3)
+PROFILE_EXPORT_PATH = "turn_profile"  # Plik wynikowy bez rozszerzenia (.json/.csv)
 
 # === UI ===
 PANEL_WIDTH = 300
@@ -221,6 +249,13 @@ NON_COLONIZABLE_TYPES = [
     PlanetType.GAS_GIANT,   # Gazowy olbrzym - niemożliwe do skolonizowania
 ]
 
+# Ocena planet przez AI przy wyborze celów kolonizacji (punkty)
+COLONY_SCORE_SIZE = 1.0          # Za każdy punkt rozmiaru (1-10)
+COLONY_SCORE_RICHNESS = 4.0      # Za bogactwo minerałów (0.5-2.0)
+COLONY_SCORE_RARE_METALS = 3.0   # Złoża metali rzadkich
+COLONY_SCORE_CRYSTALS = 5.0      # Kryształy
+COLONY_SCORE_DISTANCE = 0.01     # Kara za jednostkę odległości od najbliższego wolnego statku kolonistów
+
 # === BADANIA ===
 from dataclasses import dataclass
 from typing import Optional
@@ -7,26 +7,25 @@ import math
 from typing import Optional
 from src.models.galaxy import Galaxy, StarSystem
 from src.models.empire import Empire
-from src.models.ship import Ship, ShipType
-from src.models.planet import Planet, Building
+from src.models.ship import Ship, ShipType, Fleet
+from src.models.ship_registry import ShipRegistry
 from src.ui.renderer import Renderer
 from src.ui.widgets import Panel, Button, draw_text
 from src.ui.screens.planet_screen import PlanetScreen
 from src.ui.screens.research_screen import ResearchScreen
-from src.combat import CombatManager, CombatEffectsManager
+from src.combat import CombatManager, CombatEffectsManager, BattleResult
 from src.ai import AIController
+from src.game_logic import Simulation
 from src.config import (
     WINDOW_WIDTH, WINDOW_HEIGHT, FPS, WINDOW_TITLE,
-    Colors, NUM_AI_EMPIRES, STARTING_SHIPS, PANEL_WIDTH,
-    PANEL_PADDING, COLONIZABLE_PLANET_TYPES,
-    POPULATION_FOOD_UPKEEP, POPULATION_ENERGY_UPKEEP,
-    DEFICIT_EFFECTS, TECHNOLOGIES, BUILDINGS
+    Colors, PANEL_WIDTH, PANEL_PADDING,
+    TECHNOLOGIES, PROFILE_REPORT_INTERVAL, PROFILE_EXPORT_PATH
 )
 
 
 class Game:
     """
-    Główna klasa gry - zarządza stanem gry i pętlą główną
+    Główna klasa gry - widok (pygame) nad headless symulacją
     """
 
     def __init__(self):
@@ -39,25 +38,16 @@ class Game:
         # Renderer
         self.renderer = Renderer(self.screen)
 
-        # Stan gry
-        self.galaxy: Optional[Galaxy] = None
-        self.empires: list[Empire] = []
-        self.player_empire: Optional[Empire] = None
-        self.ships: list[Ship] = []
-        self.current_turn = 1
-        self.next_ship_id = 0
+        # Stan gry (galaktyka, imperia, statki, walka, AI)
+        self.simulation = Simulation()
 
-        # Combat system
-        self.combat_manager = CombatManager()
+        # Efekty wizualne walki
         self.combat_effects = CombatEffectsManager()
-        self.last_turn_battles = []  # Bitwy z ostatniej tury (do wyświetlenia)
-
-        # AI system
-        self.ai_controllers: dict[int, AIController] = {}  # empire_id -> AIController
 
         # UI
         self.selected_system: Optional[StarSystem] = None
         self.selected_ships: list[Ship] = []  # Wybrane statki
+        self.selected_fleets: list[Fleet] = []  # Wybrane floty
         self.selected_planet = None  # Wybrana planeta (dla ekranu szczegółów)
         self.planet_screen: Optional[PlanetScreen] = None  # Ekran szczegółów planety
         self.research_screen: Optional[ResearchScreen] = None  # Ekran badań
@@ -70,6 +60,53 @@ class Game:
         self.last_mouse_pos = (0, 0)
         self.right_click_start_pos = None  # Pozycja początku prawego kliknięcia
 
+    # === Widok na stan symulacji ===
+
+    @property
+    def galaxy(self) -> Optional[Galaxy]:
+        """Galaktyka symulacji"""
+        return self.simulation.galaxy
+
+    @property
+    def empires(self) -> list[Empire]:
+        """Wszystkie imperia"""
+        return self.simulation.empires
+
+    @property
+    def player_empire(self) -> Optional[Empire]:
+        """Imperium gracza"""
+        return self.simulation.player_empire
+
+    @property
+    def ships(self) -> ShipRegistry:
+        """Wszystkie statki w grze"""
+        return self.simulation.ships
+
+    @property
+    def fleets(self) -> dict[int, Fleet]:
+        """Floty w grze (fleet_id -> Fleet)"""
+        return self.simulation.fleets
+
+    @property
+    def current_turn(self) -> int:
+        """Numer bieżącej tury"""
+        return self.simulation.current_turn
+
+    @property
+    def combat_manager(self) -> CombatManager:
+        """Manager walki symulacji"""
+        return self.simulation.combat_manager
+
+    @property
+    def ai_controllers(self) -> dict[int, AIController]:
+        """Kontrolery AI (empire_id -> AIController)"""
+        return self.simulation.ai_controllers
+
+    @property
+    def last_turn_battles(self) -> list[BattleResult]:
+        """Bitwy z ostatniej tury (do wyświetlenia)"""
+        return self.simulation.last_turn_battles
+
     def setup_ui(self):
         """Przygotuj UI"""
         # Panel informacyjny po prawej stronie
@@ -93,49 +130,7 @@ class Game:
 
     def initialize_new_game(self):
         """Rozpocznij nową grę"""
-        print("Generowanie galaktyki...")
-        self.galaxy = Galaxy.generate()
-
-        print("Tworzenie imperiów...")
-        # Stwórz gracza
-        self.player_empire = Empire.create_player("Ziemia")
-        self.empires.append(self.player_empire)
-
-        # Stwórz AI
-        for i in range(NUM_AI_EMPIRES):
-            ai_empire = Empire.create_ai(i + 1)
-            self.empires.append(ai_empire)
-
-        print("Przydzielanie systemów macierzystych...")
-        # Przydziel systemy macierzyste
-        for i, empire in enumerate(self.empires):
-            if i < len(self.galaxy.systems):
-                home_system = self.galaxy.systems[i]
-                empire.home_system_id = home_system.id
-                empire.explore_system(home_system.id)
-                home_system.explore(empire.id)
-
-                # Skolonizuj pierwszą ODPOWIEDNIĄ planetę (NIE gazowy olbrzym!)
-                # Znajdź pierwszą planetę która nadaje się do kolonizacji
-                colonizable_planets = [p for p in home_system.planets
-                                       if p.planet_type in COLONIZABLE_PLANET_TYPES]
-
-                if colonizable_planets:
-                    home_planet = colonizable_planets[0]
-                    home_planet.colonize(empire.id, initial_population=50.0)
-                    if empire.is_player:
-                        print(f"✓ Start: {home_planet.name} ({home_planet.planet_type.value})")
-                elif home_system.planets:
-                    # Ostatnia deska ratunku - weź pierwszą planetę i zmień jej typ
-                    home_planet = home_system.planets[0]
-                    from src.config import PlanetType
-                    home_planet.planet_type = PlanetType.EARTH_LIKE  # Wymuś ziemiopodobną
-                    home_planet.colonize(empire.id, initial_population=50.0)
-                    if empire.is_player:
-                        print(f"⚠️ System macierzysty nie miał dobrych planet - przekształcono pierwszą")
-
-                # Stwórz początkowe statki
-                self._create_starting_ships(empire, home_system)
+        self.simulation.initialize_new_game()
 
         # Wycentruj kamerę na systemie gracza
         if self.player_empire.home_system_id is not None:
@@ -143,129 +138,13 @@ class Game:
             if home_system:
                 self.renderer.camera.center_on(home_system.x, home_system.y)
 
-        # Ustaw relacje dyplomatyczne (wszyscy w stanie wojny)
-        print("Ustawianie relacji dyplomatycznych...")
-        for i, emp1 in enumerate(self.empires):
-            for j, emp2 in enumerate(self.empires):
-                if i != j:
-                    emp1.set_relation(emp2.id, "war")
-
-        # Inicjalizuj AI controllery
-        print("Inicjalizacja AI...")
-        for empire in self.empires:
-            if not empire.is_player:
-                self.ai_controllers[empire.id] = AIController(empire, self.galaxy)
-                print(f"  AI {empire.name} ({empire.ai_personality})")
-
-        # TESTOWE: Dodaj pirackiego bossa i statek bojowy dla gracza
-        self._create_test_combat_scenario()
-
-        print("Gra gotowa!")
-
-    def _create_test_combat_scenario(self):
-        """
-        TESTOWE: Stwórz scenariusz testowy do sprawdzenia combat
-        - Piracki Cruiser w pobliżu systemu gracza
-        - Bojowy Cruiser dla gracza
-        """
-        if not self.player_empire:
-            print("⚠️ UWAGA: Nie można stworzyć test scenario - brak player_empire")
-            return
-
-        if self.player_empire.home_system_id is None:
-            print("⚠️ UWAGA: Nie można stworzyć test scenario - brak home_system_id")
-            return
-
-        player_home = self.galaxy.find_system_by_id(self.player_empire.home_system_id)
-        if not player_home:
-            print("⚠️ UWAGA: Nie można stworzyć test scenario - nie znaleziono home system")
-            return
-
-        print("\n" + "="*60)
-        print("🏴‍☠️ TESTOWY SCENARIUSZ COMBAT - POCZĄTEK")
-        print("="*60)
-
-        # 1. Stwórz pirackie imperium (bez AI controllera, więc piraci stoją w miejscu)
-        from src.models.empire import Empire
-        pirate_empire = Empire(
-            id=999,  # Specjalne ID dla piratów
-            name="🏴‍☠️ Piraci",
-            color=(80, 80, 80),
-            is_player=False
-        )
-        self.empires.append(pirate_empire)
-
-        # Ustaw piratów w stanie wojny z graczem
-        pirate_empire.set_relation(self.player_empire.id, "war")
-        self.player_empire.set_relation(pirate_empire.id, "war")
-
-        # 2. Stwórz pirackiego Cruisera BLISKO systemu gracza (dystans ~70 jednostek)
-        # Zmniejszony z 150 na 70 żeby był widoczny
-        pirate_x = player_home.x + 60
-        pirate_y = player_home.y + 40
-
-        pirate_cruiser = Ship.create_ship(
-            ship_id=self.next_ship_id,
-            ship_type=ShipType.CRUISER,
-            owner_id=pirate_empire.id,
-            x=pirate_x,
-            y=pirate_y
-        )
-        pirate_cruiser.name = "🏴‍☠️ Piracki Boss"
-        self.ships.append(pirate_cruiser)
-        self.next_ship_id += 1
-
-        print(f"  • Piracki Cruiser ({pirate_cruiser.name}) @ ({int(pirate_x)}, {int(pirate_y)})")
-        print(f"    HP: {pirate_cruiser.max_hp}, ATK: {pirate_cruiser.attack}, DEF: {pirate_cruiser.defense}")
-
-        # Oblicz rzeczywisty dystans
-        dist = ((pirate_x - player_home.x)**2 + (pirate_y - player_home.y)**2)**0.5
-        print(f"    Dystans od Twojego systemu: {int(dist)} jednostek")
-
-        # 3. Dodaj bojowy Cruiser dla gracza w jego systemie
-        player_cruiser = Ship.create_ship(
-            ship_id=self.next_ship_id,
-            ship_type=ShipType.CRUISER,
-            owner_id=self.player_empire.id,
-            x=player_home.x,
-            y=player_home.y
-        )
-        player_cruiser.name = "⚔️ Obrońca"
-        self.ships.append(player_cruiser)
-        self.next_ship_id += 1
-
-        print(f"  • Twój Cruiser ({player_cruiser.name}) @ ({int(player_home.x)}, {int(player_home.y)})")
-        print(f"    HP: {player_cruiser.max_hp}, ATK: {player_cruiser.attack}, DEF: {player_cruiser.defense}")
-        print(f"\n  💡 INSTRUKCJA:")
-        print(f"     1. Znajdź swojego Cruisera '⚔️ Obrońca' w swoim systemie domowym")
-        print(f"     2. Kliknij PPM aby wysłać go do pozycji pirata: (~{int(pirate_x)}, ~{int(pirate_y)})")
-        print(f"     3. Gdy będą w zasięgu 100 jednostek, bitwa rozpocznie się automatycznie!")
-        print(f"     4. Zobaczysz efekty lasery i eksplozje podczas walki!")
-        print("="*60)
-        print("🏴‍☠️ TESTOWY SCENARIUSZ COMBAT - KONIEC")
-        print("="*60 + "\n")
-
-    def _create_starting_ships(self, empire: Empire, system: StarSystem):
-        """Stwórz początkowe statki dla imperium"""
-        for ship_type, count in STARTING_SHIPS.items():
-            for _ in range(count):
-                ship = Ship.create_ship(
-                    ship_id=self.next_ship_id,
-                    ship_type=ship_type,
-                    owner_id=empire.id,
-                    x=system.x,
-                    y=system.y
-                )
-                self.ships.append(ship)
-                self.next_ship_id += 1
-
     def run(self):
         """Główna pętla gry"""
         self.running = True
         self.initialize_new_game()
 
         # Inicjalizuj zasoby na starcie
-        self._update_empire_resources()
+        self.simulation.update_empire_resources()
 
         while self.running:
             dt = self.clock.tick(FPS) / 1000.0  # Delta time w sekundach
@@ -273,6 +152,7 @@ class Game:
             self.update(dt)
             self.render(dt)  # Przekaż dt do renderera (dla animacji)
 
+        self.simulation.close()
         pygame.quit()
 
     def handle_events(self):
@@ -364,10 +244,20 @@ class Game:
         elif key == pygame.K_c:
             self._handle_colonize_command()
 
+        # F - połącz wybrane statki we flotę, G - rozwiąż wybrane floty
+        elif key == pygame.K_f:
+            self._handle_form_fleet_command()
+        elif key == pygame.K_g:
+            self._handle_disband_fleet_command()
+
         # H - toggle pomoc/instrukcje
         elif key == pygame.K_h:
             self.show_help = not self.show_help
 
+        # F3 - profiler tur (przełącz)
+        elif key == pygame.K_F3:
+            self._toggle_profiler()
+
         # R - otwórz ekran badań
         elif key == pygame.K_r:
             if not self.research_screen and not self.planet_screen:
@@ -385,6 +275,22 @@ class Game:
             else:
                 self.running = False
 
+    def _toggle_profiler(self):
+        """Włącz/wyłącz profiler tur; przy wyłączeniu zapisz pomiary do plików"""
+        profiler = self.simulation.profiler
+        if not profiler.enabled:
+            profiler.reset()
+            profiler.enable(track_allocations=True)
+            print("Profiler tur włączony (F3 aby wyłączyć)")
+            return
+
+        profiler.disable()
+        profiler.print_summary()
+        if profiler.traces:
+            profiler.export_json(PROFILE_EXPORT_PATH + ".json")
+            profiler.export_csv(PROFILE_EXPORT_PATH + ".csv")
+            print(f"Zapisano pomiary: {PROFILE_EXPORT_PATH}.json/.csv")
+
     def _open_planet_screen(self, planet_index: int = 0):
         """Otwórz ekran szczegółów planety"""
         if not self.selected_system:
@@ -435,7 +341,23 @@ class Game:
         # Kliknięcie w mapę
         world_x, world_y = self.renderer.camera.screen_to_world(mouse_pos[0], mouse_pos[1])
 
-        # Najpierw sprawdź czy kliknięto statek gracza
+        # Najpierw sprawdź czy kliknięto flotę gracza (flota to jedna jednostka)
+        fleet = self._find_fleet_at(world_x, world_y, self.player_empire.id)
+        if fleet:
+            keys = pygame.key.get_pressed()
+
+            # Shift+Click = dodaj/usuń flotę z wyboru
+            if keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]:
+                if fleet in self.selected_fleets:
+                    self.selected_fleets.remove(fleet)
+                else:
+                    self.selected_fleets.append(fleet)
+            else:
+                self.selected_fleets = [fleet]
+                self.selected_ships = []
+            return
+
+        # Potem sprawdź czy kliknięto statek gracza
         ships_at_location = self._find_all_ships_at(world_x, world_y, self.player_empire.id)
 
         if ships_at_location:
@@ -471,6 +393,7 @@ class Game:
             else:
                 # Normalny click - wybierz pierwszy statek
                 self.selected_ships = [ships_at_location[0]]
+                self.selected_fleets = []
             return
 
         # Jeśli nie kliknięto statku, sprawdź systemy
@@ -479,14 +402,26 @@ class Game:
         if system and system.is_explored_by(self.player_empire.id):
             self.selected_system = system
             self.selected_ships = []  # Odznacz statki
+            self.selected_fleets = []
         else:
             self.selected_system = None
             self.selected_ships = []
+            self.selected_fleets = []
+
+    def _find_fleet_at(self, world_x: float, world_y: float, empire_id: int, tolerance: float = 15) -> Optional[Fleet]:
+        """Znajdź flotę imperium w danej pozycji"""
+        for fleet in self.fleets.values():
+            if fleet.owner_id != empire_id:
+                continue
+            distance = math.sqrt((fleet.x - world_x)**2 + (fleet.y - world_y)**2)
+            if distance <= tolerance / self.renderer.camera.zoom:
+                return fleet
+        return None
 
     def _find_ship_at(self, world_x: float, world_y: float, empire_id: int, tolerance: float = 15) -> Optional[Ship]:
-        """Znajdź statek w danej pozycji"""
+        """Znajdź statek (spoza flot) w danej pozycji"""
         for ship in self.ships:
-            if ship.owner_id != empire_id:
+            if ship.owner_id != empire_id or ship.fleet_id is not None:
                 continue
             distance = math.sqrt((ship.x - world_x)**2 + (ship.y - world_y)**2)
             if distance <= tolerance / self.renderer.camera.zoom:
@@ -494,53 +429,16 @@ class Game:
         return None
 
     def _find_all_ships_at(self, world_x: float, world_y: float, empire_id: int, tolerance: float = 15) -> list[Ship]:
-        """Znajdź WSZYSTKIE statki w danej pozycji (dla nakładających się)"""
+        """Znajdź WSZYSTKIE statki (spoza flot) w danej pozycji (dla nakładających się)"""
         found_ships = []
         for ship in self.ships:
-            if ship.owner_id != empire_id:
+            if ship.owner_id != empire_id or ship.fleet_id is not None:
                 continue
             distance = math.sqrt((ship.x - world_x)**2 + (ship.y - world_y)**2)
             if distance <= tolerance / self.renderer.camera.zoom:
                 found_ships.append(ship)
         return found_ships
 
-    def _try_colonize(self, colony_ship: Ship) -> bool:
-        """Spróbuj skolonizować planetę statkiem kolonistów. Zwraca True jeśli się powiodło."""
-        # Znajdź system docelowy
-        target_system = self.galaxy.find_system_by_id(colony_ship.target_system_id)
-        if not target_system:
-            return False
-
-        # Sprawdź czy system jest odkryty
-        if not target_system.is_explored_by(colony_ship.owner_id):
-            target_system.explore(colony_ship.owner_id)
-
-        # Znajdź KOLONIZOWALNE planety (filtrowane po typie - NIE gazowe olbrzymy!)
-        colonizable_planets = target_system.get_colonizable_planets(COLONIZABLE_PLANET_TYPES)
-
-        if not colonizable_planets:
-            # Sprawdź czy są jakieś wolne planety (dla komunikatu)
-            free_planets = target_system.get_free_planets()
-            if free_planets:
-                planet_types = ", ".join([p.planet_type.value for p in free_planets])
-                print(f"⚠ {target_system.name}: Brak planet nadających się do kolonizacji!")
-                print(f"  Dostępne planety: {planet_types}")
-                print(f"  (Wymagana technologia do kolonizacji tych typów)")
-            else:
-                print(f"⚠ {target_system.name}: Wszystkie planety już skolonizowane")
-
-            colony_ship.target_system_id = None  # Wyczyść cel
-            return False
-
-        # Skolonizuj pierwszą NADAJĄCĄ SIĘ planetę
-        planet = colonizable_planets[0]
-        planet.colonize(colony_ship.owner_id, initial_population=10.0)
-
-        print(f"✓ {planet.name} ({planet.planet_type.value}) skolonizowana przez {self.empires[colony_ship.owner_id].name}!")
-
-        # Zwróć True - statek zostanie usunięty przez wywołującego
-        return True
-
     def _handle_colonize_command(self):
         """Obsługa komendy kolonizacji (klawisz C)"""
         # Sprawdź czy wybrano dokładnie jeden statek
@@ -576,7 +474,7 @@ class Game:
 
         # Spróbuj skolonizować
         print(f"\n🌍 Próba kolonizacji w systemie {target_system.name}...")
-        result = self._try_colonize(colony_ship)
+        result = self.simulation.try_colonize(colony_ship)
 
         if result:
             # Kolonizacja udana - usuń statek
@@ -584,10 +482,41 @@ class Game:
             self.selected_ships.remove(colony_ship)
             print("  Statek kolonistów został wykorzystany do kolonizacji")
 
+    def _handle_form_fleet_command(self):
+        """Obsługa komendy tworzenia floty (klawisz F) z wybranych statków i flot"""
+        ships = [s for fleet in self.selected_fleets for s in fleet.ships]
+        ships += [s for s in self.selected_ships if s.ship_type != ShipType.COLONY_SHIP]
+        if len(ships) < 2:
+            print("⚠ Wybierz co najmniej dwa statki (bez statków kolonistów) aby utworzyć flotę")
+            return
+
+        # Flota to jedna pozycja - statki muszą być w jednym miejscu
+        x, y = ships[0].x, ships[0].y
+        if any(abs(s.x - x) > 50 or abs(s.y - y) > 50 for s in ships):
+            print("⚠ Statki muszą być w jednym miejscu aby utworzyć flotę")
+            return
+
+        fleet = self.simulation.create_fleet(ships)
+        self.selected_ships = []
+        self.selected_fleets = [fleet]
+        print(f"⚓ Utworzono {fleet.name} ({len(fleet)} statków)")
+
+    def _handle_disband_fleet_command(self):
+        """Obsługa komendy rozwiązania floty (klawisz G) - statki zostają wybrane"""
+        if not self.selected_fleets:
+            return
+
+        ships = [s for fleet in self.selected_fleets for s in fleet.ships]
+        for fleet in self.selected_fleets:
+            self.simulation.disband_fleet(fleet)
+            print(f"{fleet.name} rozwiązana")
+        self.selected_fleets = []
+        self.selected_ships = ships
+
     def _handle_right_click(self, mouse_pos):
         """Obsługa prawego kliknięcia - wydawanie rozkazów"""
-        # Sprawdź czy są wybrane statki
-        if not self.selected_ships:
+        # Sprawdź czy są wybrane statki lub floty
+        if not self.selected_ships and not self.selected_fleets:
             return
 
         # Sprawdź czy kliknięto w panel UI
@@ -601,12 +530,18 @@ class Game:
         system = self.galaxy.get_system_at(world_x, world_y, tolerance=30/self.renderer.camera.zoom)
 
         if system:
-            # Wyślij statki do systemu
+            # Wyślij floty i statki do systemu (po hiperliniach, jeśli galaktyka je ma)
+            for fleet in self.selected_fleets:
+                if self.galaxy.order_move(fleet, system):
+                    print(f"{fleet.name} ({len(fleet)} statków) wysłana do {system.name}")
             for ship in self.selected_ships:
-                ship.move_to(system.x, system.y, system.id)
-                print(f"{ship.name} wysłany do {system.name}")
+                if self.galaxy.order_move(ship, system):
+                    print(f"{ship.name} wysłany do {system.name}")
         else:
-            # Wyślij statki do punktu w przestrzeni
+            # Wyślij floty i statki do punktu w przestrzeni
+            for fleet in self.selected_fleets:
+                fleet.move_to(world_x, world_y)
+                print(f"{fleet.name} wysłana do pozycji ({int(world_x)}, {int(world_y)})")
             for ship in self.selected_ships:
                 ship.move_to(world_x, world_y)
                 print(f"{ship.name} wysłany do pozycji ({int(world_x)}, {int(world_y)})")
@@ -621,268 +556,62 @@ class Game:
 
     def end_turn(self):
         """Zakończ turę"""
-        self.current_turn += 1
-        print(f"\n=== TURA {self.current_turn} ===")
+        combat_stats = self.simulation.end_turn()
 
-        # 1. Ruch statków (turowy)
-        ships_to_remove = []
-        explored_systems = set()
+        # Podsumowanie kroczące profilera co PROFILE_REPORT_INTERVAL tur
+        profiler = self.simulation.profiler
+        if profiler.enabled and len(profiler.traces) % PROFILE_REPORT_INTERVAL == 0:
+            profiler.print_summary()
 
-        for ship in self.ships:
-            arrived = ship.move_one_turn()
-
-            # Sprawdź eksplorację systemów (tylko jeśli dotarł)
-            if arrived and ship.target_system_id is not None:
-                if ship.target_system_id not in explored_systems:
-                    target_system = self.galaxy.find_system_by_id(ship.target_system_id)
-                    if target_system and not target_system.is_explored_by(ship.owner_id):
-                        target_system.explore(ship.owner_id)
-                        empire = next((e for e in self.empires if e.id == ship.owner_id), None)
-                        if empire:
-                            empire.explore_system(ship.target_system_id)
-                        explored_systems.add(ship.target_system_id)
-                        print(f"✓ {target_system.name} odkryty!")
-
-                # Auto-kolonizacja dla AI (gracz musi nacisnąć 'C')
-                if ship.ship_type == ShipType.COLONY_SHIP and ship.owner_id != self.player_empire.id:
-                    # AI colony ship - próbuj skolonizować automatycznie
-                    colonized = self._try_colonize(ship)
-                    if colonized:
-                        ships_to_remove.append(ship)  # Usuń statek kolonistów po kolonizacji
-                # Dla statków innych niż kolonizacyjne wyczyść cel po dotarciu
-                elif ship.ship_type != ShipType.COLONY_SHIP:
-                    ship.target_system_id = None
-
-        # Usuń statki po iteracji
-        for ship in ships_to_remove:
-            self.ships.remove(ship)
-            if ship in self.selected_ships:
-                self.selected_ships.remove(ship)
-
-        # 1.5. Przetwarzanie bitew (combat system)
-        combat_stats = self.combat_manager.process_combat_turn(self.ships, self.empires)
-
-        # Zapisz bitwy dla UI
-        self.last_turn_battles = combat_stats['results']
-
-        # Wyświetl informacje o bitwach
+        # Odznacz statki które zniknęły z gry (kolonizacja, zniszczenie)
+        if self.selected_ships:
+            self.selected_ships = [s for s in self.selected_ships if s in self.ships]
+        if self.selected_fleets:
+            self.selected_fleets = [f for f in self.selected_fleets if self.fleets.get(f.id) is f]
+
+        # Generuj efekty wizualne dla każdej bitwy
         if combat_stats['battles_resolved'] > 0:
-            print(f"⚔️ Rozwiązano {combat_stats['battles_resolved']} bitew!")
-            print(f"   Zniszczono {combat_stats['total_ships_destroyed']} statków")
-
-            # Generuj efekty wizualne dla każdej bitwy
-            for result in combat_stats['results']:
-                # Dodaj eksplozje dla zniszczonych statków
-                # (używamy pozycji ocalałych statków jako aproksymacji pola bitwy)
-                all_survivors = result.attacker_survivors + result.defender_survivors
-
-                if all_survivors:
-                    # Pozycja bitwy (średnia pozycja ocalałych)
-                    avg_x = sum(s.x for s in all_survivors) / len(all_survivors)
-                    avg_y = sum(s.y for s in all_survivors) / len(all_survivors)
-                else:
-                    # Jeśli wszyscy zginęli, użyj pozycji z pierwszego atakującego
-                    # (nie mamy już dostępu do statków, więc używamy domyślnej)
-                    avg_x = 0
-                    avg_y = 0
-
-                # Dodaj eksplozje dla zniszczonych statków
-                total_destroyed = result.attacker_ships_destroyed + result.defender_ships_destroyed
-                for i in range(total_destroyed):
-                    # Losowa pozycja wokół centrum bitwy
-                    offset_x = random.uniform(-50, 50)
-                    offset_y = random.uniform(-50, 50)
-                    self.combat_effects.add_explosion(avg_x + offset_x, avg_y + offset_y, size=40)
-
-                # Dodaj lasery między statkami (symulacja ataków)
-                # Połącz atakujących z obrońcami
-                attackers = result.attacker_survivors[:3]  # Max 3 dla wydajności
-                defenders = result.defender_survivors[:3]
-
-                for attacker in attackers:
-                    if defenders:
-                        target = random.choice(defenders)
-                        # Kolor lasera zależy od imperium
-                        laser_color = next((e.color for e in self.empires if e.id == attacker.owner_id), (100, 200, 255))
-                        self.combat_effects.add_laser_beam(
-                            attacker.x, attacker.y,
-                            target.x, target.y,
-                            color=laser_color
-                        )
-
-            # Wyświetl szczegóły bitew dla gracza
-            for result in combat_stats['results']:
-                if result.attacker_empire_id == self.player_empire.id or result.defender_empire_id == self.player_empire.id:
-                    attacker_name = next((e.name for e in self.empires if e.id == result.attacker_empire_id), "Nieznany")
-                    defender_name = next((e.name for e in self.empires if e.id == result.defender_empire_id), "Nieznany")
-
-                    if result.attacker_won:
-                        winner = attacker_name
-                        loser = defender_name
-                    else:
-                        winner = defender_name
-                        loser = attacker_name
-
-                    print(f"   🏆 {winner} pokonał {loser} ({result.rounds} rund)")
-                    print(f"      Straty: {result.attacker_ships_destroyed} vs {result.defender_ships_destroyed}")
-
-        # 1.7. AI podejmuje decyzje
-        for empire_id, ai_controller in self.ai_controllers.items():
-            ai_controller.make_turn_decisions(self.ships)
-
-        # 2. Aktualizacja zasobów imperii (przed wzrostem populacji!)
-        self._update_empire_resources()
-
-        # 3. Aplikuj efekty deficytu (głód, blackout)
-        self._apply_deficit_effects()
-
-        # 4. Przetwarzanie badań
-        for empire in self.empires:
-            if empire.current_research and empire.total_science > 0:
-                completed = empire.add_research_points(empire.total_science)
-                if completed:
-                    tech_id = list(empire.researched_technologies)[-1]  # Ostatnio odkryta
-                    tech = TECHNOLOGIES.get(tech_id)
-                    if tech and empire.is_player:
-                        print(f"🔬 Odkryto technologię: {tech.name}!")
-                        print(f"   {tech.description}")
-                        if tech.unlocks_buildings:
-                            buildings_names = [BUILDINGS[bid].name for bid in tech.unlocks_buildings]
-                            print(f"   Odblokowane budynki: {', '.join(buildings_names)}")
-                        if tech.unlocks_planet_types:
-                            types_names = [pt for pt in tech.unlocks_planet_types]
-                            print(f"   Odblokowane typy planet: {', '.join(types_names)}")
-
-        # 5. Wzrost populacji i produkcja na planetach
-        for system in self.galaxy.systems:
-            for planet in system.planets:
-                if planet.is_colonized:
-                    planet.grow_population()
-
-                    # Przetwórz produkcję
-                    completed_item = planet.process_production()
-                    if completed_item:
-                        if completed_item.item_type == "ship" and completed_item.ship_type:
-                            # Stwórz nowy statek
-                            new_ship = Ship.create_ship(
-                                ship_id=self.next_ship_id,
-                                ship_type=completed_item.ship_type,
-                                owner_id=planet.owner_id,
-                                x=system.x,
-                                y=system.y
-                            )
-                            self.ships.append(new_ship)
-                            self.next_ship_id += 1
-                            print(f"✓ {new_ship.name} wyprodukowany w systemie {system.name}!")
-
-                        elif completed_item.item_type == "building" and completed_item.building_id:
-                            # Stwórz nowy budynek
-                            building_def = BUILDINGS.get(completed_item.building_id)
-                            if building_def:
-                                new_building = Building(
-                                    building_id=building_def.id,
-                                    name=building_def.name,
-                                    production_bonus=building_def.production_bonus,
-                                    science_bonus=building_def.science_bonus,
-                                    food_bonus=building_def.food_bonus,
-                                    energy_bonus=building_def.energy_bonus,
-                                    production_flat=building_def.production_flat,
-                                    science_flat=building_def.science_flat,
-                                    food_flat=building_def.food_flat,
-                                    energy_flat=building_def.energy_flat,
-                                    upkeep_energy=building_def.upkeep_energy,
-                                )
-                                planet.add_building(new_building)
-                                print(f"🏗️ {building_def.name} zbudowany na {planet.name}!")
-
-    def _update_empire_resources(self):
-        """Aktualizuj całkowite zasoby wszystkich imperiów"""
-        for empire in self.empires:
-            total_prod = 0.0
-            total_sci = 0.0
-            total_food = 0.0
-            total_energy = 0.0
-            total_population = 0.0
-
-            # Sumuj z wszystkich planet
-            for system in self.galaxy.systems:
-                for planet in system.planets:
-                    if planet.owner_id == empire.id:
-                        total_prod += planet.calculate_production()
-                        total_sci += planet.calculate_science()
-                        total_food += planet.calculate_food()
-                        total_energy += planet.calculate_energy()
-                        total_population += planet.population
-
-            # Oblicz zużycie zasobów
-            food_upkeep = total_population * POPULATION_FOOD_UPKEEP
-            energy_upkeep = total_population * POPULATION_ENERGY_UPKEEP
-
-            # Dodaj zużycie energii przez budynki
-            building_energy_upkeep = 0.0
-            for system in self.galaxy.systems:
-                for planet in system.planets:
-                    if planet.owner_id == empire.id:
-                        for building in planet.buildings:
-                            building_energy_upkeep += building.upkeep_energy
-            energy_upkeep += building_energy_upkeep
-            # TODO: Dodać zużycie energii przez statki
-
-            # Oblicz bilans (produkcja - zużycie)
-            food_balance = total_food - food_upkeep
-            energy_balance = total_energy - energy_upkeep
-
-            # Zapisz do imperium
-            empire.total_production = total_prod
-            empire.total_science = total_sci
-            empire.total_food = total_food
-            empire.total_energy = total_energy
-            empire.food_upkeep = food_upkeep
-            empire.energy_upkeep = energy_upkeep
-            empire.food_balance = food_balance
-            empire.energy_balance = energy_balance
-
-            # Sprawdź deficyty
-            empire.has_starvation = food_balance < 0
-            empire.has_blackout = energy_balance < 0
-
-    def _apply_deficit_effects(self):
-        """Aplikuj efekty deficytu zasobów (jak w Stellaris)"""
-        for empire in self.empires:
-            empire_name = empire.name if not empire.is_player else "Twoje imperium"
-
-            # EFEKT 1: Głód (brak żywności)
-            if empire.has_starvation:
-                penalty_rate = DEFICIT_EFFECTS['food']['penalty_per_turn']
-                planets_affected = []
-
-                # Populacja umiera na wszystkich planetach
-                for system in self.galaxy.systems:
-                    for planet in system.planets:
-                        if planet.owner_id == empire.id and planet.population > 0:
-                            # Spadek populacji o 5% co turę
-                            population_loss = planet.population * penalty_rate
-                            planet.population = max(1.0, planet.population - population_loss)
-                            planets_affected.append(planet.name)
-
-                if empire.is_player:
-                    print(f"⚠️ GŁÓD! Brak żywności ({empire.food_balance:.1f})")
-                    print(f"   Populacja wymiera na {len(planets_affected)} planetach!")
-                    print(f"   Straty: {penalty_rate*100:.0f}% populacji co turę")
-
-            # EFEKT 2: Blackout (brak energii)
-            if empire.has_blackout:
-                # Kary do produkcji i nauki
-                penalty_prod = DEFICIT_EFFECTS['energy']['penalty_production']
-                penalty_sci = DEFICIT_EFFECTS['energy']['penalty_science']
-
-                # Kary są aplikowane automatycznie w następnej turze
-                # (bo _update_empire_resources() jest wywoływane przed produkcją)
-
-                if empire.is_player:
-                    print(f"⚠️ BLACKOUT! Brak energii ({empire.energy_balance:.1f})")
-                    print(f"   Produkcja: -{penalty_prod*100:.0f}%, Nauka: -{penalty_sci*100:.0f}%")
-                    print(f"   Buduj elektrownie lub zmniejsz populację!")
+            self._add_battle_effects(combat_stats['results'])
+
+    def _add_battle_effects(self, results: list[BattleResult]):
+        """Dodaj eksplozje i lasery dla rozwiązanych bitew"""
+        for result in results:
+            # Dodaj eksplozje dla zniszczonych statków
+            # (używamy pozycji ocalałych statków jako aproksymacji pola bitwy)
+            all_survivors = [ship for ships in result.survivors.values() for ship in ships]
+
+            if all_survivors:
+                # Pozycja bitwy (średnia pozycja ocalałych)
+                avg_x = sum(s.x for s in all_survivors) / len(all_survivors)
+                avg_y = sum(s.y for s in all_survivors) / len(all_survivors)
+            else:
+                # Jeśli wszyscy zginęli, użyj pozycji z pierwszego atakującego
+                # (nie mamy już dostępu do statków, więc używamy domyślnej)
+                avg_x = 0
+                avg_y = 0
+
+            # Dodaj eksplozje dla zniszczonych statków
+            for i in range(result.total_ships_destroyed):
+                # Losowa pozycja wokół centrum bitwy
+                offset_x = random.uniform(-50, 50)
+                offset_y = random.uniform(-50, 50)
+                self.combat_effects.add_explosion(avg_x + offset_x, avg_y + offset_y, size=40)
+
+            # Dodaj lasery między statkami (symulacja ataków)
+            # Połącz atakujących z obrońcami
+            attackers = result.attacker_survivors[:3]  # Max 3 dla wydajności
+            defenders = result.defender_survivors[:3]
+
+            for attacker in attackers:
+                if defenders:
+                    target = random.choice(defenders)
+                    # Kolor lasera zależy od imperium
+                    laser_color = next((e.color for e in self.empires if e.id == attacker.owner_id), (100, 200, 255))
+                    self.combat_effects.add_laser_beam(
+                        attacker.x, attacker.y,
+                        target.x, target.y,
+                        color=laser_color
+                    )
 
     def render(self, dt=0.016):
         """Renderuj grę"""
@@ -897,7 +626,8 @@ class Game:
             self.renderer.draw_galaxy(self.galaxy, self.player_empire.id, empire_colors)
 
         # Rysuj statki
-        self.renderer.draw_ships(self.ships, empire_colors, self.selected_ships)
+        self.renderer.draw_ships(self.ships, empire_colors, self.selected_ships,
+                                 self.fleets.values(), self.selected_fleets)
 
         # Rysuj efekty walki (lasery, eksplozje)
         self.combat_effects.draw(self.screen, self.renderer.camera)
@@ -1047,33 +777,24 @@ class Game:
             y_battle_item = y_battles + 20
             for result in self.last_turn_battles[:2]:  # Max 2 bitwy (żeby się zmieściło)
                 # Sprawdź czy gracz uczestniczył
-                player_involved = (result.attacker_empire_id == self.player_empire.id or
-                                 result.defender_empire_id == self.player_empire.id)
+                player_involved = self.player_empire.id in result.empire_ids
 
                 if player_involved:
-                    # Nazwy imperiów
-                    attacker_name = next((e.name for e in self.empires if e.id == result.attacker_empire_id), "?")
-                    defender_name = next((e.name for e in self.empires if e.id == result.defender_empire_id), "?")
-
-                    # Skróć nazwy
-                    attacker_short = attacker_name[:10]
-                    defender_short = defender_name[:10]
+                    # Skrócone nazwy imperiów
+                    names = {e.id: e.name[:10] for e in self.empires}
 
                     # Kto wygrał
-                    if result.attacker_won:
-                        winner_short = attacker_short
-                        battle_color = Colors.UI_TEXT if result.attacker_empire_id == self.player_empire.id else (255, 100, 100)
-                    else:
-                        winner_short = defender_short
-                        battle_color = Colors.UI_TEXT if result.defender_empire_id == self.player_empire.id else (255, 100, 100)
+                    winner_short = names.get(result.winner_id, "Remis")
+                    battle_color = Colors.UI_TEXT if result.winner_id == self.player_empire.id else (255, 100, 100)
 
                     # Rysuj
-                    battle_text = f"⚔️ {attacker_short} vs {defender_short}"
+                    battle_text = "⚔️ " + " vs ".join(names.get(empire_id, "?") for empire_id in result.empire_ids)
                     draw_text(self.screen, battle_text,
                              WINDOW_WIDTH - PANEL_WIDTH + PANEL_PADDING, y_battle_item,
                              self.renderer.font_small, battle_color)
 
-                    result_text = f"   🏆 {winner_short} (-{result.attacker_ships_destroyed}/{result.defender_ships_destroyed})"
+                    losses = "/".join(str(result.losses.get(empire_id, 0)) for empire_id in result.empire_ids)
+                    result_text = f"   🏆 {winner_short} (-{losses})"
                     draw_text(self.screen, result_text,
                              WINDOW_WIDTH - PANEL_WIDTH + PANEL_PADDING, y_battle_item + 15,
                              self.renderer.font_small, Colors.LIGHT_GRAY)
@@ -1083,8 +804,31 @@ class Game:
         # === SEKCJA 4: GŁÓWNA (Statki/Systemy) - największa sekcja ===
         y_main = 380  # Przesunięte w dół o 30px dla sekcji bitew
 
+        # Informacje o wybranych flotach (zapamiętane statystyki - bez liczenia co klatkę)
+        if self.selected_fleets:
+            y_fleet = y_main
+            for fleet in self.selected_fleets[:3]:
+                status = " (w ruchu)" if fleet.is_moving else ""
+                draw_text(self.screen, f"{fleet.name}: {len(fleet)} statków{status}",
+                         WINDOW_WIDTH - PANEL_WIDTH + PANEL_PADDING, y_fleet,
+                         self.renderer.font_small, Colors.UI_HIGHLIGHT)
+                draw_text(self.screen, f"  Atak {fleet.total_attack:.0f} • Obrona {fleet.total_defense:.0f} • HP {fleet.total_hp:.0f}",
+                         WINDOW_WIDTH - PANEL_WIDTH + PANEL_PADDING, y_fleet + 20,
+                         self.renderer.font_small, Colors.UI_TEXT)
+                y_fleet += 45
+
+            if len(self.selected_fleets) > 3:
+                draw_text(self.screen, f"  ...i {len(self.selected_fleets) - 3} więcej flot",
+                         WINDOW_WIDTH - PANEL_WIDTH + PANEL_PADDING, y_fleet,
+                         self.renderer.font_small, Colors.LIGHT_GRAY)
+                y_fleet += 25
+
+            draw_text(self.screen, "PPM - wyślij • G - rozwiąż flotę",
+                     WINDOW_WIDTH - PANEL_WIDTH + PANEL_PADDING, y_fleet,
+                     self.renderer.font_small, Colors.LIGHT_GRAY)
+
         # Informacje o wybranych statkach
-        if self.selected_ships:
+        elif self.selected_ships:
             draw_text(self.screen, f"Wybrane statki: {len(self.selected_ships)}",
                      WINDOW_WIDTH - PANEL_WIDTH + PANEL_PADDING, y_main,
                      self.renderer.font_small, Colors.UI_HIGHLIGHT)
@@ -1119,7 +863,8 @@ class Game:
                     # Statek dotarł do systemu
                     target_system = self.galaxy.find_system_by_id(colony_ship.target_system_id)
                     if target_system:
-                        colonizable = target_system.get_colonizable_planets(COLONIZABLE_PLANET_TYPES)
+                        colonizable = target_system.get_colonizable_planets(
+                            self.player_empire.get_colonizable_planet_types())
                         if colonizable:
                             draw_text(self.screen, "C - kolonizuj planetę",
                                      WINDOW_WIDTH - PANEL_WIDTH + PANEL_PADDING, y_ship,
@@ -1257,7 +1002,7 @@ class Game:
                            (WINDOW_WIDTH - PANEL_WIDTH + PANEL_PADDING, separator_y),
                            (WINDOW_WIDTH - PANEL_PADDING, separator_y), 1)
 
-            y_help = y_bottom - 145
+            y_help = y_bottom - 160
             draw_text(self.screen, "═══ STEROWANIE ═══",
                      WINDOW_WIDTH - PANEL_WIDTH + PANEL_PADDING, y_help,
                      self.renderer.font_small, Colors.UI_HIGHLIGHT)
@@ -1270,8 +1015,10 @@ class Game:
                 ("Shift+LPM", "dodaj do wyboru"),
                 ("PPM klik", "rozkaz ruchu"),
                 ("C", "kolonizuj planetę"),
+                ("F / G", "utwórz / rozwiąż flotę"),
                 ("P", "zarządzaj planetą"),
                 ("R", "badania"),
+                ("F3", "profiler tur"),
                 ("Spacja", "zakończ turę"),
                 ("H", "ukryj pomoc"),
             ]
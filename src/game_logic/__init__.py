@@ -1,7 +1,8 @@
 """
-Logika gry (placeholder dla przyszBego rozwoju)
+Logika gry niezależna od pygame (symulacja tur)
 """
-# Ten moduB jest przeznaczony na logik gry, ktra zostanie wydzielona z game.py
-# np. system ekonomii, dyplomacji, zarzdzania turami
+from src.game_logic.economy import EconomyTable
+from src.game_logic.simulation import Simulation, GameStats
+from src.game_logic.batch import BatchConfig, GameSummary, run_game, run_batch
 
-__all__ = []
+__all__ = ['EconomyTable', 'Simulation', 'GameStats', 'BatchConfig', 'GameSummary', 'run_game', 'run_batch']
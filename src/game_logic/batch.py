@@ -0,0 +1,163 @@
+"""
+Wsadowe symulacje gier AI-vs-AI w wielu procesach
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+import numpy as np
+from src.game_logic.simulation import Simulation
+from src.utils.rng import RandomStreams
+from src.config import NUM_STAR_SYSTEMS, NUM_AI_EMPIRES, GALAXY_GENERATION_MODE
+
+
+@dataclass
+class BatchConfig:
+    """Parametry każdej gry w serii"""
+    systems: int = NUM_STAR_SYSTEMS
+    empires: int = NUM_AI_EMPIRES + 1
+    max_turns: int = 300
+    galaxy_mode: str = GALAXY_GENERATION_MODE
+
+
+@dataclass
+class GameSummary:
+    """Podsumowanie jednej rozegranej gry"""
+    game: int
+    seed: int
+    winner_id: int        # -1 = brak zwycięzcy (limit tur)
+    winner_name: str
+    victory: str          # "conquest", "domination" lub "" (limit tur)
+    turns: int
+    ships_built: int
+    battles: int
+    ships_destroyed: int
+    techs: int            # Suma zbadanych technologii wszystkich imperiów
+    wall_time: float      # Sekundy (cała gra razem z inicjalizacją)
+    phase_times: dict[str, float] = field(default_factory=dict)  # Faza -> sekundy
+
+
+def game_seeds(base_seed: int, count: int) -> list[int]:
+    """Ziarna kolejnych gier serii wyprowadzone z ziarna bazowego"""
+    streams = RandomStreams(base_seed)
+    return [streams.derive_seed(f"game.{game}") for game in range(count)]
+
+
+def run_game(game: int, seed: int, config: BatchConfig) -> GameSummary:
+    """
+    Rozegraj jedną headless grę AI-vs-AI do zwycięstwa lub limitu tur
+
+    Args:
+        game: Numer gry w serii
+        seed: Ziarno gry
+        config: Parametry gry
+
+    Returns:
+        GameSummary: Podsumowanie gry
+    """
+    start = time.perf_counter()
+    sim = Simulation(verbose=False, seed=seed)
+    sim.initialize_new_game(
+        num_systems=config.systems,
+        num_ai_empires=config.empires,
+        galaxy_mode=config.galaxy_mode,
+        ai_only=True,
+    )
+
+    sim.profiler.enable()
+    for _ in range(config.max_turns):
+        sim.end_turn()
+        if sim.check_victory():
+            break
+    sim.profiler.disable()
+
+    winner = sim.winner
+    return GameSummary(
+        game=game,
+        seed=seed,
+        winner_id=winner.id if winner else -1,
+        winner_name=winner.name if winner else "",
+        victory=sim.victory_type or "",
+        turns=len(sim.profiler.traces),
+        ships_built=sim.stats.ships_built,
+        battles=sim.stats.battles,
+        ships_destroyed=sim.stats.ships_destroyed,
+        techs=sum(len(empire.researched_technologies) for empire in sim.empires),
+        wall_time=time.perf_counter() - start,
+        phase_times={
+            name: stats.wall_time for name, stats in sim.profiler.phase_totals().items()
+        },
+    )
+
+
+class ColumnarWriter:
+    """
+    Zapis podsumowań gier kolumnami do skompresowanego pliku .npz.
+
+    Każde pole GameSummary to osobna tablica NumPy (czasy faz jako
+    kolumny "phase_<nazwa>"). Plik jest nadpisywany atomowo co flush(),
+    więc w trakcie długiej serii na dysku zawsze są kompletne wyniki
+    dotychczas zakończonych gier. Odczyt: np.load(path).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.columns: dict[str, list] = {}
+        self.rows = 0
+
+    def append(self, summary: GameSummary):
+        """Dodaj wiersz (jedną grę)"""
+        values = {name: value for name, value in vars(summary).items() if name != "phase_times"}
+        for phase, seconds in summary.phase_times.items():
+            values[f"phase_{phase}"] = seconds
+
+        for name, value in values.items():
+            self.columns.setdefault(name, []).append(value)
+        self.rows += 1
+
+    def flush(self):
+        """Zapisz wszystkie kolumny (zapis atomowy przez plik tymczasowy)"""
+        arrays = {name: np.asarray(column) for name, column in self.columns.items()}
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(temp_path, self.path)
+
+
+def run_batch(num_games: int, config: BatchConfig, output: str, base_seed: int = 0,
+              workers: Optional[int] = None, flush_every: int = 50,
+              on_result: Optional[Callable[[GameSummary], None]] = None) -> ColumnarWriter:
+    """
+    Rozegraj serię gier w puli procesów i zapisuj wyniki na bieżąco
+
+    Args:
+        num_games: Liczba gier
+        config: Parametry każdej gry
+        output: Ścieżka pliku wynikowego (.npz)
+        base_seed: Ziarno serii (ziarna gier patrz game_seeds)
+        workers: Liczba procesów (None = wszystkie rdzenie)
+        flush_every: Co ile zakończonych gier zapisywać plik
+        on_result: Opcjonalny callback wywoływany dla każdej zakończonej gry
+
+    Returns:
+        ColumnarWriter: Zapisane kolumny (wiersze w kolejności zakończenia gier)
+    """
+    writer = ColumnarWriter(output)
+    seeds = game_seeds(base_seed, num_games)
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = [
+            executor.submit(run_game, game, seed, config)
+            for game, seed in enumerate(seeds)
+        ]
+        for future in as_completed(futures):
+            summary = future.result()
+            writer.append(summary)
+            if on_result:
+                on_result(summary)
+            if writer.rows % flush_every == 0:
+                writer.flush()
+
+    writer.flush()
+    return writer
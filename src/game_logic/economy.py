@@ -0,0 +1,119 @@
+"""
+Wektorowe obliczanie ekonomii imperiów (NumPy)
+"""
+import numpy as np
+from src.models.galaxy import Galaxy
+from src.models.empire import Empire
+from src.models.planet import RESOURCE_TYPES
+from src.config import (
+    BASE_PRODUCTION_PER_POP, BASE_SCIENCE_PER_POP,
+    BASE_FOOD_PER_POP, BASE_ENERGY_PER_POP,
+    PLANET_TYPE_MODIFIERS
+)
+
+# Kolejność kolumn zasobów w tabeli (taka sama jak w BuildingBonuses)
+RESOURCES = RESOURCE_TYPES
+BASE_PER_POP = np.array([
+    BASE_PRODUCTION_PER_POP,
+    BASE_SCIENCE_PER_POP,
+    BASE_FOOD_PER_POP,
+    BASE_ENERGY_PER_POP,
+])
+
+
+class EconomyTable:
+    """
+    Kolumnowa tabela ekonomii wszystkich planet galaktyki.
+
+    Kolumny stałe (bogactwo minerałów, modyfikatory typu planety) są budowane
+    raz dla wszystkich planet, w kolejności Planet.galaxy_index. Dynamiczne
+    (właściciel, populacja, bonusy budynków) są odświeżane przed każdym
+    przeliczeniem tylko dla planet skolonizowanych, z indeksu własności
+    galaktyki. Zasoby liczymy jednym przebiegiem, a sumy per imperium przez
+    np.bincount po właścicielu. Kolejność działań jest taka sama jak
+    w Planet._calculate_resource, więc wyniki są identyczne.
+    """
+
+    def __init__(self, galaxy: Galaxy):
+        self.planets = [planet for system in galaxy.systems for planet in system.planets]
+        count = len(self.planets)
+
+        # Kolumny stałe
+        self.mineral_richness = np.fromiter(
+            (p.mineral_richness for p in self.planets), dtype=float, count=count
+        )
+        self.type_modifiers = np.array([
+            [PLANET_TYPE_MODIFIERS.get(p.planet_type, {}).get(resource, 1.0) for resource in RESOURCES]
+            for p in self.planets
+        ], dtype=float).reshape(count, len(RESOURCES))
+
+        # Kolumny dynamiczne - tylko planety skolonizowane (patrz refresh)
+        self.rows = np.zeros(0, dtype=np.int64)  # Wiersze kolumn stałych
+        self.owner = np.zeros(0, dtype=np.int64)  # Indeks imperium
+        self.population = np.zeros(0)
+        self.percent_bonus = np.zeros((0, len(RESOURCES)))
+        self.flat_bonus = np.zeros((0, len(RESOURCES)))
+        self.upkeep_energy = np.zeros(0)
+
+    def matches(self, galaxy: Galaxy) -> bool:
+        """Czy tabela odpowiada planetom galaktyki (ta sama liczba planet)"""
+        return len(self.planets) == galaxy.planet_count
+
+    def refresh(self, galaxy: Galaxy, empires: list[Empire]):
+        """
+        Skopiuj bieżący stan planet imperiów do kolumn dynamicznych
+
+        Args:
+            galaxy: Galaktyka (źródło indeksu własności)
+            empires: Imperia - ich kolejność wyznacza indeksy w wynikach
+        """
+        owned = [
+            (empire_index, planet)
+            for empire_index, empire in enumerate(empires)
+            for _, planet in galaxy.get_owned_planets(empire.id)
+        ]
+        count = len(owned)
+        self.rows = np.fromiter((p.galaxy_index for _, p in owned), dtype=np.int64, count=count)
+        self.owner = np.fromiter((i for i, _ in owned), dtype=np.int64, count=count)
+        self.population = np.fromiter((p.population for _, p in owned), dtype=float, count=count)
+
+        self.percent_bonus = np.zeros((count, len(RESOURCES)))
+        self.flat_bonus = np.zeros((count, len(RESOURCES)))
+        self.upkeep_energy = np.zeros(count)
+        for row, (_, planet) in enumerate(owned):
+            if not planet.buildings:
+                continue
+            bonuses = planet.building_bonuses
+            self.percent_bonus[row] = bonuses.percent
+            self.flat_bonus[row] = bonuses.flat
+            self.upkeep_energy[row] = bonuses.upkeep_energy
+
+    def compute_totals(self, num_empires: int) -> dict[str, np.ndarray]:
+        """
+        Policz zasoby wszystkich planet i zsumuj je per imperium
+
+        Args:
+            num_empires: Liczba imperiów (długość zwracanych tablic)
+
+        Returns:
+            dict: {'production', 'science', 'food', 'energy', 'population',
+                   'building_upkeep'} -> tablica sum indeksowana imperium
+        """
+        owners = self.owner
+        population = self.population
+
+        # Ta sama kolejność działań co w Planet._calculate_resource
+        base = population[:, None] * BASE_PER_POP[None, :]
+        base[:, 0] = base[:, 0] * self.mineral_richness[self.rows]  # Tylko produkcja
+        base = base * self.type_modifiers[self.rows]
+        values = base * (1.0 + self.percent_bonus) + self.flat_bonus
+
+        totals = {
+            resource: np.bincount(owners, weights=values[:, column], minlength=num_empires)
+            for column, resource in enumerate(RESOURCES)
+        }
+        totals['population'] = np.bincount(owners, weights=population, minlength=num_empires)
+        totals['building_upkeep'] = np.bincount(
+            owners, weights=self.upkeep_energy, minlength=num_empires
+        )
+        return totals
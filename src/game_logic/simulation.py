@@ -0,0 +1,732 @@
+"""
+Rdzeń symulacji gry - stan i przetwarzanie tur bez pygame
+"""
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+from src.models.galaxy import Galaxy, StarSystem
+from src.models.empire import Empire
+from src.models.ship import Ship, ShipType, Fleet, ship_type_code
+from src.models.ship_registry import ShipRegistry
+from src.models.planet import Building
+from src.combat.combat_manager import CombatManager
+from src.combat.battle import Battle, BattleResult
+from src.ai.ai_controller import AIController
+from src.ai.world_snapshot import WorldSnapshot
+from src.ai.budget import TimeBudget
+from src.ai.orders import apply_orders
+from src.ai.parallel import ParallelAI
+from src.game_logic.economy import EconomyTable
+from src.utils.profiler import TurnProfiler
+from src.utils.rng import RandomStreams
+from src.config import (
+    NUM_STAR_SYSTEMS, NUM_AI_EMPIRES, GALAXY_GENERATION_MODE, GALAXY_HYPERLANES, AI_TURN_BUDGET_MS, PARALLEL_AI_MIN,
+    STARTING_SHIPS, COLONIZABLE_PLANET_TYPES,
+    POPULATION_FOOD_UPKEEP, POPULATION_ENERGY_UPKEEP,
+    DEFICIT_EFFECTS, TECHNOLOGIES, BUILDINGS, VICTORY_PLANET_SHARE,
+    GARRISON_SHIP_TYPES
+)
+
+
+@dataclass
+class GameStats:
+    """Liczniki przebiegu gry (do podsumowań symulacji wsadowych)"""
+    ships_built: int = 0
+    battles: int = 0
+    ships_destroyed: int = 0
+
+
+class Simulation:
+    """
+    Headless symulacja gry - galaktyka, imperia, statki, walka i AI.
+
+    Nie importuje pygame, więc może działać w testach i masowych
+    symulacjach AI-vs-AI. `Game` jest tylko widokiem nad tą klasą.
+    """
+
+    def __init__(self, verbose: bool = True, seed: Optional[int] = None):
+        """
+        Args:
+            verbose: Czy wypisywać komunikaty o przebiegu gry na stdout
+            seed: Ziarno gry (None = losowe). Ta sama gra z tym samym ziarnem
+                  przebiega identycznie - ziarno jest dostępne w self.rng.seed
+        """
+        self.verbose = verbose
+
+        # Niezależne strumienie losowości dla podsystemów i imperiów
+        self.rng = RandomStreams(seed)
+
+        # Stan gry
+        self.galaxy: Optional[Galaxy] = None
+        self.empires: list[Empire] = []
+        self.player_empire: Optional[Empire] = None
+        self.ships = ShipRegistry()  # Wszystkie statki (usuwanie O(1) po ID)
+        self.fleets: dict[int, Fleet] = {}  # fleet_id -> Fleet (statki floty są też w self.ships)
+        self.current_turn = 1
+        self.next_ship_id = 0
+        self.next_fleet_id = 0
+
+        # Combat system
+        self.combat_manager = CombatManager(rng=self.rng.stream("combat"))
+        self.last_turn_battles: list[BattleResult] = []  # Bitwy z ostatniej tury (do wyświetlenia)
+
+        # AI system
+        self.ai_controllers: dict[int, AIController] = {}  # empire_id -> AIController
+        self.ai_time_budget_ms = AI_TURN_BUDGET_MS  # Czas na decyzje wszystkich AI w turze (None = bez limitu)
+        self.parallel_ai = ParallelAI()  # Pula procesów dla decyzji AI (workers=0 - po kolei)
+
+        # Ekonomia (tabela kolumnowa budowana przy pierwszym przeliczeniu)
+        self.economy: Optional[EconomyTable] = None
+
+        # Profiler faz tury (wyłączony - włącz przez profiler.enable())
+        self.profiler = TurnProfiler()
+
+        # Statystyki i wynik gry (patrz check_victory)
+        self.stats = GameStats()
+        self.winner: Optional[Empire] = None
+        self.victory_type: Optional[str] = None
+
+    def close(self):
+        """Zamknij pule procesów (walka, AI), jeśli były używane"""
+        self.combat_manager.close()
+        self.parallel_ai.close()
+
+    def _log(self, message: str = ""):
+        """Wypisz komunikat (tylko w trybie verbose)"""
+        if self.verbose:
+            print(message)
+
+    def initialize_new_game(self, with_test_scenario: bool = True,
+                            num_systems: int = NUM_STAR_SYSTEMS,
+                            num_ai_empires: int = NUM_AI_EMPIRES,
+                            galaxy_mode: str = GALAXY_GENERATION_MODE,
+                            ai_only: bool = False,
+                            hyperlanes: bool = GALAXY_HYPERLANES):
+        """
+        Rozpocznij nową grę
+
+        Args:
+            with_test_scenario: Czy dodać testowy scenariusz walki z piratami
+            num_systems: Liczba systemów gwiezdnych
+            num_ai_empires: Liczba imperiów AI
+            galaxy_mode: Tryb generowania galaktyki (patrz Galaxy.generate)
+            ai_only: Gra bez gracza - tylko imperia AI (player_empire = None,
+                     bez scenariusza testowego)
+            hyperlanes: Czy galaktyka ma sieć hiperlinii (loty po trasach)
+        """
+        self._log(f"Ziarno gry: {self.rng.seed}")
+        self._log("Generowanie galaktyki...")
+        self.galaxy = Galaxy.generate(
+            num_systems, mode=galaxy_mode, seed=self.rng.derive_seed("galaxy"),
+            hyperlanes=hyperlanes
+        )
+
+        self._log("Tworzenie imperiów...")
+        # Stwórz gracza
+        if not ai_only:
+            self.player_empire = Empire.create_player("Ziemia")
+            self.empires.append(self.player_empire)
+
+        # Stwórz AI
+        for _ in range(num_ai_empires):
+            # ID imperium = indeks w self.empires (także w grze bez gracza)
+            ai_empire = Empire.create_ai(len(self.empires), rng=self.rng.stream("empires"))
+            self.empires.append(ai_empire)
+
+        self._log("Przydzielanie systemów macierzystych...")
+        # Przydziel systemy macierzyste
+        for i, empire in enumerate(self.empires):
+            if i < len(self.galaxy.systems):
+                home_system = self.galaxy.systems[i]
+                empire.home_system_id = home_system.id
+                empire.explore_system(home_system.id)
+                home_system.explore(empire.id)
+
+                # Skolonizuj pierwszą ODPOWIEDNIĄ planetę (NIE gazowy olbrzym!)
+                # Znajdź pierwszą planetę która nadaje się do kolonizacji
+                colonizable_planets = [p for p in home_system.planets
+                                       if p.planet_type in COLONIZABLE_PLANET_TYPES]
+
+                if colonizable_planets:
+                    home_planet = colonizable_planets[0]
+                    home_planet.colonize(empire.id, initial_population=50.0)
+                    if empire.is_player:
+                        self._log(f"✓ Start: {home_planet.name} ({home_planet.planet_type.value})")
+                elif home_system.planets:
+                    # Ostatnia deska ratunku - weź pierwszą planetę i zmień jej typ
+                    home_planet = home_system.planets[0]
+                    from src.config import PlanetType
+                    home_planet.planet_type = PlanetType.EARTH_LIKE  # Wymuś ziemiopodobną
+                    home_planet.colonize(empire.id, initial_population=50.0)
+                    if empire.is_player:
+                        self._log(f"⚠️ System macierzysty nie miał dobrych planet - przekształcono pierwszą")
+
+                # Stwórz początkowe statki
+                self._create_starting_ships(empire, home_system)
+
+        # Ustaw relacje dyplomatyczne (wszyscy w stanie wojny)
+        self._log("Ustawianie relacji dyplomatycznych...")
+        for i, emp1 in enumerate(self.empires):
+            for j, emp2 in enumerate(self.empires):
+                if i != j:
+                    emp1.set_relation(emp2.id, "war")
+
+        # Inicjalizuj AI controllery
+        self._log("Inicjalizacja AI...")
+        for empire in self.empires:
+            if not empire.is_player:
+                self.ai_controllers[empire.id] = AIController(
+                    empire, self.galaxy, rng=self.rng.empire_stream("ai", empire.id)
+                )
+                self._log(f"  AI {empire.name} ({empire.ai_personality})")
+
+        # TESTOWE: Dodaj pirackiego bossa i statek bojowy dla gracza
+        if with_test_scenario and not ai_only:
+            self._create_test_combat_scenario()
+
+        self._log("Gra gotowa!")
+
+    def _create_test_combat_scenario(self):
+        """
+        TESTOWE: Stwórz scenariusz testowy do sprawdzenia combat
+        - Piracki Cruiser w pobliżu systemu gracza
+        - Bojowy Cruiser dla gracza
+        """
+        if not self.player_empire:
+            self._log("⚠️ UWAGA: Nie można stworzyć test scenario - brak player_empire")
+            return
+
+        if self.player_empire.home_system_id is None:
+            self._log("⚠️ UWAGA: Nie można stworzyć test scenario - brak home_system_id")
+            return
+
+        player_home = self.galaxy.find_system_by_id(self.player_empire.home_system_id)
+        if not player_home:
+            self._log("⚠️ UWAGA: Nie można stworzyć test scenario - nie znaleziono home system")
+            return
+
+        self._log("\n" + "="*60)
+        self._log("🏴‍☠️ TESTOWY SCENARIUSZ COMBAT - POCZĄTEK")
+        self._log("="*60)
+
+        # 1. Stwórz pirackie imperium (bez AI controllera, więc piraci stoją w miejscu)
+        pirate_empire = Empire(
+            id=999,  # Specjalne ID dla piratów
+            name="🏴‍☠️ Piraci",
+            color=(80, 80, 80),
+            is_player=False
+        )
+        self.empires.append(pirate_empire)
+
+        # Ustaw piratów w stanie wojny z graczem
+        pirate_empire.set_relation(self.player_empire.id, "war")
+        self.player_empire.set_relation(pirate_empire.id, "war")
+
+        # 2. Stwórz pirackiego Cruisera BLISKO systemu gracza (dystans ~120 jednostek)
+        # Tuż poza zasięgiem walki (Battle.COMBAT_RANGE), żeby bitwa nie wybuchła od razu
+        pirate_x = player_home.x + 100
+        pirate_y = player_home.y + 65
+
+        pirate_cruiser = Ship.create_ship(
+            ship_id=self.next_ship_id,
+            ship_type=ShipType.CRUISER,
+            owner_id=pirate_empire.id,
+            x=pirate_x,
+            y=pirate_y
+        )
+        pirate_cruiser.name = "🏴‍☠️ Piracki Boss"
+        self.ships.append(pirate_cruiser)
+        self.next_ship_id += 1
+
+        self._log(f"  • Piracki Cruiser ({pirate_cruiser.name}) @ ({int(pirate_x)}, {int(pirate_y)})")
+        self._log(f"    HP: {pirate_cruiser.max_hp}, ATK: {pirate_cruiser.attack}, DEF: {pirate_cruiser.defense}")
+
+        # Oblicz rzeczywisty dystans
+        dist = ((pirate_x - player_home.x)**2 + (pirate_y - player_home.y)**2)**0.5
+        self._log(f"    Dystans od Twojego systemu: {int(dist)} jednostek")
+
+        # 3. Dodaj bojowy Cruiser dla gracza w jego systemie
+        player_cruiser = Ship.create_ship(
+            ship_id=self.next_ship_id,
+            ship_type=ShipType.CRUISER,
+            owner_id=self.player_empire.id,
+            x=player_home.x,
+            y=player_home.y
+        )
+        player_cruiser.name = "⚔️ Obrońca"
+        self.ships.append(player_cruiser)
+        self.next_ship_id += 1
+
+        self._log(f"  • Twój Cruiser ({player_cruiser.name}) @ ({int(player_home.x)}, {int(player_home.y)})")
+        self._log(f"    HP: {player_cruiser.max_hp}, ATK: {player_cruiser.attack}, DEF: {player_cruiser.defense}")
+        self._log(f"\n  💡 INSTRUKCJA:")
+        self._log(f"     1. Znajdź swojego Cruisera '⚔️ Obrońca' w swoim systemie domowym")
+        self._log(f"     2. Kliknij PPM aby wysłać go do pozycji pirata: (~{int(pirate_x)}, ~{int(pirate_y)})")
+        self._log(f"     3. Gdy będą w zasięgu {int(Battle.COMBAT_RANGE)} jednostek, bitwa rozpocznie się automatycznie!")
+        self._log(f"     4. Zobaczysz efekty lasery i eksplozje podczas walki!")
+        self._log("="*60)
+        self._log("🏴‍☠️ TESTOWY SCENARIUSZ COMBAT - KONIEC")
+        self._log("="*60 + "\n")
+
+    def _create_starting_ships(self, empire: Empire, system: StarSystem):
+        """Stwórz początkowe statki dla imperium"""
+        for ship_type, count in STARTING_SHIPS.items():
+            for _ in range(count):
+                ship = Ship.create_ship(
+                    ship_id=self.next_ship_id,
+                    ship_type=ship_type,
+                    owner_id=empire.id,
+                    x=system.x,
+                    y=system.y
+                )
+                self.ships.append(ship)
+                self.next_ship_id += 1
+
+    def create_fleet(self, ships: list[Ship], name: Optional[str] = None) -> Fleet:
+        """
+        Połącz statki w nową flotę (statki opuszczają swoje dotychczasowe floty)
+
+        Args:
+            ships: Statki jednego imperium; flota staje w pozycji pierwszego
+            name: Nazwa floty (domyślnie "Flota N")
+
+        Returns:
+            Fleet: Utworzona flota
+
+        Raises:
+            ValueError: Jeśli nie podano statków lub należą do różnych imperiów
+        """
+        if not ships:
+            raise ValueError("Flota musi mieć co najmniej jeden statek")
+        owner_id = ships[0].owner_id
+        if any(ship.owner_id != owner_id for ship in ships):
+            raise ValueError("Statki floty muszą należeć do jednego imperium")
+
+        self._leave_fleets(ships)
+
+        fleet = Fleet(
+            id=self.next_fleet_id,
+            name=name or f"Flota {self.next_fleet_id + 1}",
+            owner_id=owner_id,
+            ships=list(ships)
+        )
+        self.fleets[fleet.id] = fleet
+        self.next_fleet_id += 1
+        return fleet
+
+    def disband_fleet(self, fleet: Fleet):
+        """Rozwiąż flotę - statki zostają w jej pozycji jako pojedyncze jednostki"""
+        for ship in fleet.ships:
+            ship.fleet_id = None
+        fleet.ships = []
+        self.fleets.pop(fleet.id, None)
+
+    def _leave_fleets(self, ships: list[Ship]):
+        """Odłącz statki od ich flot (każda flota przebudowana raz; puste floty znikają)"""
+        leaving = {id(ship) for ship in ships}
+        for fleet_id in {ship.fleet_id for ship in ships} - {None}:
+            fleet = self.fleets.get(fleet_id)
+            if fleet is None:
+                continue
+            fleet.ships = [s for s in fleet.ships if id(s) not in leaving]
+            fleet.refresh()
+            if not fleet.ships:
+                del self.fleets[fleet_id]
+        for ship in ships:
+            ship.fleet_id = None
+
+    def _join_garrison(self, ship: Ship, system: StarSystem):
+        """Dołącz nowy okręt do stojącej floty imperium w systemie (lub utwórz ją)"""
+        garrison = next(
+            (fleet for fleet in self.fleets.values()
+             if fleet.owner_id == ship.owner_id and not fleet.is_moving
+             and fleet.x == system.x and fleet.y == system.y),
+            None
+        )
+        if garrison:
+            garrison.add_ship(ship)
+        else:
+            self.create_fleet([ship], name=f"Garnizon {system.name}")
+
+    def try_colonize(self, colony_ship: Ship) -> bool:
+        """Spróbuj skolonizować planetę statkiem kolonistów. Zwraca True jeśli się powiodło."""
+        # Znajdź system docelowy
+        target_system = self.galaxy.find_system_by_id(colony_ship.target_system_id)
+        if not target_system:
+            return False
+
+        # Sprawdź czy system jest odkryty
+        if not target_system.is_explored_by(colony_ship.owner_id):
+            target_system.explore(colony_ship.owner_id)
+
+        # Znajdź KOLONIZOWALNE planety (typy, które imperium umie kolonizować - NIE gazowe olbrzymy!)
+        empire = self.empires[colony_ship.owner_id]
+        colonizable_planets = target_system.get_colonizable_planets(empire.get_colonizable_planet_types())
+
+        if not colonizable_planets:
+            # Sprawdź czy są jakieś wolne planety (dla komunikatu)
+            free_planets = target_system.get_free_planets()
+            if free_planets:
+                planet_types = ", ".join([p.planet_type.value for p in free_planets])
+                self._log(f"⚠ {target_system.name}: Brak planet nadających się do kolonizacji!")
+                self._log(f"  Dostępne planety: {planet_types}")
+                self._log(f"  (Wymagana technologia do kolonizacji tych typów)")
+            else:
+                self._log(f"⚠ {target_system.name}: Wszystkie planety już skolonizowane")
+
+            colony_ship.target_system_id = None  # Wyczyść cel
+            return False
+
+        # Skolonizuj planetę wybraną przy wysłaniu statku (jeśli nadal wolna),
+        # w przeciwnym razie pierwszą NADAJĄCĄ SIĘ planetę
+        planet = colonizable_planets[0]
+        if colony_ship.target_planet_index is not None:
+            _, chosen = self.galaxy.planet_entries()[colony_ship.target_planet_index]
+            if any(candidate is chosen for candidate in colonizable_planets):
+                planet = chosen
+        planet.colonize(colony_ship.owner_id, initial_population=10.0)
+
+        self._log(f"✓ {planet.name} ({planet.planet_type.value}) skolonizowana przez {empire.name}!")
+
+        # Zwróć True - statek zostanie usunięty przez wywołującego
+        return True
+
+    def end_turn(self) -> dict:
+        """
+        Przetwórz jedną turę gry
+
+        Returns:
+            dict: Statystyki walki z tej tury (patrz CombatManager.process_combat_turn)
+        """
+        self.current_turn += 1
+        self._log(f"\n=== TURA {self.current_turn} ===")
+        self.profiler.begin_turn(self.current_turn)
+
+        # 1. Ruch statków (turowy)
+        with self.profiler.phase("movement"):
+            self._process_movement()
+
+        # 1.5. Przetwarzanie bitew (combat system)
+        with self.profiler.phase("combat"):
+            combat_stats = self._process_combat()
+
+        # 1.7. AI podejmuje decyzje
+        with self.profiler.phase("ai"):
+            # Budżet całej fazy AI (razem z budową migawki)
+            budget = TimeBudget(self.ai_time_budget_ms)
+
+            # Jedna migawka świata dla wszystkich AI (zamiast skanu galaktyki na imperium)
+            snapshot = WorldSnapshot.build(
+                self.galaxy, self.ships, [ai.empire for ai in self.ai_controllers.values()]
+            )
+
+            controllers = list(self.ai_controllers.values())
+            if self.parallel_ai.workers > 0 and len(controllers) >= PARALLEL_AI_MIN:
+                # Imperia decydują równolegle na kopiach świata - rozkazy
+                # wykonujemy tutaj, w kolejności ID imperiów
+                orders = self.parallel_ai.decide(controllers, snapshot, budget.remaining_ms())
+                for empire_id in sorted(orders):
+                    apply_orders(orders[empire_id], self.galaxy, self.ships,
+                                 self.ai_controllers[empire_id].empire)
+            else:
+                # Pozostały czas dzielimy równo między imperia, które jeszcze nie grały
+                for index, ai_controller in enumerate(controllers):
+                    remaining = budget.remaining_ms()
+                    share = None if remaining is None else remaining / (len(controllers) - index)
+                    ai_controller.make_turn_decisions(self.ships, snapshot, share)
+
+        # 2. Aktualizacja zasobów imperii (przed wzrostem populacji!)
+        with self.profiler.phase("resources"):
+            self.update_empire_resources()
+
+        # 3. Aplikuj efekty deficytu (głód, blackout)
+        with self.profiler.phase("deficits"):
+            self._apply_deficit_effects()
+
+        # 4. Przetwarzanie badań
+        with self.profiler.phase("research"):
+            self._process_research()
+
+        # 5. Wzrost populacji i produkcja na planetach
+        with self.profiler.phase("production"):
+            self._process_planets()
+
+        self.profiler.end_turn()
+        return combat_stats
+
+    def _process_movement(self):
+        """Przesuń floty i statki o jedną turę, odkryj systemy i kolonizuj (AI)"""
+        explored_systems = set()
+
+        # Flota to jeden krok ruchu niezależnie od liczby statków
+        for fleet in self.fleets.values():
+            arrived = fleet.move_one_turn()
+            if arrived and fleet.target_system_id is not None:
+                self._explore_on_arrival(fleet.owner_id, fleet.target_system_id, explored_systems)
+                fleet.target_system_id = None
+
+        # Statki poza flotami - jeden wektorowy krok na kolumnach rejestru
+        # (statki flot nigdy nie mają is_moving, ich ruchem steruje flota)
+        arrived = self.ships.move_one_turn()
+        target_system = self.ships.column("target_system_id")
+        arrived = arrived[target_system[arrived] >= 0]
+        if not arrived.size:
+            return
+
+        # Odkrywanie: każda para (imperium, system) raz, w kolejności statków
+        owners = self.ships.column("owner_id")[arrived]
+        systems = target_system[arrived]
+        pairs = np.stack([owners, systems], axis=1)
+        _, first = np.unique(pairs, axis=0, return_index=True)
+        for owner_id, system_id in pairs[np.sort(first)].tolist():
+            self._explore_on_arrival(owner_id, system_id, explored_systems)
+
+        # Auto-kolonizacja dla AI (gracz musi nacisnąć 'C')
+        is_colony = self.ships.column("ship_type")[arrived] == ship_type_code(ShipType.COLONY_SHIP)
+        ai_colony = is_colony & np.isin(owners, list(self.ai_controllers))
+        ships_to_remove = [
+            ship for ship in self.ships.ships_at(arrived[ai_colony]) if self.try_colonize(ship)
+        ]
+
+        # Dla statków innych niż kolonizacyjne wyczyść cel po dotarciu
+        target_system[arrived[~is_colony]] = -1
+
+        # Usuń statki kolonistów po kolonizacji
+        for ship in ships_to_remove:
+            self.ships.remove(ship)
+
+    def _explore_on_arrival(self, empire_id: int, system_id: int, explored_systems: set[int]):
+        """
+        Odkryj system, do którego dotarł statek lub flota imperium
+
+        Args:
+            empire_id: Imperium, którego statek dotarł do systemu
+            system_id: System docelowy
+            explored_systems: Systemy odkryte w tej turze (uzupełniany)
+        """
+        if system_id in explored_systems:
+            return
+        target_system = self.galaxy.find_system_by_id(system_id)
+        if target_system and not target_system.is_explored_by(empire_id):
+            target_system.explore(empire_id)
+            empire = next((e for e in self.empires if e.id == empire_id), None)
+            if empire:
+                empire.explore_system(system_id)
+            explored_systems.add(system_id)
+            self._log(f"✓ {target_system.name} odkryty!")
+
+    def _process_combat(self) -> dict:
+        """Wykryj i rozwiąż bitwy"""
+        combat_stats = self.combat_manager.process_combat_turn(
+            self.ships, self.empires, self.current_turn, self.galaxy
+        )
+        self._update_fleets_after_combat(combat_stats)
+
+        # Zapisz bitwy dla UI
+        self.last_turn_battles = combat_stats['results']
+        self.stats.battles += combat_stats['battles_resolved']
+        self.stats.ships_destroyed += combat_stats['total_ships_destroyed']
+
+        # Wyświetl informacje o bitwach
+        if combat_stats['battles_resolved'] > 0:
+            self._log(f"⚔️ Rozwiązano {combat_stats['battles_resolved']} bitew!")
+            self._log(f"   Zniszczono {combat_stats['total_ships_destroyed']} statków")
+
+            # Wyświetl szczegóły bitew dla gracza
+            player_id = self.player_empire.id if self.player_empire else None
+            for result in combat_stats['results']:
+                if player_id in result.empire_ids:
+                    names = {e.id: e.name for e in self.empires}
+                    sides = " vs ".join(names.get(empire_id, "Nieznany") for empire_id in result.empire_ids)
+                    losses = " vs ".join(str(result.losses.get(empire_id, 0)) for empire_id in result.empire_ids)
+
+                    if result.winner_id >= 0:
+                        self._log(f"   🏆 {names.get(result.winner_id, 'Nieznany')} wygrał bitwę {sides} ({result.rounds} rund)")
+                    else:
+                        self._log(f"   ⚔️ Remis w bitwie {sides} ({result.rounds} rund)")
+                    self._log(f"      Straty: {losses}")
+
+        return combat_stats
+
+    def _update_fleets_after_combat(self, combat_stats: dict):
+        """Usuń zniszczone statki z flot, które walczyły, i przelicz ich statystyki"""
+        fleet_ids = {ship.fleet_id for ship in combat_stats['destroyed_ships']}
+        for result in combat_stats['results']:
+            for ships in result.survivors.values():
+                fleet_ids.update(ship.fleet_id for ship in ships)
+        fleet_ids.discard(None)
+
+        for fleet_id in fleet_ids:
+            fleet = self.fleets.get(fleet_id)
+            if fleet is None:
+                continue
+            fleet.remove_destroyed_ships()
+            if not fleet.ships:
+                del self.fleets[fleet_id]
+
+    def check_victory(self) -> Optional[Empire]:
+        """
+        Sprawdź warunek zwycięstwa (ustawia self.winner i self.victory_type)
+
+        - "conquest": tylko jedno imperium ma jeszcze planety
+        - "domination": imperium posiada co najmniej VICTORY_PLANET_SHARE
+          wszystkich planet galaktyki
+
+        Returns:
+            Optional[Empire]: Zwycięzca lub None jeśli gra trwa
+        """
+        if self.winner is not None:
+            return self.winner
+
+        holdings = [
+            (empire, len(self.galaxy.get_owned_planets(empire.id)))
+            for empire in self.empires
+        ]
+        holdings = [(empire, count) for empire, count in holdings if count > 0]
+
+        if len(holdings) == 1 and len(self.empires) > 1:
+            self.winner, self.victory_type = holdings[0][0], "conquest"
+        else:
+            needed = VICTORY_PLANET_SHARE * self.galaxy.planet_count
+            for empire, count in holdings:
+                if count >= needed:
+                    self.winner, self.victory_type = empire, "domination"
+                    break
+
+        if self.winner is not None:
+            self._log(f"🏆 {self.winner.name} wygrywa ({self.victory_type}) w turze {self.current_turn}!")
+        return self.winner
+
+    def _process_research(self):
+        """Dodaj punkty nauki do bieżących badań wszystkich imperiów"""
+        for empire in self.empires:
+            if empire.current_research and empire.total_science > 0:
+                completed = empire.add_research_points(empire.total_science)
+                if completed:
+                    tech_id = list(empire.researched_technologies)[-1]  # Ostatnio odkryta
+                    tech = TECHNOLOGIES.get(tech_id)
+                    if tech and empire.is_player:
+                        self._log(f"🔬 Odkryto technologię: {tech.name}!")
+                        self._log(f"   {tech.description}")
+                        if tech.unlocks_buildings:
+                            buildings_names = [BUILDINGS[bid].name for bid in tech.unlocks_buildings]
+                            self._log(f"   Odblokowane budynki: {', '.join(buildings_names)}")
+                        if tech.unlocks_planet_types:
+                            types_names = [pt for pt in tech.unlocks_planet_types]
+                            self._log(f"   Odblokowane typy planet: {', '.join(types_names)}")
+
+    def _process_planets(self):
+        """Wzrost populacji i produkcja na wszystkich skolonizowanych planetach"""
+        for system in self.galaxy.systems:
+            for planet in system.planets:
+                if planet.is_colonized:
+                    planet.grow_population()
+
+                    # Przetwórz produkcję
+                    completed_item = planet.process_production()
+                    if completed_item:
+                        if completed_item.item_type == "ship" and completed_item.ship_type:
+                            # Stwórz nowy statek
+                            new_ship = Ship.create_ship(
+                                ship_id=self.next_ship_id,
+                                ship_type=completed_item.ship_type,
+                                owner_id=planet.owner_id,
+                                x=system.x,
+                                y=system.y
+                            )
+                            self.ships.append(new_ship)
+                            self.next_ship_id += 1
+                            if planet.owner_id in self.ai_controllers and new_ship.ship_type in GARRISON_SHIP_TYPES:
+                                self._join_garrison(new_ship, system)
+                            self.stats.ships_built += 1
+                            self._log(f"✓ {new_ship.name} wyprodukowany w systemie {system.name}!")
+
+                        elif completed_item.item_type == "building" and completed_item.building_id:
+                            # Stwórz nowy budynek
+                            building_def = BUILDINGS.get(completed_item.building_id)
+                            if building_def:
+                                new_building = Building(
+                                    building_id=building_def.id,
+                                    name=building_def.name,
+                                    production_bonus=building_def.production_bonus,
+                                    science_bonus=building_def.science_bonus,
+                                    food_bonus=building_def.food_bonus,
+                                    energy_bonus=building_def.energy_bonus,
+                                    production_flat=building_def.production_flat,
+                                    science_flat=building_def.science_flat,
+                                    food_flat=building_def.food_flat,
+                                    energy_flat=building_def.energy_flat,
+                                    upkeep_energy=building_def.upkeep_energy,
+                                )
+                                planet.add_building(new_building)
+                                self._log(f"🏗️ {building_def.name} zbudowany na {planet.name}!")
+
+    def update_empire_resources(self):
+        """Aktualizuj całkowite zasoby wszystkich imperiów (jeden wektorowy przebieg)"""
+        if self.economy is None or not self.economy.matches(self.galaxy):
+            self.economy = EconomyTable(self.galaxy)
+
+        self.economy.refresh(self.galaxy, self.empires)
+        totals = self.economy.compute_totals(len(self.empires))
+
+        for i, empire in enumerate(self.empires):
+            total_population = float(totals['population'][i])
+
+            # Oblicz zużycie zasobów
+            food_upkeep = total_population * POPULATION_FOOD_UPKEEP
+            energy_upkeep = total_population * POPULATION_ENERGY_UPKEEP
+
+            # Dodaj zużycie energii przez budynki
+            energy_upkeep += float(totals['building_upkeep'][i])
+            # TODO: Dodać zużycie energii przez statki
+
+            # Zapisz do imperium
+            empire.total_production = float(totals['production'][i])
+            empire.total_science = float(totals['science'][i])
+            empire.total_food = float(totals['food'][i])
+            empire.total_energy = float(totals['energy'][i])
+            empire.food_upkeep = food_upkeep
+            empire.energy_upkeep = energy_upkeep
+
+            # Oblicz bilans (produkcja - zużycie)
+            empire.food_balance = empire.total_food - food_upkeep
+            empire.energy_balance = empire.total_energy - energy_upkeep
+
+            # Sprawdź deficyty
+            empire.has_starvation = empire.food_balance < 0
+            empire.has_blackout = empire.energy_balance < 0
+
+    def _apply_deficit_effects(self):
+        """Aplikuj efekty deficytu zasobów (jak w Stellaris)"""
+        for empire in self.empires:
+            # EFEKT 1: Głód (brak żywności)
+            if empire.has_starvation:
+                penalty_rate = DEFICIT_EFFECTS['food']['penalty_per_turn']
+                planets_affected = []
+
+                # Populacja umiera na wszystkich planetach
+                for system, planet in self.galaxy.get_owned_planets(empire.id):
+                    if planet.population > 0:
+                        # Spadek populacji o 5% co turę
+                        population_loss = planet.population * penalty_rate
+                        planet.population = max(1.0, planet.population - population_loss)
+                        planets_affected.append(planet.name)
+
+                if empire.is_player:
+                    self._log(f"⚠️ GŁÓD! Brak żywności ({empire.food_balance:.1f})")
+                    self._log(f"   Populacja wymiera na {len(planets_affected)} planetach!")
+                    self._log(f"   Straty: {penalty_rate*100:.0f}% populacji co turę")
+
+            # EFEKT 2: Blackout (brak energii)
+            if empire.has_blackout:
+                # Kary do produkcji i nauki
+                penalty_prod = DEFICIT_EFFECTS['energy']['penalty_production']
+                penalty_sci = DEFICIT_EFFECTS['energy']['penalty_science']
+
+                # Kary są aplikowane automatycznie w następnej turze
+                # (bo update_empire_resources() jest wywoływane przed produkcją)
+
+                if empire.is_player:
+                    self._log(f"⚠️ BLACKOUT! Brak energii ({empire.energy_balance:.1f})")
+                    self._log(f"   Produkcja: -{penalty_prod*100:.0f}%, Nauka: -{penalty_sci*100:.0f}%")
+                    self._log(f"   Buduj elektrownie lub zmniejsz populację!")
@@ -21,8 +21,8 @@ class NebulaGenerator:
         Returns:
             numpy array z wartościami 0-1
         """
-        if seed is not None:
-            np.random.seed(seed)
+        # Lokalny generator - nie nadpisuje globalnego stanu np.random
+        rng = np.random.default_rng(seed)
 
         def f(t):
             """Smoothstep interpolation"""
@@ -46,7 +46,7 @@ class NebulaGenerator:
         grid_y_int = grid_y.astype(int)
 
         # Random gradients
-        angles = 2 * np.pi * np.random.rand(res[0] + 1, res[1] + 1)
+        angles = 2 * np.pi * rng.random((res[0] + 1, res[1] + 1))
         gradients = np.dstack((np.cos(angles), np.sin(angles)))
 
         # Pobierz gradienty dla 4 rogów każdej komórki
@@ -2,13 +2,15 @@
 Game data models
 """
 from src.models.galaxy import Galaxy, StarSystem
-from src.models.planet import Planet, Building, ProductionItem
+from src.models.hyperlanes import HyperlaneGraph, Route
+from src.models.planet import Planet, Building, BuildingBonuses, ProductionItem
 from src.models.empire import Empire
 from src.models.ship import Ship, Fleet
+from src.models.ship_registry import ShipRegistry
 
 __all__ = [
-    'Galaxy', 'StarSystem',
-    'Planet', 'Building', 'ProductionItem',
+    'Galaxy', 'StarSystem', 'HyperlaneGraph', 'Route',
+    'Planet', 'Building', 'BuildingBonuses', 'ProductionItem',
     'Empire',
-    'Ship', 'Fleet'
+    'Ship', 'Fleet', 'ShipRegistry'
 ]
@@ -3,7 +3,7 @@ Model imperium (cywilizacji)
 """
 from dataclasses import dataclass, field
 from typing import Optional
-from src.config import Colors
+from src.config import Colors, PlanetType, COLONIZABLE_PLANET_TYPES
 import random
 
 
@@ -118,6 +118,15 @@ class Empire:
         """Czy imperium posiada technologię"""
         return tech_id in self.researched_technologies
 
+    def get_colonizable_planet_types(self) -> list[PlanetType]:
+        """Typy planet, które imperium umie kolonizować (podstawowe + odblokowane technologiami)"""
+        planet_types = list(COLONIZABLE_PLANET_TYPES)
+        if self.has_technology("ice_colonization"):
+            planet_types.append(PlanetType.ICE)
+        if self.has_technology("rock_colonization"):
+            planet_types.append(PlanetType.ROCK)
+        return planet_types
+
     def can_build(self, building_id: str) -> bool:
         """Sprawdź czy można budować dany budynek (technologia zbadana)"""
         from src.config import BUILDINGS
@@ -151,8 +160,10 @@ class Empire:
         )
 
     @staticmethod
-    def create_ai(empire_id: int) -> 'Empire':
-        """Stwórz imperium AI"""
+    def create_ai(empire_id: int, rng: Optional[random.Random] = None) -> 'Empire':
+        """Stwórz imperium AI (rng domyślnie: globalny moduł random)"""
+        rng = rng or random
+
         # Losowa nazwa
         names = [
             "Imperium Drakonów",
@@ -177,8 +188,8 @@ class Empire:
 
         return Empire(
             id=empire_id,
-            name=random.choice(names),
-            color=random.choice(colors),
+            name=rng.choice(names),
+            color=rng.choice(colors),
             is_player=False,
-            ai_personality=random.choice(personalities)
+            ai_personality=rng.choice(personalities)
         )
@@ -3,17 +3,182 @@ Model galaktyki i systemów gwiezdnych
 """
 from dataclasses import dataclass, field
 from typing import Optional
+from functools import partial
+import bisect
+import heapq
 import random
 import math
+import numpy as np
 
 from src.config import (
     StarType, Colors, GALAXY_WIDTH, GALAXY_HEIGHT,
     NUM_STAR_SYSTEMS, MIN_SYSTEM_DISTANCE,
+    GALAXY_GENERATION_MODE, GALAXY_MARGIN, GALAXY_HYPERLANES,
     MIN_PLANETS_PER_SYSTEM, MAX_PLANETS_PER_SYSTEM,
     STAR_SIZE_MIN, STAR_SIZE_MAX,
     PLANET_ORBIT_RADIUS_MIN, PLANET_ORBIT_RADIUS_MAX
 )
-from src.models.planet import Planet
+from src.models.planet import Planet, PLANET_TYPE_CODES
+from src.models.hyperlanes import HyperlaneGraph, Route
+
+# Gęstość (punkty na odstęp^2) osiągana przez próbkowanie Poisson-disk -
+# używana do doboru odstępu systemów do ich liczby i rozmiaru mapy
+POISSON_DISK_DENSITY = 0.6
+POISSON_DISK_ROUNDS = 16
+
+# Stałe listy do losowania (nie budujemy ich od nowa dla każdego systemu)
+STAR_TYPES = list(StarType)
+SYSTEM_NAME_PREFIXES = ["Alpha", "Beta", "Gamma", "Delta", "Epsilon", "Zeta", "Eta", "Theta"]
+SYSTEM_NAME_SUFFIXES = ["Centauri", "Orionis", "Draconis", "Phoenicis", "Cassiopeiae", "Andromedae"]
+
+
+def _poisson_disk_positions(rng: np.random.Generator, x0: float, y0: float,
+                            x1: float, y1: float, min_distance: float,
+                            rounds: int = POISSON_DISK_ROUNDS) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Próbkowanie Poisson-disk (blue noise) prostokąta [x0, x1] x [y0, y1].
+
+    Siatka tła jak w algorytmie Bridsona (bok komórki r/sqrt(2), max jeden
+    punkt na komórkę), ale zamiast kolejki aktywnych punktów losujemy
+    kandydatów dla wszystkich pustych komórek naraz. Komórki dzielimy na
+    9 faz (i % 3, j % 3) - komórki tej samej fazy są tak daleko od siebie,
+    że ich kandydaci nie mogą ze sobą kolidować, więc każdą fazę można
+    sprawdzić jednym wektorowym przebiegiem NumPy.
+
+    Args:
+        rng: Generator liczb losowych (wynik jest deterministyczny dla ziarna)
+        x0, y0, x1, y1: Granice obszaru
+        min_distance: Minimalna odległość między punktami
+        rounds: Maksymalna liczba rund losowania
+
+    Returns:
+        tuple: Tablice współrzędnych (xs, ys)
+    """
+    cell = min_distance / math.sqrt(2)
+    nx = max(1, int(math.ceil((x1 - x0) / cell)))
+    ny = max(1, int(math.ceil((y1 - y0) / cell)))
+
+    # Siatka z marginesem 2 komórek (NaN = pusta komórka)
+    grid_x = np.full((nx + 4, ny + 4), np.nan)
+    grid_y = np.full((nx + 4, ny + 4), np.nan)
+
+    # Sąsiednie komórki które mogą zawierać punkt bliżej niż min_distance
+    offsets = [
+        (dx, dy) for dx in range(-2, 3) for dy in range(-2, 3)
+        if (dx, dy) != (0, 0) and not (abs(dx) == 2 and abs(dy) == 2)
+    ]
+
+    phases = []
+    for phase_x in range(3):
+        for phase_y in range(3):
+            ix, iy = np.meshgrid(np.arange(phase_x, nx, 3), np.arange(phase_y, ny, 3), indexing='ij')
+            phases.append((ix.ravel() + 2, iy.ravel() + 2))
+
+    min_distance_sq = min_distance * min_distance
+    for _ in range(rounds):
+        added = 0
+        for phase_index, (ix, iy) in enumerate(phases):
+            # Zajęte komórki nigdy się nie zwalniają - odrzuć je na stałe
+            empty = np.isnan(grid_x[ix, iy])
+            ix, iy = ix[empty], iy[empty]
+            phases[phase_index] = (ix, iy)
+            if ix.size == 0:
+                continue
+
+            # Jeden losowy kandydat w każdej pustej komórce
+            cand_x = x0 + (ix - 2 + rng.random(ix.size)) * cell
+            cand_y = y0 + (iy - 2 + rng.random(iy.size)) * cell
+            valid = (cand_x <= x1) & (cand_y <= y1)
+
+            for dx, dy in offsets:
+                distance_sq = (grid_x[ix + dx, iy + dy] - cand_x)**2 + (grid_y[ix + dx, iy + dy] - cand_y)**2
+                valid &= ~(distance_sq < min_distance_sq)  # NaN (pusta komórka) daje False
+
+            grid_x[ix[valid], iy[valid]] = cand_x[valid]
+            grid_y[ix[valid], iy[valid]] = cand_y[valid]
+            added += int(valid.sum())
+
+        if added == 0:
+            break
+
+    occupied = ~np.isnan(grid_x)
+    return grid_x[occupied], grid_y[occupied]
+
+
+def _thin_to_count(xs: np.ndarray, ys: np.ndarray, count: int, min_distance: float) -> np.ndarray:
+    """
+    Zredukuj próbkę Poisson-disk do count punktów (eliminacja próbek).
+
+    Zamiast losowego podzbioru (dziury w losowych miejscach) usuwamy zawsze
+    punkt z najbliższej pary - nadmiar znika tam, gdzie punkty leżą
+    najciaśniej, a reszta zostaje równomiernie rozłożona. Najbliższych
+    sąsiadów szukamy na siatce o boku min_distance/sqrt(2) (najwyżej jeden
+    punkt na komórkę, sąsiad pełnej próbki jest bliżej niż 2 * min_distance,
+    czyli w promieniu 3 komórek); po usunięciu punktu nowych sąsiadów szukają
+    tylko punkty, dla których był on najbliższy.
+
+    Args:
+        xs, ys: Współrzędne punktów (co najmniej min_distance od siebie)
+        count: Ile punktów zostawić
+        min_distance: Odstęp, z jakim punkty były próbkowane
+
+    Returns:
+        np.ndarray: Indeksy zostawionych punktów, rosnąco
+    """
+    n = len(xs)
+    if n <= count:
+        return np.arange(n)
+
+    cell = min_distance / math.sqrt(2)
+    cx = ((xs - xs.min()) / cell).astype(np.intp) + 3
+    cy = ((ys - ys.min()) / cell).astype(np.intp) + 3
+    owner = np.full((int(cx.max()) + 4, int(cy.max()) + 4), -1, dtype=np.intp)
+    owner[cx, cy] = np.arange(n)
+    offsets = [(dx, dy) for dx in range(-3, 4) for dy in range(-3, 4) if (dx, dy) != (0, 0)]
+
+    # Najbliższy sąsiad każdego punktu (wektorowo po przesunięciach siatki)
+    nn_dist = np.full(n, np.inf)
+    nn_index = np.full(n, -1, dtype=np.intp)
+    for dx, dy in offsets:
+        other = owner[cx + dx, cy + dy]
+        distance = np.where(other >= 0, np.hypot(xs[other] - xs, ys[other] - ys), np.inf)
+        closer = distance < nn_dist
+        nn_dist[closer] = distance[closer]
+        nn_index[closer] = other[closer]
+
+    xs_list, ys_list = xs.tolist(), ys.tolist()
+    cx_list, cy_list = cx.tolist(), cy.tolist()
+    nn_dist, nn_index = nn_dist.tolist(), nn_index.tolist()
+    alive = [True] * n
+
+    def nearest(point: int) -> tuple[float, int]:
+        best, best_index = math.inf, -1
+        x, y, px, py = xs_list[point], ys_list[point], cx_list[point], cy_list[point]
+        for dx, dy in offsets:
+            other = int(owner[px + dx, py + dy])
+            if other >= 0:
+                distance = math.hypot(xs_list[other] - x, ys_list[other] - y)
+                if distance < best:
+                    best, best_index = distance, other
+        return best, best_index
+
+    # Kopiec (odległość do sąsiada, punkt) - nieaktualne wpisy pomijamy przy zdejmowaniu
+    heap = list(zip(nn_dist, range(n)))
+    heapq.heapify(heap)
+    for _ in range(n - count):
+        while True:
+            distance, point = heapq.heappop(heap)
+            if alive[point] and distance == nn_dist[point]:
+                break
+        alive[point] = False
+        owner[cx_list[point], cy_list[point]] = -1
+        for dx, dy in offsets:
+            other = int(owner[cx_list[point] + dx, cy_list[point] + dy])
+            if other >= 0 and nn_index[other] == point:
+                nn_dist[other], nn_index[other] = nearest(other)
+                heapq.heappush(heap, (nn_dist[other], other))
+
+    return np.flatnonzero(alive)
 
 
 @dataclass
@@ -70,16 +235,17 @@ class StarSystem:
         ]
 
     @staticmethod
-    def generate_random(system_id: int, x: float, y: float) -> 'StarSystem':
-        """Generuj losowy system gwiezdny"""
+    def generate_random(system_id: int, x: float, y: float,
+                        rng: Optional[random.Random] = None) -> 'StarSystem':
+        """Generuj losowy system gwiezdny (rng domyślnie: globalny moduł random)"""
+        rng = rng or random
+
         # Wybierz typ gwiazdy
-        star_type = random.choice(list(StarType))
-        star_size = random.randint(STAR_SIZE_MIN, STAR_SIZE_MAX)
+        star_type = rng.choice(STAR_TYPES)
+        star_size = rng.randint(STAR_SIZE_MIN, STAR_SIZE_MAX)
 
         # Generuj nazwę
-        prefixes = ["Alpha", "Beta", "Gamma", "Delta", "Epsilon", "Zeta", "Eta", "Theta"]
-        suffixes = ["Centauri", "Orionis", "Draconis", "Phoenicis", "Cassiopeiae", "Andromedae"]
-        name = f"{random.choice(prefixes)} {random.choice(suffixes)} {system_id}"
+        name = f"{rng.choice(SYSTEM_NAME_PREFIXES)} {rng.choice(SYSTEM_NAME_SUFFIXES)} {system_id}"
 
         system = StarSystem(
             id=system_id,
@@ -91,16 +257,16 @@ class StarSystem:
         )
 
         # Generuj planety
-        num_planets = random.randint(MIN_PLANETS_PER_SYSTEM, MAX_PLANETS_PER_SYSTEM)
+        num_planets = rng.randint(MIN_PLANETS_PER_SYSTEM, MAX_PLANETS_PER_SYSTEM)
         for i in range(num_planets):
             # Pozycja planety na orbicie (wokół gwiazdy)
             angle = (i / num_planets) * 2 * math.pi
-            radius = random.uniform(PLANET_ORBIT_RADIUS_MIN, PLANET_ORBIT_RADIUS_MAX)
+            radius = rng.uniform(PLANET_ORBIT_RADIUS_MIN, PLANET_ORBIT_RADIUS_MAX)
             planet_x = math.cos(angle) * radius
             planet_y = math.sin(angle) * radius
 
             planet_name = f"{system.name} {chr(65 + i)}"  # A, B, C, ...
-            planet = Planet.generate_random(planet_name, planet_x, planet_y)
+            planet = Planet.generate_random(planet_name, planet_x, planet_y, rng)
             system.planets.append(planet)
 
         return system
@@ -110,61 +276,413 @@ class StarSystem:
 class Galaxy:
     """
     Galaktyka - zbiór systemów gwiezdnych
+
+    Systemy są indeksowane siatką o boku MIN_SYSTEM_DISTANCE oraz słownikiem
+    id -> system, więc wyszukiwanie po pozycji i ID nie skanuje całej listy.
+    Nowe systemy dodawaj przez add_system() (indeks jest przebudowywany
+    automatycznie, jeśli ktoś zmodyfikuje listę systems bezpośrednio).
+
+    Galaktyka prowadzi też indeks własności empire_id -> [(system, planeta)],
+    aktualizowany przy każdym Planet.set_owner() (np. w Planet.colonize()),
+    oraz tablice NumPy wszystkich planet (planet_arrays) z aktualnym
+    właścicielem - do wektorowych zapytań o wolne planety.
+
+    Opcjonalnie galaktyka ma sieć hiperlinii (hyperlanes) - wtedy rozkazy
+    lotu do systemów (order_move) prowadzą statki po trasach zamiast
+    w linii prostej.
     """
     width: float
     height: float
     systems: list[StarSystem] = field(default_factory=list)
 
+    # Indeks przestrzenny
+    cell_size: float = field(default=MIN_SYSTEM_DISTANCE, repr=False)
+    _grid: dict[tuple[int, int], list[StarSystem]] = field(default_factory=dict, init=False, repr=False)
+    _systems_by_id: dict[int, StarSystem] = field(default_factory=dict, init=False, repr=False)
+    _system_index: dict[int, int] = field(default_factory=dict, init=False, repr=False)
+    _indexed_count: int = field(default=0, init=False, repr=False)
+
+    # Indeks własności planet
+    _planets_by_owner: dict[int, list[tuple[StarSystem, Planet]]] = field(default_factory=dict, init=False, repr=False)
+    _planet_count: int = field(default=0, init=False, repr=False)
+    _planet_entries: list[tuple[StarSystem, Planet]] = field(default_factory=list, init=False, repr=False)
+    _planet_arrays: Optional[dict[str, np.ndarray]] = field(default=None, init=False, repr=False)
+    _system_positions: Optional[tuple[np.ndarray, np.ndarray]] = field(default=None, init=False, repr=False)
+
+    # Sieć hiperlinii (None = loty w linii prostej)
+    hyperlanes: Optional[HyperlaneGraph] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        """Zbuduj indeks dla systemów przekazanych w konstruktorze"""
+        self.rebuild_index()
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        """Komórka siatki dla danej pozycji"""
+        return (int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size)))
+
+    def _index_system(self, system: StarSystem):
+        """Dodaj system do indeksu"""
+        self._grid.setdefault(self._cell(system.x, system.y), []).append(system)
+        self._systems_by_id[system.id] = system
+        self._system_index[system.id] = self._indexed_count
+        self._indexed_count += 1
+        self._planet_arrays = None
+        self._system_positions = None
+
+        for planet in system.planets:
+            planet.galaxy_index = self._planet_count
+            self._planet_count += 1
+            self._planet_entries.append((system, planet))
+            planet._owner_listener = partial(self._on_planet_owner_changed, system)
+            if planet.owner_id is not None:
+                self._add_owned_planet(planet.owner_id, system, planet)
+
+    def rebuild_index(self):
+        """Przebuduj indeks od zera (po ręcznej modyfikacji listy systems)"""
+        self._grid = {}
+        self._systems_by_id = {}
+        self._system_index = {}
+        self._indexed_count = 0
+        self._planets_by_owner = {}
+        self._planet_count = 0
+        self._planet_entries = []
+        self._planet_arrays = None
+        for system in self.systems:
+            self._index_system(system)
+
+    def _add_owned_planet(self, empire_id: int, system: StarSystem, planet: Planet):
+        """Dodaj planetę do listy imperium (lista posortowana w kolejności galaktyki)"""
+        owned = self._planets_by_owner.setdefault(empire_id, [])
+        bisect.insort(owned, (system, planet), key=lambda entry: entry[1].galaxy_index)
+
+    def _on_planet_owner_changed(self, system: StarSystem, planet: Planet,
+                                 old_owner_id: Optional[int], new_owner_id: Optional[int]):
+        """Aktualizuj indeks własności po zmianie właściciela planety"""
+        if old_owner_id is not None:
+            owned = self._planets_by_owner.get(old_owner_id, [])
+            for i, (_, owned_planet) in enumerate(owned):
+                if owned_planet is planet:
+                    del owned[i]
+                    break
+        if new_owner_id is not None:
+            self._add_owned_planet(new_owner_id, system, planet)
+        if self._planet_arrays is not None:
+            self._planet_arrays["owner"][planet.galaxy_index] = -1 if new_owner_id is None else new_owner_id
+
+    @property
+    def planet_count(self) -> int:
+        """Liczba wszystkich planet w galaktyce"""
+        self._ensure_index()
+        return self._planet_count
+
+    def get_owned_planets(self, empire_id: int) -> list[tuple[StarSystem, Planet]]:
+        """
+        Zwróć planety imperium jako pary (system, planeta) w kolejności galaktyki.
+        Zwracana lista jest indeksem - nie modyfikuj jej.
+        """
+        self._ensure_index()
+        return self._planets_by_owner.get(empire_id, [])
+
+    def system_index(self) -> dict[int, int]:
+        """
+        Indeks ID systemu -> pozycja systemu na liście systems.
+        Zwracany słownik jest indeksem - nie modyfikuj go.
+        """
+        self._ensure_index()
+        return self._system_index
+
+    def system_positions(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Pozycje wszystkich systemów jako tablice (xs, ys) w kolejności systems,
+        budowane raz. Tablice są indeksem - nie modyfikuj ich.
+        """
+        self._ensure_index()
+        if self._system_positions is None:
+            self._system_positions = (
+                np.array([system.x for system in self.systems], dtype=float),
+                np.array([system.y for system in self.systems], dtype=float)
+            )
+        return self._system_positions
+
+    def planet_entries(self) -> list[tuple[StarSystem, Planet]]:
+        """
+        Wszystkie planety jako pary (system, planeta); indeks = Planet.galaxy_index.
+        Zwracana lista jest indeksem - nie modyfikuj jej.
+        """
+        self._ensure_index()
+        return self._planet_entries
+
+    def planet_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Tablice wszystkich planet (indeks = Planet.galaxy_index), budowane raz
+
+        Returns:
+            dict: "system" - indeks systemu planety w systems,
+                  "type" - kod typu (PLANET_TYPE_CODES),
+                  "owner" - ID właściciela (-1 = wolna, aktualizowane przy
+                  każdej zmianie właściciela), "size", "richness" (bogactwo
+                  minerałów), "rare_metals", "crystals" - cechy planety.
+                  Tablice są indeksem - nie modyfikuj ich.
+        """
+        self._ensure_index()
+        if self._planet_arrays is None:
+            entries = self._planet_entries
+            self._planet_arrays = {
+                "system": np.array([self._system_index[system.id] for system, _ in entries], dtype=np.int32),
+                "type": np.array([PLANET_TYPE_CODES[planet.planet_type] for _, planet in entries], dtype=np.int8),
+                "owner": np.array([-1 if planet.owner_id is None else planet.owner_id for _, planet in entries],
+                                  dtype=np.int32),
+                "size": np.array([planet.size for _, planet in entries], dtype=float),
+                "richness": np.array([planet.mineral_richness for _, planet in entries], dtype=float),
+                "rare_metals": np.array([planet.has_rare_metals for _, planet in entries], dtype=bool),
+                "crystals": np.array([planet.has_crystals for _, planet in entries], dtype=bool),
+            }
+        return self._planet_arrays
+
+    def _ensure_index(self):
+        """Przebuduj indeks jeśli lista systems zmieniła się poza add_system()"""
+        if self._indexed_count != len(self.systems):
+            self.rebuild_index()
+
+    def add_system(self, system: StarSystem):
+        """Dodaj system do galaktyki i do indeksu"""
+        self._ensure_index()
+        self.systems.append(system)
+        self._index_system(system)
+
+    def _systems_near(self, x: float, y: float, radius: float) -> list[StarSystem]:
+        """
+        Kandydaci z komórek siatki pokrywających okrąg (x, y, radius).
+        Wynik trzeba jeszcze przefiltrować po rzeczywistej odległości.
+        """
+        self._ensure_index()
+        min_cx, min_cy = self._cell(x - radius, y - radius)
+        max_cx, max_cy = self._cell(x + radius, y + radius)
+
+        # Duży promień - taniej przejrzeć wszystkie systemy niż puste komórki
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(self._grid):
+            return self.systems
+
+        candidates = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                cell = self._grid.get((cx, cy))
+                if cell:
+                    candidates.extend(cell)
+        return candidates
+
+    def has_system_within(self, x: float, y: float, distance: float) -> bool:
+        """Czy jakiś system leży bliżej niż distance od punktu"""
+        distance_sq = distance * distance
+        for system in self._systems_near(x, y, distance):
+            if (system.x - x)**2 + (system.y - y)**2 < distance_sq:
+                return True
+        return False
+
     def get_system_at(self, x: float, y: float, tolerance: float = 20.0) -> Optional[StarSystem]:
         """Znajdź system w danej pozycji (z tolerancją kliknięcia)"""
-        for system in self.systems:
-            distance = math.sqrt((system.x - x)**2 + (system.y - y)**2)
-            if distance <= tolerance:
-                return system
-        return None
+        tolerance_sq = tolerance * tolerance
+        hits = [
+            system for system in self._systems_near(x, y, tolerance)
+            if (system.x - x)**2 + (system.y - y)**2 <= tolerance_sq
+        ]
+        if not hits:
+            return None
+        # Przy nakładaniu się wybierz najbliższy system
+        return min(hits, key=lambda s: ((s.x - x)**2 + (s.y - y)**2, s.id))
 
     def get_systems_in_range(self, x: float, y: float, range_radius: float) -> list[StarSystem]:
-        """Zwróć systemy w zasięgu od danego punktu"""
-        systems_in_range = []
-        for system in self.systems:
-            distance = math.sqrt((system.x - x)**2 + (system.y - y)**2)
-            if distance <= range_radius:
-                systems_in_range.append(system)
+        """Zwróć systemy w zasięgu od danego punktu (posortowane po ID)"""
+        range_sq = range_radius * range_radius
+        systems_in_range = [
+            system for system in self._systems_near(x, y, range_radius)
+            if (system.x - x)**2 + (system.y - y)**2 <= range_sq
+        ]
+        systems_in_range.sort(key=lambda s: s.id)
         return systems_in_range
 
+    def get_nearest_system(self, x: float, y: float) -> Optional[StarSystem]:
+        """
+        System najbliższy punktowi (przeszukuje siatkę w rosnącym promieniu)
+
+        Args:
+            x, y: Pozycja
+
+        Returns:
+            Optional[StarSystem]: Najbliższy system (przy remisie o niższym ID), None dla pustej galaktyki
+        """
+        radius = self.cell_size
+        while True:
+            candidates = self._systems_near(x, y, radius)
+            everything = candidates is self.systems
+            if candidates:
+                nearest = min(candidates, key=lambda s: ((s.x - x)**2 + (s.y - y)**2, s.id))
+                # System bliżej niż promień na pewno jest wśród kandydatów
+                if everything or (nearest.x - x)**2 + (nearest.y - y)**2 <= radius * radius:
+                    return nearest
+            elif everything:
+                return None
+            radius *= 2
+
     def find_system_by_id(self, system_id: int) -> Optional[StarSystem]:
         """Znajdź system po ID"""
-        for system in self.systems:
-            if system.id == system_id:
-                return system
-        return None
+        self._ensure_index()
+        return self._systems_by_id.get(system_id)
+
+    def build_hyperlanes(self) -> HyperlaneGraph:
+        """Zbuduj (od nowa) sieć hiperlinii dla obecnych systemów"""
+        self.hyperlanes = HyperlaneGraph.build(
+            [system.id for system in self.systems],
+            np.array([system.x for system in self.systems], dtype=float),
+            np.array([system.y for system in self.systems], dtype=float)
+        )
+        return self.hyperlanes
+
+    def find_route(self, x: float, y: float, target_system_id: int) -> Optional[Route]:
+        """
+        Trasa po hiperliniach z punktu do systemu
+
+        Statek wchodzi do sieci w systemie najbliższym swojej pozycji.
+
+        Args:
+            x, y: Pozycja startowa
+            target_system_id: System docelowy
+
+        Returns:
+            Optional[Route]: Trasa (None bez sieci hiperlinii lub gdy cel jest nieosiągalny)
+        """
+        if self.hyperlanes is None:
+            return None
+        start = self.get_nearest_system(x, y)
+        if start is None:
+            return None
+        return self.hyperlanes.find_route(start.id, target_system_id)
+
+    def order_move(self, unit, system: StarSystem) -> bool:
+        """
+        Wyślij statek lub flotę do systemu
+
+        Bez sieci hiperlinii jednostka leci w linii prostej (move_to),
+        w przeciwnym razie po trasie wyznaczonej przez HyperlaneGraph - ta sama trasa jest
+        współdzielona przez wszystkie jednostki lecące tą samą drogą.
+
+        Args:
+            unit: Statek lub flota (Ship / Fleet)
+            system: System docelowy
+
+        Returns:
+            bool: False jeśli do systemu nie ma trasy (jednostka nie rusza)
+        """
+        if self.hyperlanes is None:
+            unit.move_to(system.x, system.y, system.id)
+            return True
+        route = self.find_route(unit.x, unit.y, system.id)
+        if route is None:
+            return False
+        unit.move_along(route)
+        return True
 
     @staticmethod
-    def generate() -> 'Galaxy':
-        """Generuj galaktykę z losowo rozmieszczonymi systemami"""
+    def generate(num_systems: int = NUM_STAR_SYSTEMS, mode: str = GALAXY_GENERATION_MODE,
+                 seed: Optional[int] = None, hyperlanes: bool = GALAXY_HYPERLANES) -> 'Galaxy':
+        """
+        Generuj galaktykę z losowo rozmieszczonymi systemami
+
+        Args:
+            num_systems: Liczba systemów gwiezdnych
+            mode: "random" - losowanie z odrzucaniem (może dać mniej systemów),
+                  "poisson" - próbkowanie Poisson-disk (zawsze num_systems systemów)
+            seed: Ziarno generatora (None = losowa galaktyka)
+            hyperlanes: Czy zbudować sieć hiperlinii między systemami
+
+        Returns:
+            Galaxy: Wygenerowana galaktyka
+        """
+        if mode == "poisson":
+            galaxy = Galaxy._generate_poisson(num_systems, seed)
+        elif mode == "random":
+            galaxy = Galaxy._generate_random(num_systems, seed)
+        else:
+            raise ValueError(f"Nieznany tryb generowania galaktyki: {mode}")
+
+        if hyperlanes:
+            galaxy.build_hyperlanes()
+        return galaxy
+
+    @staticmethod
+    def _generate_random(num_systems: int, seed: Optional[int] = None) -> 'Galaxy':
+        """Generuj galaktykę losowaniem pozycji z odrzucaniem zbyt bliskich"""
+
+        rng = random.Random(seed)
         galaxy = Galaxy(width=GALAXY_WIDTH, height=GALAXY_HEIGHT)
 
         # Generuj systemy z minimalną odległością między sobą
         attempts = 0
-        max_attempts = NUM_STAR_SYSTEMS * 100
+        max_attempts = num_systems * 100
 
-        while len(galaxy.systems) < NUM_STAR_SYSTEMS and attempts < max_attempts:
+        while len(galaxy.systems) < num_systems and attempts < max_attempts:
             attempts += 1
 
             # Losowa pozycja
-            x = random.uniform(100, GALAXY_WIDTH - 100)
-            y = random.uniform(100, GALAXY_HEIGHT - 100)
-
-            # Sprawdź odległość od innych systemów
-            too_close = False
-            for existing_system in galaxy.systems:
-                distance = math.sqrt((existing_system.x - x)**2 + (existing_system.y - y)**2)
-                if distance < MIN_SYSTEM_DISTANCE:
-                    too_close = True
-                    break
+            x = rng.uniform(GALAXY_MARGIN, GALAXY_WIDTH - GALAXY_MARGIN)
+            y = rng.uniform(GALAXY_MARGIN, GALAXY_HEIGHT - GALAXY_MARGIN)
+
+            # Sprawdź odległość od innych systemów (tylko sąsiednie komórki siatki)
+            if not galaxy.has_system_within(x, y, MIN_SYSTEM_DISTANCE):
+                system = StarSystem.generate_random(len(galaxy.systems), x, y, rng)
+                galaxy.add_system(system)
+
+        return galaxy
+
+    @staticmethod
+    def _generate_poisson(num_systems: int, seed: Optional[int] = None) -> 'Galaxy':
+        """
+        Generuj galaktykę próbkowaniem Poisson-disk.
+
+        Odstęp między systemami wynika z ich liczby i rozmiaru mapy
+        (spacing = sqrt(POISSON_DISK_DENSITY * pole / num_systems)), więc
+        pełna próbka wypełnia mapę GALAXY_WIDTH x GALAXY_HEIGHT. Mapa jest
+        powiększana (z zachowaniem proporcji) tylko wtedy, gdy num_systems
+        nie mieści się na niej nawet przy MIN_SYSTEM_DISTANCE. Nadmiar punktów
+        ponad num_systems usuwa _thin_to_count (bez dziur po losowym wyborze),
+        a systemy dostają ID w losowej kolejności, żeby systemy macierzyste
+        (pierwsze ID) były rozrzucone po całej mapie.
+        """
+        rng = np.random.default_rng(seed)  # Rozmieszczenie
+        contents_rng = random.Random(seed)  # Gwiazdy i planety
+        inner_width = GALAXY_WIDTH - 2 * GALAXY_MARGIN
+        inner_height = GALAXY_HEIGHT - 2 * GALAXY_MARGIN
+
+        spacing = math.sqrt(POISSON_DISK_DENSITY * inner_width * inner_height / max(num_systems, 1))
+        scale = 1.0
+        if spacing < MIN_SYSTEM_DISTANCE:
+            # Nie mieści się nawet przy minimalnym odstępie - powiększ mapę
+            scale = MIN_SYSTEM_DISTANCE / spacing
+            spacing = MIN_SYSTEM_DISTANCE
+
+        while True:
+            width = inner_width * scale
+            height = inner_height * scale
+            xs, ys = _poisson_disk_positions(
+                rng, GALAXY_MARGIN, GALAXY_MARGIN,
+                GALAXY_MARGIN + width, GALAXY_MARGIN + height,
+                spacing
+            )
+            if len(xs) >= num_systems:
+                break
+            # Za mało punktów - zagęść próbkę, a przy minimalnym odstępie powiększ mapę
+            if spacing > MIN_SYSTEM_DISTANCE:
+                spacing = max(MIN_SYSTEM_DISTANCE, spacing * 0.97)
+            else:
+                scale *= 1.05
 
-            if not too_close:
-                system = StarSystem.generate_random(len(galaxy.systems), x, y)
-                galaxy.systems.append(system)
+        galaxy = Galaxy(width=width + 2 * GALAXY_MARGIN, height=height + 2 * GALAXY_MARGIN)
+        kept = _thin_to_count(xs, ys, num_systems, spacing)
+        chosen = kept[rng.permutation(len(kept))]
+        for system_id, index in enumerate(chosen):
+            system = StarSystem.generate_random(
+                system_id, float(xs[index]), float(ys[index]), contents_rng
+            )
+            galaxy.add_system(system)
 
         return galaxy
@@ -0,0 +1,307 @@
+"""
+Sieć hiperlinii między systemami i wyznaczanie tras (A* z pamięcią podręczną)
+"""
+import heapq
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+import numpy as np
+
+from src.config import HYPERLANE_NEIGHBOURS, PATH_CACHE_SIZE
+
+# Sąsiedztwo 3x3 komórek siatki (kandydaci na sąsiadów)
+_NEIGHBOURHOOD = tuple((dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+
+
+@dataclass(frozen=True, slots=True)
+class Route:
+    """
+    Trasa po hiperliniach: systemy od startowego do docelowego.
+
+    Router zwraca ten sam obiekt dla tej samej trasy, więc wszystkie
+    statki lecące tą samą drogą współdzielą jedną trasę (statek pamięta
+    tylko trasę i numer odcinka, patrz Ship.move_along).
+    """
+    systems: tuple[int, ...]  # ID systemów (pierwszy = start, ostatni = cel)
+    xs: tuple[float, ...]     # Pozycje kolejnych systemów
+    ys: tuple[float, ...]
+    length: float             # Długość trasy (suma długości hiperlinii)
+
+    @property
+    def destination(self) -> int:
+        """ID systemu docelowego"""
+        return self.systems[-1]
+
+
+def _gabriel_edges(xs: np.ndarray, ys: np.ndarray, neighbours: int) -> np.ndarray:
+    """
+    Krawędzie grafu Gabriela spośród najbliższych sąsiadów (wektorowo).
+
+    Krawędź u-v należy do grafu Gabriela, gdy żaden inny punkt nie leży
+    w okręgu o średnicy u-v. Punkt w takim okręgu jest bliżej u niż v,
+    więc dla v będącego r-tym sąsiadem u wystarczy sprawdzić r-1 bliższych
+    sąsiadów u. Kandydaci to `neighbours` najbliższych systemów z sąsiednich
+    komórek siatki o boku dobranym do gęstości (ok. `neighbours` systemów
+    na komórkę); krawędzie dłuższe niż bok komórki pomijamy, bo sąsiedztwo
+    3x3 nie gwarantuje dla nich kompletu świadków.
+
+    Args:
+        xs, ys: Pozycje systemów
+        neighbours: Liczba najbliższych sąsiadów - kandydatów na krawędzie
+
+    Returns:
+        np.ndarray: Krawędzie (u, v), u < v, kształt (krawędzie, 2)
+    """
+    count = len(xs)
+    width = float(xs.max() - xs.min())
+    height = float(ys.max() - ys.min())
+    area = max(width * height, max(width, height, 1.0) ** 2 / count)
+    cell = math.sqrt(area * neighbours / count)
+
+    # Komórki siatki jako jeden klucz int64 (z marginesem na sąsiadów)
+    cell_x = np.floor((xs - xs.min()) / cell).astype(np.int64) + 1
+    cell_y = np.floor((ys - ys.min()) / cell).astype(np.int64) + 1
+    rows = int(cell_y.max()) + 2
+    cell_key = cell_x * rows + cell_y
+    order = np.argsort(cell_key, kind="stable")
+    sorted_keys = cell_key[order]
+
+    # Wszystkie pary (system, system w sąsiedniej komórce) w zasięgu boku komórki
+    first_parts, second_parts = [], []
+    for dx, dy in _NEIGHBOURHOOD:
+        neighbour_key = (cell_x + dx) * rows + (cell_y + dy)
+        start = np.searchsorted(sorted_keys, neighbour_key, side="left")
+        sizes = np.searchsorted(sorted_keys, neighbour_key, side="right") - start
+        total = int(sizes.sum())
+        if total == 0:
+            continue
+        first = np.repeat(np.arange(count), sizes)
+        offsets = np.arange(total) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        second = order[np.repeat(start, sizes) + offsets]
+        keep = first != second
+        first_parts.append(first[keep])
+        second_parts.append(second[keep])
+
+    first = np.concatenate(first_parts)
+    second = np.concatenate(second_parts)
+    distance_sq = (xs[first] - xs[second]) ** 2 + (ys[first] - ys[second]) ** 2
+    close = distance_sq <= cell * cell
+    first, second, distance_sq = first[close], second[close], distance_sq[close]
+
+    # Najbliżsi sąsiedzi każdego systemu (rosnąco), -1 = brak
+    by_distance = np.lexsort((second, distance_sq, first))
+    first, second = first[by_distance], second[by_distance]
+    group_start = np.searchsorted(first, np.arange(count))
+    rank = np.arange(len(first)) - group_start[first]
+    keep = rank < neighbours
+    nearest = np.full((count, neighbours), -1, dtype=np.int64)
+    nearest[first[keep], rank[keep]] = second[keep]
+
+    edges = []
+    for r in range(neighbours):
+        u = np.flatnonzero(nearest[:, r] >= 0)
+        v = nearest[u, r]
+        mid_x = (xs[u] + xs[v]) / 2
+        mid_y = (ys[u] + ys[v]) / 2
+        radius_sq = ((xs[u] - xs[v]) ** 2 + (ys[u] - ys[v]) ** 2) / 4
+
+        # Świadkowie: bliżsi sąsiedzi u leżący wewnątrz okręgu o średnicy u-v
+        witnesses = nearest[u, :r]
+        inside = (
+            (witnesses >= 0)
+            & ((xs[witnesses] - mid_x[:, None]) ** 2 + (ys[witnesses] - mid_y[:, None]) ** 2 < radius_sq[:, None])
+        )
+        gabriel = ~inside.any(axis=1)
+        edges.append(np.stack([np.minimum(u, v)[gabriel], np.maximum(u, v)[gabriel]], axis=1))
+
+    return np.unique(np.concatenate(edges), axis=0)
+
+
+def _connect_components(xs: np.ndarray, ys: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Dołącz krawędzie tak, żeby graf był spójny
+
+    Najmniejszą składową łączymy najkrótszą krawędzią z resztą grafu,
+    aż zostanie jedna składowa (zwykle nie ma czego łączyć).
+
+    Args:
+        xs, ys: Pozycje systemów
+        edges: Krawędzie (u, v)
+
+    Returns:
+        np.ndarray: Krawędzie z dołączonymi połączeniami składowych
+    """
+    parent = list(range(len(xs)))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for u, v in edges.tolist():
+        parent[find(u)] = find(v)
+
+    extra = []
+    while True:
+        labels = np.array([find(node) for node in range(len(xs))])
+        roots, sizes = np.unique(labels, return_counts=True)
+        if len(roots) <= 1:
+            break
+        inside = np.flatnonzero(labels == roots[np.argmin(sizes)])
+        outside = np.flatnonzero(labels != roots[np.argmin(sizes)])
+        distance_sq = (xs[inside, None] - xs[outside]) ** 2 + (ys[inside, None] - ys[outside]) ** 2
+        i, j = np.unravel_index(np.argmin(distance_sq), distance_sq.shape)
+        u, v = int(inside[i]), int(outside[j])
+        extra.append((min(u, v), max(u, v)))
+        parent[find(u)] = find(v)
+
+    if not extra:
+        return edges
+    return np.concatenate([edges, np.array(extra, dtype=edges.dtype)])
+
+
+class HyperlaneGraph:
+    """
+    Graf hiperlinii: systemy to wierzchołki, hiperlinie to krawędzie.
+
+    Budowany raz przy generowaniu galaktyki (Galaxy.generate) jako podzbiór
+    grafu Gabriela (a więc i triangulacji Delaunaya) - planarny, spójny,
+    ok. 3 hiperlinie na system. Trasy wyznacza A* z heurystyką odległości
+    w linii prostej; wynik trafia do pamięci podręcznej LRU pod kluczem
+    (start, cel), więc rozkaz dla wielu statków
+    lecących tą samą drogą kosztuje jedno wyszukiwanie.
+    """
+
+    def __init__(self, system_ids: list[int], xs: np.ndarray, ys: np.ndarray,
+                 edges: np.ndarray, cache_size: int = PATH_CACHE_SIZE):
+        """
+        Args:
+            system_ids: ID systemów (wierzchołek i = system_ids[i])
+            xs, ys: Pozycje systemów
+            edges: Hiperlinie jako pary indeksów wierzchołków (u, v)
+            cache_size: Ile tras pamięta router (LRU)
+        """
+        self.system_ids = list(system_ids)
+        self.xs = np.asarray(xs, dtype=float)
+        self.ys = np.asarray(ys, dtype=float)
+        self.edges = edges
+        self.cache_size = cache_size
+        self._index_of = {system_id: index for index, system_id in enumerate(self.system_ids)}
+        self._positions = (self.xs.tolist(), self.ys.tolist())  # Listy Pythona dla pętli A*
+
+        # Lista sąsiedztwa: wierzchołek -> [(sąsiad, długość hiperlinii)]
+        self.neighbours: list[list[tuple[int, float]]] = [[] for _ in self.system_ids]
+        lengths = np.hypot(self.xs[edges[:, 0]] - self.xs[edges[:, 1]], self.ys[edges[:, 0]] - self.ys[edges[:, 1]])
+        for (u, v), length in zip(edges.tolist(), lengths.tolist()):
+            self.neighbours[u].append((v, length))
+            self.neighbours[v].append((u, length))
+
+        self._cached_search = lru_cache(maxsize=cache_size)(self._search)
+
+    @classmethod
+    def build(cls, system_ids: list[int], xs: np.ndarray, ys: np.ndarray,
+              neighbours: int = HYPERLANE_NEIGHBOURS) -> 'HyperlaneGraph':
+        """
+        Zbuduj sieć hiperlinii dla systemów
+
+        Args:
+            system_ids: ID systemów
+            xs, ys: Pozycje systemów
+            neighbours: Liczba najbliższych sąsiadów - kandydatów na hiperlinie
+
+        Returns:
+            HyperlaneGraph: Spójny graf hiperlinii
+        """
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        if len(xs) < 2:
+            edges = np.empty((0, 2), dtype=np.int64)
+        else:
+            edges = _connect_components(xs, ys, _gabriel_edges(xs, ys, neighbours))
+        return cls(system_ids, xs, ys, edges)
+
+    def __getstate__(self):
+        # Pamięć podręczna (opakowana metoda) nie jest kopiowana ani serializowana
+        state = self.__dict__.copy()
+        del state["_cached_search"]
+        del state["_positions"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._positions = (self.xs.tolist(), self.ys.tolist())
+        self._cached_search = lru_cache(maxsize=self.cache_size)(self._search)
+
+    def lanes(self) -> list[tuple[int, int]]:
+        """Hiperlinie jako pary ID systemów"""
+        ids = self.system_ids
+        return [(ids[u], ids[v]) for u, v in self.edges.tolist()]
+
+    def neighbours_of(self, system_id: int) -> list[int]:
+        """ID systemów połączonych hiperlinią z danym"""
+        return [self.system_ids[v] for v, _ in self.neighbours[self._index_of[system_id]]]
+
+    def find_route(self, from_id: int, to_id: int) -> Optional[Route]:
+        """
+        Najkrótsza trasa po hiperliniach (z pamięci podręcznej, jeśli była liczona)
+
+        Args:
+            from_id: System startowy
+            to_id: System docelowy
+
+        Returns:
+            Optional[Route]: Trasa lub None, jeśli cel jest nieosiągalny
+        """
+        return self._cached_search(from_id, to_id)
+
+    def cache_info(self):
+        """Statystyki pamięci podręcznej tras (trafienia, chybienia, rozmiar)"""
+        return self._cached_search.cache_info()
+
+    def clear_cache(self):
+        """Wyczyść pamięć podręczną tras"""
+        self._cached_search.cache_clear()
+
+    def _search(self, from_id: int, to_id: int) -> Optional[Route]:
+        """A* od from_id do to_id"""
+        start = self._index_of.get(from_id)
+        goal = self._index_of.get(to_id)
+        if start is None or goal is None:
+            return None
+
+        xs, ys = self._positions
+        goal_x, goal_y = xs[goal], ys[goal]
+        closed_nodes: set[int] = set()
+
+        best = {start: 0.0}
+        previous: dict[int, int] = {}
+        heap = [(math.hypot(xs[start] - goal_x, ys[start] - goal_y), 0.0, start)]
+        while heap:
+            _, cost, node = heapq.heappop(heap)
+            if node == goal:
+                break
+            if node in closed_nodes:
+                continue
+            closed_nodes.add(node)
+            for neighbour, length in self.neighbours[node]:
+                new_cost = cost + length
+                if neighbour not in closed_nodes and new_cost < best.get(neighbour, math.inf):
+                    best[neighbour] = new_cost
+                    previous[neighbour] = node
+                    estimate = new_cost + math.hypot(xs[neighbour] - goal_x, ys[neighbour] - goal_y)
+                    heapq.heappush(heap, (estimate, new_cost, neighbour))
+        else:
+            return None
+
+        path = [goal]
+        while path[-1] != start:
+            path.append(previous[path[-1]])
+        path.reverse()
+        return Route(
+            systems=tuple(self.system_ids[node] for node in path),
+            xs=tuple(xs[node] for node in path),
+            ys=tuple(ys[node] for node in path),
+            length=best[goal]
+        )
@@ -2,7 +2,7 @@
 Model planety
 """
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 from src.config import (
     PlanetType, Colors, ShipType, SHIP_COST,
     BASE_PRODUCTION_PER_POP, BASE_SCIENCE_PER_POP,
@@ -11,6 +11,14 @@ from src.config import (
 )
 import random
 
+# Stała lista typów do losowania (nie budujemy jej od nowa dla każdej planety)
+PLANET_TYPES = list(PlanetType)
+PLANET_TYPE_CODES = {planet_type: code for code, planet_type in enumerate(PLANET_TYPES)}  # Kody w tablicach planet
+
+# Zasoby planety - kolejność składowych w BuildingBonuses
+RESOURCE_TYPES = ('production', 'science', 'food', 'energy')
+RESOURCE_INDEX = {resource_type: i for i, resource_type in enumerate(RESOURCE_TYPES)}
+
 
 @dataclass
 class Building:
@@ -34,6 +42,29 @@ class Building:
     upkeep_energy: float = 0.0
 
 
+@dataclass(frozen=True)
+class BuildingBonuses:
+    """Zagregowane bonusy wszystkich budynków planety (kolejność RESOURCE_TYPES)"""
+    percent: tuple[float, ...]
+    flat: tuple[float, ...]
+    upkeep_energy: float = 0.0
+
+    @staticmethod
+    def from_buildings(buildings: list[Building]) -> 'BuildingBonuses':
+        """Zsumuj bonusy listy budynków"""
+        return BuildingBonuses(
+            percent=tuple(
+                sum(getattr(b, f'{resource_type}_bonus', 0.0) for b in buildings)
+                for resource_type in RESOURCE_TYPES
+            ),
+            flat=tuple(
+                sum(getattr(b, f'{resource_type}_flat', 0.0) for b in buildings)
+                for resource_type in RESOURCE_TYPES
+            ),
+            upkeep_energy=sum(b.upkeep_energy for b in buildings),
+        )
+
+
 @dataclass
 class ProductionItem:
     """Element kolejki produkcji"""
@@ -85,6 +116,16 @@ class Planet:
     # Produkcja
     production_queue: list = field(default_factory=list)
 
+    # Cache zagregowanych bonusów budynków (None = do przeliczenia)
+    _building_bonuses: Optional[BuildingBonuses] = field(default=None, init=False, repr=False, compare=False)
+
+    # Pozycja planety w galaktyce i obserwator zmian właściciela
+    # (ustawiane przez Galaxy przy indeksowaniu systemu)
+    galaxy_index: int = field(default=-1, init=False, repr=False, compare=False)
+    _owner_listener: Optional[Callable[['Planet', Optional[int], Optional[int]], None]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Inicjalizacja po utworzeniu"""
         self.max_population = self.size * 10.0  # Rozmiar 5 = max 50 populacji
@@ -120,10 +161,23 @@ class Planet:
         """
         if self.is_colonized:
             return False
-        self.owner_id = empire_id
+        self.set_owner(empire_id)
         self.population = min(initial_population, self.max_population)
         return True
 
+    def set_owner(self, empire_id: Optional[int]):
+        """
+        Zmień właściciela planety. Każda zmiana właściciela powinna iść przez
+        tę metodę, żeby indeks własności galaktyki pozostał aktualny.
+
+        Args:
+            empire_id: ID nowego właściciela (None = planeta opuszczona)
+        """
+        old_owner_id = self.owner_id
+        self.owner_id = empire_id
+        if self._owner_listener is not None and old_owner_id != empire_id:
+            self._owner_listener(self, old_owner_id, empire_id)
+
     def _calculate_resource(
         self,
         resource_type: str,
@@ -153,15 +207,11 @@ class Planet:
         planet_modifier = PLANET_TYPE_MODIFIERS.get(self.planet_type, {}).get(resource_type, 1.0)
         base_value *= planet_modifier
 
-        # Bonusy procentowe z budynków
-        bonus_attr = f'{resource_type}_bonus'
-        building_bonus = sum(getattr(b, bonus_attr, 0.0) for b in self.buildings)
-        result = base_value * (1.0 + building_bonus)
-
-        # Bonusy płaskie z budynków
-        flat_attr = f'{resource_type}_flat'
-        flat_bonus = sum(getattr(b, flat_attr, 0.0) for b in self.buildings)
-        result += flat_bonus
+        # Bonusy z budynków (procentowe i płaskie) z cache
+        bonuses = self.building_bonuses
+        index = RESOURCE_INDEX[resource_type]
+        result = base_value * (1.0 + bonuses.percent[index])
+        result += bonuses.flat[index]
 
         return result
 
@@ -209,9 +259,31 @@ class Planet:
         )
         self.production_queue.append(item)
 
+    @property
+    def building_bonuses(self) -> BuildingBonuses:
+        """Zagregowane bonusy budynków (liczone ponownie tylko po zmianie budynków)"""
+        if self._building_bonuses is None:
+            self._building_bonuses = BuildingBonuses.from_buildings(self.buildings)
+        return self._building_bonuses
+
     def add_building(self, building: Building):
         """Dodaj ukończony budynek do planety"""
         self.buildings.append(building)
+        self._building_bonuses = None
+
+    def remove_building(self, building: Building) -> bool:
+        """
+        Usuń budynek z planety
+
+        Returns:
+            bool: True jeśli budynek był na planecie
+        """
+        for i, existing in enumerate(self.buildings):
+            if existing is building:
+                del self.buildings[i]
+                self._building_bonuses = None
+                return True
+        return False
 
     def process_production(self) -> Optional[ProductionItem]:
         """Przetwórz produkcję na turę. Zwraca ukończony element jeśli jest."""
@@ -233,11 +305,13 @@ class Planet:
         return None
 
     @staticmethod
-    def generate_random(name: str, orbit_x: float, orbit_y: float) -> 'Planet':
-        """Generuj losową planetę"""
-        planet_type = random.choice(list(PlanetType))
-        size = random.randint(3, 10)
-        mineral_richness = random.uniform(0.5, 2.0)
+    def generate_random(name: str, orbit_x: float, orbit_y: float,
+                        rng: Optional[random.Random] = None) -> 'Planet':
+        """Generuj losową planetę (rng domyślnie: globalny moduł random)"""
+        rng = rng or random
+        planet_type = rng.choice(PLANET_TYPES)
+        size = rng.randint(3, 10)
+        mineral_richness = rng.uniform(0.5, 2.0)
 
         # Generuj specjalne zasoby (rzadkie!)
         has_rare_metals = False
@@ -245,15 +319,15 @@ class Planet:
 
         # Metale rzadkie: 30% szans na skalnych, 10% na innych
         if planet_type == PlanetType.ROCK:
-            has_rare_metals = random.random() < 0.3
+            has_rare_metals = rng.random() < 0.3
         elif planet_type in [PlanetType.EARTH_LIKE, PlanetType.DESERT]:
-            has_rare_metals = random.random() < 0.1
+            has_rare_metals = rng.random() < 0.1
 
         # Kryształy: BARDZO rzadkie - 5% na lodowych, 2% na skalnych
         if planet_type == PlanetType.ICE:
-            has_crystals = random.random() < 0.05
+            has_crystals = rng.random() < 0.05
         elif planet_type == PlanetType.ROCK:
-            has_crystals = random.random() < 0.02
+            has_crystals = rng.random() < 0.02
 
         return Planet(
             name=name,
@@ -4,41 +4,221 @@ Model statku kosmicznego
 from dataclasses import dataclass, field
 from typing import Optional
 from src.config import ShipType, SHIP_SPEED
+from src.models.hyperlanes import Route
 import math
+import numpy as np
+
+_SHIP_TYPES = list(ShipType)
+_SHIP_TYPE_CODES = {ship_type: code for code, ship_type in enumerate(_SHIP_TYPES)}
+
+
+def _none_to_nan(value: Optional[float]) -> float:
+    return math.nan if value is None else value
+
+
+def _nan_to_none(value: float) -> Optional[float]:
+    return None if value != value else value
+
+
+def _none_to_negative(value: Optional[int]) -> int:
+    return -1 if value is None else value
+
+
+def _negative_to_none(value: int) -> Optional[int]:
+    return None if value < 0 else value
+
+
+# Kolumny rejestru statków: nazwa -> (typ NumPy, kodowanie, dekodowanie).
+# Brak celu / floty zapisujemy jako NaN lub -1, typ statku jako indeks ShipType.
+# Trasa po hiperliniach to referencja na wspólny obiekt Route (kolumna object).
+SHIP_COLUMNS = {
+    "id": (np.int64, None, None),
+    "ship_type": (np.int8, _SHIP_TYPE_CODES.__getitem__, _SHIP_TYPES.__getitem__),
+    "owner_id": (np.int32, None, None),
+    "x": (np.float64, None, None),
+    "y": (np.float64, None, None),
+    "target_x": (np.float64, _none_to_nan, _nan_to_none),
+    "target_y": (np.float64, _none_to_nan, _nan_to_none),
+    "target_system_id": (np.int32, _none_to_negative, _negative_to_none),
+    "target_planet_index": (np.int32, _none_to_negative, _negative_to_none),
+    "max_hp": (np.float64, None, None),
+    "current_hp": (np.float64, None, None),
+    "attack": (np.float64, None, None),
+    "defense": (np.float64, None, None),
+    "speed": (np.float64, None, None),
+    "is_moving": (np.bool_, None, None),
+    "fleet_id": (np.int32, _none_to_negative, _negative_to_none),
+    "route": (object, None, None),
+    "route_leg": (np.int32, None, None),
+}
+
+
+def _start_route(unit, route: Route):
+    """
+    Ustaw jednostce (statek / flota) lot po trasie
+
+    Jednostka stojąca w systemie startowym leci od razu do następnego
+    systemu trasy, każda inna najpierw do systemu startowego.
+    target_system_id to przez cały lot cel końcowy trasy.
+    """
+    at_start = unit.x == route.xs[0] and unit.y == route.ys[0]
+    leg = 1 if at_start and len(route.systems) > 1 else 0
+    unit.route = route
+    unit.route_leg = leg
+    unit.target_x = route.xs[leg]
+    unit.target_y = route.ys[leg]
+    unit.target_system_id = route.destination
+    unit.is_moving = True
+
+
+def _next_leg(unit) -> bool:
+    """
+    Po dotarciu do systemu trasy ustaw cel na kolejny system
+
+    Returns:
+        bool: True jeśli jednostka leci dalej, False jeśli to koniec trasy
+              (wtedy trasa jest czyszczona)
+    """
+    route = unit.route
+    if route is None:
+        return False
+    leg = unit.route_leg + 1
+    if leg >= len(route.systems):
+        unit.route = None
+        unit.route_leg = 0
+        return False
+    unit.route_leg = leg
+    unit.target_x = route.xs[leg]
+    unit.target_y = route.ys[leg]
+    unit.is_moving = True
+    return True
+
+
+def ship_type_code(ship_type: ShipType) -> int:
+    """Kod typu statku w kolumnie "ship_type" rejestru"""
+    return _SHIP_TYPE_CODES[ship_type]
+
+
+def _column(name: str) -> property:
+    """Pole statku: wartość w wierszu rejestru albo w słowniku odłączonego statku"""
+    _, encode, decode = SHIP_COLUMNS[name]
+
+    def fget(self):
+        store = self._store
+        if store is None:
+            return self._row[name]
+        value = store.columns[name].item(self._row)
+        return value if decode is None else decode(value)
+
+    def fset(self, value):
+        store = self._store
+        if store is None:
+            self._row[name] = value
+        else:
+            store.columns[name][self._row] = value if encode is None else encode(value)
+
+    return property(fget, fset)
 
 
-@dataclass
 class Ship:
     """
     Statek kosmiczny
+
+    Statek to lekki uchwyt na wiersz rejestru (ShipRegistry), który trzyma
+    pola wszystkich statków w kolumnach NumPy - dzięki temu ruch i inne
+    operacje na wszystkich statkach są wektorowe, a statek zajmuje w pamięci
+    kilkadziesiąt bajtów zamiast pełnego obiektu z atrybutami. Statek spoza
+    rejestru (np. świeżo utworzony) trzyma pola w zwykłym słowniku;
+    rejestr przenosi je do kolumn przy dodaniu i z powrotem przy usunięciu.
+
+    Statki porównujemy po tożsamości - ten sam statek to ten sam uchwyt.
     """
-    id: int
-    name: str
-    ship_type: ShipType
-    owner_id: int
+    __slots__ = ("_store", "_row")
+
+    id = _column("id")
+    ship_type = _column("ship_type")
+    owner_id = _column("owner_id")
 
     # Pozycja
-    x: float
-    y: float
+    x = _column("x")
+    y = _column("y")
 
     # Cel ruchu
-    target_x: Optional[float] = None
-    target_y: Optional[float] = None
-    target_system_id: Optional[int] = None
+    target_x = _column("target_x")
+    target_y = _column("target_y")
+    target_system_id = _column("target_system_id")
+    target_planet_index = _column("target_planet_index")  # Planeta do kolonizacji (Planet.galaxy_index)
 
     # Parametry
-    max_hp: float = 100.0
-    current_hp: float = 100.0
-    attack: float = 10.0
-    defense: float = 5.0
-    speed: float = field(init=False)
+    max_hp = _column("max_hp")
+    current_hp = _column("current_hp")
+    attack = _column("attack")
+    defense = _column("defense")
+    speed = _column("speed")
 
     # Stan
-    is_moving: bool = False
+    is_moving = _column("is_moving")
+    fleet_id = _column("fleet_id")  # Flota, do której należy statek (ruchem steruje flota)
+
+    # Lot po hiperliniach: wspólna trasa i numer systemu trasy, do którego lecimy
+    route = _column("route")
+    route_leg = _column("route_leg")
+
+    def __init__(self, id: int, name: str, ship_type: ShipType, owner_id: int, x: float, y: float,
+                 target_x: Optional[float] = None, target_y: Optional[float] = None,
+                 target_system_id: Optional[int] = None, max_hp: float = 100.0,
+                 current_hp: float = 100.0, attack: float = 10.0, defense: float = 5.0,
+                 is_moving: bool = False, fleet_id: Optional[int] = None):
+        self._store = None
+        self._row = {
+            "id": id, "name": name, "ship_type": ship_type, "owner_id": owner_id,
+            "x": x, "y": y, "target_x": target_x, "target_y": target_y,
+            "target_system_id": target_system_id, "target_planet_index": None, "max_hp": max_hp, "current_hp": current_hp,
+            "attack": attack, "defense": defense, "speed": SHIP_SPEED.get(ship_type, 2.0),
+            "is_moving": is_moving, "fleet_id": fleet_id, "route": None, "route_leg": 0,
+        }
 
-    def __post_init__(self):
-        """Inicjalizacja po utworzeniu"""
-        self.speed = SHIP_SPEED.get(self.ship_type, 2.0)
+    @classmethod
+    def from_values(cls, values: dict) -> 'Ship':
+        """Stwórz odłączony statek ze słownika pól (patrz values)"""
+        ship = cls.__new__(cls)
+        ship._store = None
+        ship._row = dict(values)
+        return ship
+
+    def values(self) -> dict:
+        """Słownik wszystkich pól statku (kopia - niezależna od rejestru)"""
+        if self._store is None:
+            return dict(self._row)
+        values = {name: getattr(self, name) for name in SHIP_COLUMNS}
+        values["name"] = self.name
+        return values
+
+    def __reduce__(self):
+        # Kopia (pickle, deepcopy) to odłączony statek z tymi samymi polami
+        return Ship.from_values, (self.values(),)
+
+    def __repr__(self) -> str:
+        return (f"Ship(id={self.id}, name={self.name!r}, ship_type={self.ship_type}, "
+                f"owner_id={self.owner_id}, x={self.x}, y={self.y}, current_hp={self.current_hp})")
+
+    @property
+    def name(self) -> str:
+        """Nazwa statku (rejestr pamięta tylko nazwy inne niż domyślna)"""
+        store = self._store
+        if store is None:
+            return self._row["name"]
+        return store.names.get(self.id) or default_ship_name(self.ship_type, self.id)
+
+    @name.setter
+    def name(self, value: str):
+        store = self._store
+        if store is None:
+            self._row["name"] = value
+        elif value == default_ship_name(self.ship_type, self.id):
+            store.names.pop(self.id, None)
+        else:
+            store.names[self.id] = value
 
     @property
     def is_alive(self) -> bool:
@@ -51,11 +231,19 @@ class Ship:
         return (self.current_hp / self.max_hp) * 100.0
 
     def move_to(self, x: float, y: float, system_id: Optional[int] = None):
-        """Ustaw cel ruchu"""
+        """Ustaw cel ruchu (lot w linii prostej)"""
         self.target_x = x
         self.target_y = y
         self.target_system_id = system_id
+        self.target_planet_index = None
         self.is_moving = True
+        self.route = None
+        self.route_leg = 0
+
+    def move_along(self, route: Route):
+        """Ustaw lot po trasie hiperlinii (Galaxy.order_move)"""
+        _start_route(self, route)
+        self.target_planet_index = None
 
     def update_movement(self, delta_time: float = 1.0):
         """Zaktualizuj pozycję statku (wywołaj co turę/klatkę)"""
@@ -67,10 +255,12 @@ class Ship:
         dy = self.target_y - self.y
         distance = math.sqrt(dx**2 + dy**2)
 
-        # Jeśli jesteśmy blisko celu, zatrzymaj się
+        # Jeśli jesteśmy blisko celu, zatrzymaj się (lub leć do kolejnego systemu trasy)
         if distance < self.speed * delta_time:
             self.x = self.target_x
             self.y = self.target_y
+            if _next_leg(self):
+                return
             self.is_moving = False
             self.target_x = None
             self.target_y = None
@@ -96,10 +286,12 @@ class Ship:
         # Prędkość w turze (speed * 10 dla lepszego balansu)
         move_distance = self.speed * 10
 
-        # Jeśli jesteśmy blisko celu, zatrzymaj się
+        # Jeśli jesteśmy blisko celu, zatrzymaj się (lub leć do kolejnego systemu trasy)
         if distance <= move_distance:
             self.x = self.target_x
             self.y = self.target_y
+            if _next_leg(self):
+                return False  # System po drodze - lecimy dalej
             self.is_moving = False
             self.target_x = None
             self.target_y = None
@@ -141,7 +333,7 @@ class Ship:
 
         ship = Ship(
             id=ship_id,
-            name=f"{ship_type.value} #{ship_id}",
+            name=default_ship_name(ship_type, ship_id),
             ship_type=ship_type,
             owner_id=owner_id,
             x=x,
@@ -155,54 +347,169 @@ class Ship:
         return ship
 
 
-@dataclass
+def default_ship_name(ship_type: ShipType, ship_id: int) -> str:
+    """Domyślna nazwa statku (Ship.create_ship)"""
+    return f"{ship_type.value} #{ship_id}"
+
+
+@dataclass(eq=False)
 class Fleet:
     """
-    Flota - grupa statków
+    Flota - grupa statków poruszająca się i walcząca jako jedna jednostka.
+
+    Flota ma własną pozycję i cel ruchu; statki floty stoją w jej pozycji
+    i same się nie ruszają (is_moving == False). Ruch floty to jeden krok
+    z prędkością najwolniejszego statku, niezależnie od liczby statków.
+    Statystyki zbiorcze są zapamiętane - po zmianie składu lub HP statków
+    (np. po bitwie) trzeba wywołać refresh().
+
+    Porównanie po tożsamości (eq=False): dwie floty o tym samym składzie
+    to nadal różne floty, a `in` na liście flot nie porównuje list statków.
     """
     id: int
     name: str
     owner_id: int
     ships: list[Ship] = field(default_factory=list)
 
-    @property
-    def x(self) -> float:
-        """Pozycja X floty (średnia pozycja statków)"""
-        if not self.ships:
-            return 0.0
-        return sum(s.x for s in self.ships) / len(self.ships)
-
-    @property
-    def y(self) -> float:
-        """Pozycja Y floty (średnia pozycja statków)"""
-        if not self.ships:
-            return 0.0
-        return sum(s.y for s in self.ships) / len(self.ships)
+    # Pozycja (wspólna dla wszystkich statków floty)
+    x: float = 0.0
+    y: float = 0.0
 
-    @property
-    def total_attack(self) -> float:
-        """Całkowita siła ataku floty"""
-        return sum(s.attack for s in self.ships if s.is_alive)
+    # Cel ruchu
+    target_x: Optional[float] = None
+    target_y: Optional[float] = None
+    target_system_id: Optional[int] = None
+    is_moving: bool = False
+    route: Optional[Route] = None  # Trasa po hiperliniach (jak Ship.route)
+    route_leg: int = 0
 
-    @property
-    def total_defense(self) -> float:
-        """Całkowita obrona floty"""
-        return sum(s.defense for s in self.ships if s.is_alive)
+    # Zapamiętane statystyki (patrz refresh)
+    speed: float = field(init=False, default=0.0)
+    total_attack: float = field(init=False, default=0.0)
+    total_defense: float = field(init=False, default=0.0)
+    total_hp: float = field(init=False, default=0.0)
+    flagship_type: Optional[ShipType] = field(init=False, default=None)
+    _ship_ids: Optional[np.ndarray] = field(init=False, default=None, repr=False)  # ID statków (patrz _place_ships)
 
-    def add_ship(self, ship: Ship):
-        """Dodaj statek do floty"""
+    def __post_init__(self):
+        """Ustaw statki w pozycji floty i policz statystyki"""
+        ships, self.ships = self.ships, []
+        for ship in ships:
+            self._attach(ship)
+        self.refresh()
+
+    def __len__(self) -> int:
+        return len(self.ships)
+
+    def refresh(self):
+        """Przelicz statystyki zbiorcze (po zmianie składu lub HP statków)"""
+        alive = [s for s in self.ships if s.is_alive]
+        self.speed = min((s.speed for s in alive), default=0.0)
+        self.total_attack = sum(s.attack for s in alive)
+        self.total_defense = sum(s.defense for s in alive)
+        self.total_hp = sum(s.current_hp for s in alive)
+        flagship = max(alive, key=lambda s: s.attack, default=None)
+        self.flagship_type = flagship.ship_type if flagship else None
+        self._ship_ids = np.array([s.id for s in self.ships], dtype=np.int64)
+
+    def _attach(self, ship: Ship):
+        """Dołącz statek: przejmij jego ruch i ustaw go w pozycji floty"""
+        if not self.ships:
+            self.x, self.y = ship.x, ship.y
+        ship.x, ship.y = self.x, self.y
+        ship.is_moving = False
+        ship.target_x = ship.target_y = ship.target_system_id = ship.route = None
+        ship.fleet_id = self.id
         self.ships.append(ship)
 
-    def remove_destroyed_ships(self):
-        """Usuń zniszczone statki"""
+    def add_ship(self, ship: Ship):
+        """Dodaj statek do floty (statek przenosi się do pozycji floty)"""
+        self._attach(ship)
+        self.refresh()
+
+    def remove_ship(self, ship: Ship):
+        """Odłącz statek od floty (zostaje w pozycji floty)"""
+        self.ships = [s for s in self.ships if s is not ship]
+        ship.fleet_id = None
+        self.refresh()
+
+    def remove_destroyed_ships(self) -> int:
+        """
+        Usuń zniszczone statki
+
+        Returns:
+            int: Liczba usuniętych statków
+        """
+        count = len(self.ships)
         self.ships = [s for s in self.ships if s.is_alive]
+        self.refresh()
+        return count - len(self.ships)
 
     def move_to(self, x: float, y: float, system_id: Optional[int] = None):
-        """Przenieś całą flotę"""
-        for ship in self.ships:
-            ship.move_to(x, y, system_id)
+        """Ustaw cel ruchu całej floty (lot w linii prostej)"""
+        self.target_x = x
+        self.target_y = y
+        self.target_system_id = system_id
+        self.is_moving = True
+        self.route = None
+        self.route_leg = 0
+
+    def move_along(self, route: Route):
+        """Ustaw lot całej floty po trasie hiperlinii (Galaxy.order_move)"""
+        _start_route(self, route)
+
+    def _advance(self, move_distance: float) -> bool:
+        """Przesuń flotę o move_distance w stronę celu; True jeśli dotarła"""
+        dx = self.target_x - self.x
+        dy = self.target_y - self.y
+        distance = math.sqrt(dx**2 + dy**2)
+
+        if distance <= move_distance:
+            self.x = self.target_x
+            self.y = self.target_y
+            arrived = not _next_leg(self)
+            if arrived:
+                self.is_moving = False
+                self.target_x = None
+                self.target_y = None
+        else:
+            self.x += dx / distance * move_distance
+            self.y += dy / distance * move_distance
+            arrived = False
+
+        self._place_ships()
+        return arrived
+
+    def _place_ships(self):
+        """
+        Ustaw statki floty w jej pozycji (wykrywanie bitew, rysowanie)
+
+        Statki z rejestru dostają pozycję jednym zapisem do kolumn x/y
+        (wiersze z ID zapamiętanych w refresh), a nie zapisem pola
+        każdego statku; pojedynczo ustawiamy tylko statki spoza rejestru.
+        """
+        store = self.ships[0]._store if self.ships else None
+        ships = self.ships
+        if store is not None:
+            rows = store.rows_of(self._ship_ids)
+            attached = rows >= 0
+            store.columns["x"][rows[attached]] = self.x
+            store.columns["y"][rows[attached]] = self.y
+            if attached.all():
+                return
+            ships = [ship for ship, in_store in zip(self.ships, attached.tolist()) if not in_store]
+        for ship in ships:
+            ship.x = self.x
+            ship.y = self.y
 
     def update_movement(self, delta_time: float = 1.0):
-        """Zaktualizuj ruch wszystkich statków"""
-        for ship in self.ships:
-            ship.update_movement(delta_time)
+        """Zaktualizuj pozycję floty (wywołaj co klatkę)"""
+        if not self.is_moving or self.target_x is None or self.target_y is None:
+            return
+        self._advance(self.speed * delta_time)
+
+    def move_one_turn(self):
+        """Przesuń flotę o jedną turę (jak Ship.move_one_turn)"""
+        if not self.is_moving or self.target_x is None or self.target_y is None:
+            return
+        return self._advance(self.speed * 10)
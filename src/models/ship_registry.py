@@ -0,0 +1,226 @@
+"""
+Rejestr statków w grze - kolumny NumPy indeksowane po ID
+"""
+from typing import Iterable, Iterator, Optional
+import numpy as np
+from src.models.ship import Ship, SHIP_COLUMNS, default_ship_name
+
+
+class ShipRegistry:
+    """
+    Wszystkie statki w grze jako struktura tablic (structure of arrays).
+
+    Pola statków (pozycja, cel, prędkość, HP, właściciel, typ...) leżą
+    w kolumnach NumPy - wiersz to jeden statek, a obiekt Ship jest tylko
+    uchwytem na wiersz. Dzięki temu operacje na wszystkich statkach
+    (ruch, wykrywanie bitew, filtrowanie po właścicielu) są wektorowe.
+
+    Zachowuje się jak lista statków (iteracja, len, append, remove, `in`).
+    Usuwanie i sprawdzanie obecności działa w O(1): pozycję bierzemy
+    z tablicy ID -> wiersz, a na miejsce usuniętego statku przenosimy
+    ostatni (swap-remove). Kolejność statków po usunięciu się zmienia,
+    ale pozostaje deterministyczna. Usunięty statek zachowuje swoje pola
+    (dostaje je z powrotem w słowniku), więc można go dalej odczytywać.
+    """
+
+    def __init__(self, ships: Iterable[Ship] = (), capacity: int = 1024):
+        """
+        Args:
+            ships: Początkowe statki
+            capacity: Początkowa pojemność kolumn (rośnie automatycznie)
+        """
+        self.columns: dict[str, np.ndarray] = {
+            name: np.empty(capacity, dtype=dtype) for name, (dtype, _, _) in SHIP_COLUMNS.items()
+        }
+        self.names: dict[int, str] = {}  # Tylko nazwy inne niż domyślna
+        self._ships: list[Ship] = []  # Uchwyty; indeks = wiersz w kolumnach
+        self._row_of_id = np.full(capacity, -1, dtype=np.int32)
+        for ship in ships:
+            self.append(ship)
+
+    def __len__(self) -> int:
+        return len(self._ships)
+
+    def __iter__(self) -> Iterator[Ship]:
+        return iter(self._ships)
+
+    def __getitem__(self, index: int) -> Ship:
+        return self._ships[index]
+
+    def __contains__(self, ship: Ship) -> bool:
+        return ship._store is self
+
+    def __reduce__(self):
+        # Kopia (pickle, deepcopy) to nowy rejestr z kopiami statków
+        return ShipRegistry, (list(self._ships),)
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Kolumna pola wszystkich statków (widok - zapis zmienia statki)
+
+        Args:
+            name: Nazwa pola (patrz SHIP_COLUMNS)
+
+        Returns:
+            np.ndarray: Wartości w kolejności statków w rejestrze
+        """
+        return self.columns[name][:len(self._ships)]
+
+    def ships_at(self, rows: np.ndarray) -> list[Ship]:
+        """Statki w podanych wierszach kolumn"""
+        ships = self._ships
+        return [ships[row] for row in rows.tolist()]
+
+    def owned_by(self, owner_id: int) -> list[Ship]:
+        """Statki imperium (w kolejności rejestru)"""
+        return self.ships_at(np.flatnonzero(self.column("owner_id") == owner_id))
+
+    def rows_of(self, ship_ids: np.ndarray) -> np.ndarray:
+        """Wiersze statków o podanych ID w kolumnach (-1 dla statków spoza rejestru)"""
+        rows = np.full(len(ship_ids), -1, dtype=np.intp)
+        known = (ship_ids >= 0) & (ship_ids < len(self._row_of_id))
+        rows[known] = self._row_of_id[ship_ids[known]]
+        return rows
+
+    def get(self, ship_id: int) -> Optional[Ship]:
+        """Znajdź statek po ID (None jeśli go nie ma)"""
+        if not 0 <= ship_id < len(self._row_of_id):
+            return None
+        row = self._row_of_id[ship_id]
+        return self._ships[row] if row >= 0 else None
+
+    def _grow(self, rows: int, ship_id: int):
+        """Powiększ kolumny (podwajanie) i tablicę ID -> wiersz"""
+        capacity = len(self.columns["id"])
+        if rows > capacity:
+            capacity = max(rows, 2 * capacity)
+            for name, column in self.columns.items():
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:len(self._ships)] = column[:len(self._ships)]
+                self.columns[name] = grown
+
+        if ship_id >= len(self._row_of_id):
+            grown = np.full(max(ship_id + 1, 2 * len(self._row_of_id)), -1, dtype=np.int32)
+            grown[:len(self._row_of_id)] = self._row_of_id
+            self._row_of_id = grown
+
+    def append(self, ship: Ship):
+        """
+        Dodaj statek (jego pola trafiają do kolumn)
+
+        Raises:
+            ValueError: Jeśli statek o tym ID już jest w rejestrze albo statek
+                        należy do innego rejestru
+        """
+        if ship._store is not None:
+            raise ValueError(f"Statek o ID {ship.id} należy już do rejestru")
+        values = ship._row
+        ship_id = values["id"]
+        if ship_id < 0:
+            raise ValueError(f"ID statku musi być nieujemne (jest {ship_id})")
+        if self.get(ship_id) is not None:
+            raise ValueError(f"Statek o ID {ship_id} już jest w rejestrze")
+
+        row = len(self._ships)
+        self._grow(row + 1, ship_id)
+        for name, (_, encode, _) in SHIP_COLUMNS.items():
+            value = values[name]
+            self.columns[name][row] = value if encode is None else encode(value)
+        if values["name"] != default_ship_name(values["ship_type"], ship_id):
+            self.names[ship_id] = values["name"]
+
+        self._row_of_id[ship_id] = row
+        self._ships.append(ship)
+        ship._store, ship._row = self, row
+
+    def discard(self, ship: Ship) -> bool:
+        """
+        Usuń statek, jeśli jest w rejestrze (O(1))
+
+        Returns:
+            bool: True jeśli statek został usunięty
+        """
+        if ship not in self:
+            return False
+
+        # Odłącz uchwyt - pola wracają do słownika statku
+        values = ship.values()
+        row = ship._row
+        self.names.pop(values["id"], None)
+        self._row_of_id[values["id"]] = -1
+        ship._store, ship._row = None, values
+
+        # Ostatni statek zajmuje zwolniony wiersz
+        last = self._ships.pop()
+        if last is not ship:
+            last_row = len(self._ships)
+            for column in self.columns.values():
+                column[row] = column[last_row]
+            self._ships[row] = last
+            last._row = row
+            self._row_of_id[last.id] = row
+        return True
+
+    def remove(self, ship: Ship):
+        """
+        Usuń statek (O(1))
+
+        Raises:
+            ValueError: Jeśli statku nie ma w rejestrze (jak list.remove)
+        """
+        if not self.discard(ship):
+            raise ValueError(f"Statku o ID {ship.id} nie ma w rejestrze")
+
+    def move_one_turn(self) -> np.ndarray:
+        """
+        Przesuń wszystkie statki w ruchu o jedną turę (Ship.move_one_turn wektorowo)
+
+        Returns:
+            np.ndarray: Wiersze statków, które dotarły do celu (rosnąco); statki
+                        w systemie po drodze na trasie lecą dalej i nie są tu zwracane
+        """
+        x, y = self.column("x"), self.column("y")
+        target_x, target_y = self.column("target_x"), self.column("target_y")
+        is_moving = self.column("is_moving")
+
+        moving = np.flatnonzero(is_moving & ~np.isnan(target_x) & ~np.isnan(target_y))
+        dx = target_x[moving] - x[moving]
+        dy = target_y[moving] - y[moving]
+        distance = np.sqrt(dx**2 + dy**2)
+
+        # Prędkość w turze (speed * 10 dla lepszego balansu)
+        move_distance = self.column("speed")[moving] * 10
+
+        # Blisko celu - zatrzymaj się w celu
+        reached = distance <= move_distance
+        arrived = moving[reached]
+        x[arrived] = target_x[arrived]
+        y[arrived] = target_y[arrived]
+        is_moving[arrived] = False
+        target_x[arrived] = np.nan
+        target_y[arrived] = np.nan
+
+        # Statki na trasie hiperlinii lecą do kolejnego systemu trasy (Ship._next_leg)
+        route, route_leg = self.column("route"), self.column("route_leg")
+        routed = arrived[np.not_equal(route[arrived], None)]
+        continuing = []
+        for row in routed.tolist():
+            ship_route, leg = route[row], int(route_leg[row]) + 1
+            if leg < len(ship_route.systems):
+                route_leg[row] = leg
+                target_x[row] = ship_route.xs[leg]
+                target_y[row] = ship_route.ys[leg]
+                is_moving[row] = True
+                continuing.append(row)
+            else:
+                route[row] = None
+                route_leg[row] = 0
+
+        # Reszta - ruch w kierunku celu
+        en_route = ~reached
+        rows = moving[en_route]
+        x[rows] += dx[en_route] / distance[en_route] * move_distance[en_route]
+        y[rows] += dy[en_route] / distance[en_route] * move_distance[en_route]
+        if continuing:
+            arrived = np.setdiff1d(arrived, continuing, assume_unique=True)
+        return arrived
@@ -4,8 +4,10 @@ System renderowania grafiki
 import pygame
 import random
 from typing import Optional
+import numpy as np
 from src.models.galaxy import Galaxy, StarSystem
-from src.models.ship import Ship
+from src.models.hyperlanes import HyperlaneGraph
+from src.models.ship import Ship, Fleet
 from src.ui.camera import Camera
 from src.config import Colors, WINDOW_WIDTH, WINDOW_HEIGHT, BACKGROUND_STARS
 from src.graphics.starfield import Starfield
@@ -65,6 +67,9 @@ class Renderer:
 
     def draw_galaxy(self, galaxy: Galaxy, player_empire_id: int, empire_colors: dict[int, tuple]):
         """Rysuj całą galaktykę"""
+        if galaxy.hyperlanes is not None:
+            self.draw_hyperlanes(galaxy.hyperlanes)
+
         for system in galaxy.systems:
             # Sprawdź czy system jest odkryty przez gracza
             if system.is_explored_by(player_empire_id):
@@ -73,6 +78,26 @@ class Renderer:
                 # Rysuj jako nieodkryty (mgła wojny)
                 self.draw_unexplored_system(system)
 
+    def draw_hyperlanes(self, hyperlanes: HyperlaneGraph):
+        """Rysuj hiperlinie (tylko te, które przecinają ekran)"""
+        edges = hyperlanes.edges
+        if len(edges) == 0:
+            return
+
+        # Transformacja kamery dla wszystkich systemów naraz
+        screen_x, screen_y = self.camera.world_to_screen(hyperlanes.xs, hyperlanes.ys)
+        x1, y1 = screen_x[edges[:, 0]], screen_y[edges[:, 0]]
+        x2, y2 = screen_x[edges[:, 1]], screen_y[edges[:, 1]]
+        visible = (
+            (np.maximum(x1, x2) >= 0) & (np.minimum(x1, x2) <= WINDOW_WIDTH) &
+            (np.maximum(y1, y2) >= 0) & (np.minimum(y1, y2) <= WINDOW_HEIGHT)
+        )
+
+        for start_x, start_y, end_x, end_y in zip(x1[visible].tolist(), y1[visible].tolist(),
+                                                  x2[visible].tolist(), y2[visible].tolist()):
+            pygame.draw.line(self.screen, Colors.HYPERLANE,
+                             (int(start_x), int(start_y)), (int(end_x), int(end_y)), 1)
+
     def draw_star_system(self, system: StarSystem, empire_colors: dict[int, tuple]):
         """Rysuj system gwiezdny"""
         # Przekształć współrzędne świata na ekran
@@ -202,20 +227,42 @@ class Renderer:
 
     def draw_ship(self, ship: Ship, empire_color: tuple, is_selected: bool = False):
         """Rysuj statek (NOWY RENDERER z 3D-style sprites!)"""
-        screen_x, screen_y = self.camera.world_to_screen(ship.x, ship.y)
+        self._draw_unit(ship, ship.ship_type, empire_color, is_selected)
+
+    def draw_fleet(self, fleet: Fleet, empire_color: tuple, is_selected: bool = False):
+        """Rysuj flotę jako jeden statek (typ okrętu flagowego) z licznikiem statków"""
+        if fleet.flagship_type is None:
+            return
+        self._draw_unit(fleet, fleet.flagship_type, empire_color, is_selected)
+
+        screen_x, screen_y = self.camera.world_to_screen(fleet.x, fleet.y)
+        if self._is_visible(screen_x, screen_y):
+            self._draw_count_badge(screen_x, screen_y, len(fleet), empire_color)
+
+    def _draw_unit(self, unit, ship_type, empire_color: tuple, is_selected: bool):
+        """
+        Rysuj statek lub flotę w jej pozycji, z linią do celu ruchu
+
+        Args:
+            unit: Ship lub Fleet (x, y, is_moving, target_x, target_y)
+            ship_type: Typ statku wyznaczający sprite
+            empire_color: Kolor imperium
+            is_selected: Czy jednostka jest wybrana
+        """
+        screen_x, screen_y = self.camera.world_to_screen(unit.x, unit.y)
 
         if not self._is_visible(screen_x, screen_y):
             return
 
         # Oblicz rotację statku (jeśli się porusza)
         rotation = 0.0
-        if ship.is_moving and ship.target_x is not None and ship.target_y is not None:
+        if unit.is_moving and unit.target_x is not None and unit.target_y is not None:
             rotation = ShipRenderer.calculate_ship_rotation(
-                ship.x, ship.y, ship.target_x, ship.target_y
+                unit.x, unit.y, unit.target_x, unit.target_y
             )
 
             # Rysuj linię do celu
-            target_screen_x, target_screen_y = self.camera.world_to_screen(ship.target_x, ship.target_y)
+            target_screen_x, target_screen_y = self.camera.world_to_screen(unit.target_x, unit.target_y)
             # Linia przerywaną (dla lepszego wyglądu)
             line_color = tuple(max(0, c - 60) for c in empire_color)
             pygame.draw.line(self.screen, line_color,
@@ -227,24 +274,35 @@ class Renderer:
             self.screen,
             int(screen_x),
             int(screen_y),
-            ship.ship_type,
+            ship_type,
             empire_color,
             zoom=self.camera.zoom,
             is_selected=is_selected,
-            is_moving=ship.is_moving,
+            is_moving=unit.is_moving,
             rotation=rotation
         )
 
-    def draw_ships(self, ships: list[Ship], empires: dict[int, tuple], selected_ships: list[Ship] = None):
-        """Rysuj wszystkie statki"""
+    def draw_ships(self, ships: list[Ship], empires: dict[int, tuple], selected_ships: list[Ship] = None,
+                   fleets: list[Fleet] = (), selected_fleets: list[Fleet] = ()):
+        """
+        Rysuj wszystkie statki i floty
+
+        Statki należące do flot nie są rysowane osobno - flota to jeden
+        sprite z licznikiem, więc nie trzeba ich grupować co klatkę.
+        """
         if selected_ships is None:
             selected_ships = []
 
+        for fleet in fleets:
+            self.draw_fleet(fleet, empires.get(fleet.owner_id, Colors.WHITE), fleet in selected_fleets)
+
         # Grupuj statki według pozycji (dla licznika stackowanych statków)
         from collections import defaultdict
         ship_counts = defaultdict(list)
 
         for ship in ships:
+            if ship.fleet_id is not None:
+                continue
             empire_color = empires.get(ship.owner_id, Colors.WHITE)
             is_selected = ship in selected_ships
             self.draw_ship(ship, empire_color, is_selected)
@@ -263,23 +321,26 @@ class Renderer:
                 if not self._is_visible(screen_x, screen_y):
                     continue
 
-                # Rysuj badge z licznikiem
-                count_text = str(len(ships_at_location))
-                empire_color = empires.get(ship.owner_id, Colors.WHITE)
+                self._draw_count_badge(screen_x, screen_y, len(ships_at_location),
+                                       empires.get(ship.owner_id, Colors.WHITE))
+
+    def _draw_count_badge(self, screen_x: float, screen_y: float, count: int, empire_color: tuple):
+        """Rysuj badge z liczbą statków (prawy górny róg statku)"""
+        count_text = str(count)
 
-                # Pozycja badge (prawy górny róg statku)
-                badge_x = int(screen_x + 8 * self.camera.zoom)
-                badge_y = int(screen_y - 8 * self.camera.zoom)
+        # Pozycja badge (prawy górny róg statku)
+        badge_x = int(screen_x + 8 * self.camera.zoom)
+        badge_y = int(screen_y - 8 * self.camera.zoom)
 
-                # Tło badge (ciemnoszare kółko)
-                badge_radius = 8
-                pygame.draw.circle(self.screen, (40, 40, 40), (badge_x, badge_y), badge_radius)
-                pygame.draw.circle(self.screen, empire_color, (badge_x, badge_y), badge_radius, 1)
+        # Tło badge (ciemnoszare kółko)
+        badge_radius = 8
+        pygame.draw.circle(self.screen, (40, 40, 40), (badge_x, badge_y), badge_radius)
+        pygame.draw.circle(self.screen, empire_color, (badge_x, badge_y), badge_radius, 1)
 
-                # Tekst z liczbą
-                count_surface = self.font_small.render(count_text, True, Colors.WHITE)
-                count_rect = count_surface.get_rect(center=(badge_x, badge_y))
-                self.screen.blit(count_surface, count_rect)
+        # Tekst z liczbą
+        count_surface = self.font_small.render(count_text, True, Colors.WHITE)
+        count_rect = count_surface.get_rect(center=(badge_x, badge_y))
+        self.screen.blit(count_surface, count_rect)
 
     def highlight_system(self, system: StarSystem):
         """Podświetl wybrany system"""
@@ -1,7 +1,7 @@
 """
-Narzdzia pomocnicze (placeholder dla przyszBego rozwoju)
+Narzędzia pomocnicze
 """
-# Ten moduB jest przeznaczony na funkcje pomocnicze, ktre zostan dodane w przyszBo[ci
-# np. funkcje matematyczne, konwersje, helpery
+from src.utils.profiler import TurnProfiler, TurnTrace, PhaseStats
+from src.utils.rng import RandomStreams
 
-__all__ = []
+__all__ = ['TurnProfiler', 'TurnTrace', 'PhaseStats', 'RandomStreams']
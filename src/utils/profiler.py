@@ -0,0 +1,186 @@
+"""
+Profiler tur - czas, liczba wywołań i alokacje pamięci dla faz end_turn
+"""
+import csv
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from typing import Optional
+
+
+@dataclass
+class PhaseStats:
+    """Statystyki jednej fazy w jednej turze"""
+    wall_time: float = 0.0   # Sekundy
+    calls: int = 0
+    alloc_bytes: int = 0     # Przyrost zaalokowanej pamięci (tylko z tracemalloc)
+    alloc_peak: int = 0      # Szczyt pamięci ponad stan początkowy fazy
+
+
+@dataclass
+class TurnTrace:
+    """Pomiary jednej tury"""
+    turn: int
+    wall_time: float = 0.0
+    phases: dict[str, PhaseStats] = field(default_factory=dict)
+
+
+class TurnProfiler:
+    """
+    Instrumentacja przetwarzania tur.
+
+    Domyślnie wyłączony - wtedy phase() jest pustym context managerem.
+    Włącz w trakcie gry przez enable(); alokacje są mierzone przez
+    tracemalloc tylko gdy track_allocations=True (spowalnia grę).
+    """
+
+    def __init__(self, enabled: bool = False, track_allocations: bool = False, window: int = 20):
+        """
+        Args:
+            enabled: Czy od razu zbierać pomiary
+            track_allocations: Czy mierzyć alokacje przez tracemalloc
+            window: Liczba ostatnich tur w podsumowaniu kroczącym
+        """
+        self.enabled = False
+        self.track_allocations = False
+        self.window = window
+        self.traces: list[TurnTrace] = []
+        self._current: Optional[TurnTrace] = None
+        self._turn_start = 0.0
+        self._started_tracemalloc = False
+
+        if enabled:
+            self.enable(track_allocations)
+
+    def enable(self, track_allocations: bool = False):
+        """Włącz zbieranie pomiarów"""
+        self.enabled = True
+        self.track_allocations = track_allocations
+        if track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def disable(self):
+        """Wyłącz zbieranie pomiarów (zebrane tury zostają)"""
+        self.enabled = False
+        self._current = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self.track_allocations = False
+
+    def reset(self):
+        """Usuń zebrane pomiary"""
+        self.traces.clear()
+        self._current = None
+
+    def begin_turn(self, turn: int):
+        """Rozpocznij pomiar tury"""
+        if not self.enabled:
+            return
+        self._current = TurnTrace(turn=turn)
+        self._turn_start = time.perf_counter()
+
+    def end_turn(self) -> Optional[TurnTrace]:
+        """Zakończ pomiar tury i zapisz go"""
+        if not self.enabled or self._current is None:
+            return None
+        trace = self._current
+        trace.wall_time = time.perf_counter() - self._turn_start
+        self.traces.append(trace)
+        self._current = None
+        return trace
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Zmierz fazę tury
+
+        Args:
+            name: Nazwa fazy (np. 'movement', 'combat')
+        """
+        if not self.enabled or self._current is None:
+            yield
+            return
+
+        tracking = self.track_allocations and tracemalloc.is_tracing()
+        if tracking:
+            start_memory, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stats = self._current.phases.setdefault(name, PhaseStats())
+            stats.wall_time += elapsed
+            stats.calls += 1
+            if tracking:
+                end_memory, peak_memory = tracemalloc.get_traced_memory()
+                stats.alloc_bytes += end_memory - start_memory
+                stats.alloc_peak = max(stats.alloc_peak, peak_memory - start_memory)
+
+    def phase_totals(self, last_turns: Optional[int] = None) -> dict[str, PhaseStats]:
+        """
+        Zsumuj statystyki faz z ostatnich tur
+
+        Args:
+            last_turns: Liczba ostatnich tur (None = wszystkie)
+
+        Returns:
+            dict: Nazwa fazy -> zsumowane PhaseStats
+        """
+        traces = self.traces if last_turns is None else self.traces[-last_turns:]
+        totals: dict[str, PhaseStats] = {}
+        for trace in traces:
+            for name, stats in trace.phases.items():
+                total = totals.setdefault(name, PhaseStats())
+                total.wall_time += stats.wall_time
+                total.calls += stats.calls
+                total.alloc_bytes += stats.alloc_bytes
+                total.alloc_peak = max(total.alloc_peak, stats.alloc_peak)
+        return totals
+
+    def summary(self) -> str:
+        """Tekstowe podsumowanie ostatnich `window` tur (najwolniejsze fazy na górze)"""
+        traces = self.traces[-self.window:]
+        if not traces:
+            return "Profiler: brak pomiarów"
+
+        turn_time = sum(t.wall_time for t in traces)
+        totals = self.phase_totals(self.window)
+        lines = [
+            f"Profiler - tury {traces[0].turn}-{traces[-1].turn} "
+            f"(średnio {turn_time / len(traces) * 1000:.2f} ms/turę)",
+            f"  {'faza':<14}{'ms/turę':>10}{'udział':>9}{'wywołania':>11}{'alok. KB':>10}",
+        ]
+        for name, stats in sorted(totals.items(), key=lambda item: -item[1].wall_time):
+            share = stats.wall_time / turn_time * 100 if turn_time > 0 else 0.0
+            lines.append(
+                f"  {name:<14}{stats.wall_time / len(traces) * 1000:>10.2f}{share:>8.1f}%"
+                f"{stats.calls:>11}{stats.alloc_bytes / 1024:>10.1f}"
+            )
+        return "\n".join(lines)
+
+    def print_summary(self):
+        """Wypisz podsumowanie kroczące"""
+        print(self.summary())
+
+    def export_json(self, path: str):
+        """Zapisz pomiary wszystkich tur do pliku JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([asdict(trace) for trace in self.traces], f, indent=2)
+
+    def export_csv(self, path: str):
+        """Zapisz pomiary do pliku CSV (jeden wiersz na turę i fazę)"""
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["turn", "phase", "wall_time", "calls", "alloc_bytes", "alloc_peak", "turn_wall_time"])
+            for trace in self.traces:
+                for name, stats in trace.phases.items():
+                    writer.writerow([
+                        trace.turn, name, f"{stats.wall_time:.9f}", stats.calls,
+                        stats.alloc_bytes, stats.alloc_peak, f"{trace.wall_time:.9f}"
+                    ])
@@ -0,0 +1,80 @@
+"""
+Deterministyczne strumienie liczb losowych wyprowadzane z jednego ziarna gry
+"""
+import random
+from typing import Optional
+import numpy as np
+
+
+class RandomStreams:
+    """
+    Niezależne generatory liczb losowych dla podsystemów gry.
+
+    Każdy strumień jest identyfikowany kluczem (np. "combat", "ai.3")
+    i zależy tylko od ziarna gry oraz klucza - nie od kolejności tworzenia
+    strumieni ani od tego, ile liczb zużyły inne podsystemy. Dzięki temu
+    ta sama gra z tym samym ziarnem przebiega identycznie, a workery
+    w osobnych procesach nie dzielą globalnego stanu `random`.
+    """
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: Nieujemne ziarno gry (None = losowe, zapisane w self.seed)
+        """
+        if seed is None:
+            seed = int(np.random.SeedSequence().generate_state(1, np.uint64)[0])
+        if seed < 0:
+            raise ValueError(f"Ziarno musi być nieujemne: {seed}")
+
+        self.seed = seed
+        self._streams: dict[str, random.Random] = {}
+        self._generators: dict[str, np.random.Generator] = {}
+
+    def _sequence(self, key: str) -> np.random.SeedSequence:
+        """SeedSequence dla klucza (ziarno gry + bajty klucza)"""
+        return np.random.SeedSequence([self.seed, *key.encode("utf-8")])
+
+    def derive_seed(self, key: str) -> int:
+        """
+        Wyprowadź ziarno (64 bity) dla podsystemu
+
+        Args:
+            key: Nazwa podsystemu
+
+        Returns:
+            int: Ziarno zależne tylko od ziarna gry i klucza
+        """
+        return int(self._sequence(key).generate_state(1, np.uint64)[0])
+
+    def stream(self, key: str) -> random.Random:
+        """
+        Pobierz generator `random.Random` dla podsystemu
+
+        Args:
+            key: Nazwa podsystemu (np. "combat", "empires")
+
+        Returns:
+            random.Random: Ten sam obiekt przy każdym wywołaniu z tym kluczem
+        """
+        if key not in self._streams:
+            self._streams[key] = random.Random(self.derive_seed(key))
+        return self._streams[key]
+
+    def generator(self, key: str) -> np.random.Generator:
+        """
+        Pobierz generator NumPy dla podsystemu
+
+        Args:
+            key: Nazwa podsystemu
+
+        Returns:
+            np.random.Generator: Ten sam obiekt przy każdym wywołaniu z tym kluczem
+        """
+        if key not in self._generators:
+            self._generators[key] = np.random.default_rng(self._sequence(key))
+        return self._generators[key]
+
+    def empire_stream(self, subsystem: str, empire_id: int) -> random.Random:
+        """Strumień podsystemu osobny dla każdego imperium (np. AI)"""
+        return self.stream(f"{subsystem}.{empire_id}")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Batch Runner Test
+Runs a few short headless AI-only games through the process pool
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from src.game_logic.batch import BatchConfig, run_game, run_batch
+from src.game_logic import Simulation
+
+
+CONFIG = BatchConfig(systems=15, empires=3, max_turns=20)
+
+
+def test_ai_only_game_summary():
+    """An AI-only game runs to the turn limit and replays from its seed"""
+    first = run_game(0, 42, CONFIG)
+    second = run_game(0, 42, CONFIG)
+
+    assert first.turns == CONFIG.max_turns
+    assert first.winner_id == -1 and first.victory == ""
+    assert first.ships_built == second.ships_built
+    assert first.battles == second.battles
+    assert first.techs == second.techs
+    assert set(first.phase_times) >= {"movement", "combat", "ai"}
+    print(f"✅ AI-only game: {first.ships_built} ships built, {first.techs} techs in {first.turns} turns")
+
+
+def test_victory_by_conquest():
+    """The last empire holding planets wins by conquest"""
+    sim = Simulation(verbose=False, seed=1)
+    sim.initialize_new_game(num_systems=10, num_ai_empires=2, ai_only=True)
+    assert sim.player_empire is None
+    assert sim.check_victory() is None
+
+    loser = sim.empires[1]
+    for _, planet in list(sim.galaxy.get_owned_planets(loser.id)):
+        planet.set_owner(None)
+
+    assert sim.check_victory() is sim.empires[0]
+    assert sim.victory_type == "conquest"
+    print("✅ Conquest victory detected")
+
+
+def test_batch_writes_columns():
+    """run_batch writes one row per game to the columnar .npz file"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "batch.npz")
+        writer = run_batch(3, CONFIG, path, base_seed=7, workers=2, flush_every=2)
+        assert writer.rows == 3
+
+        with np.load(path) as data:
+            assert sorted(data["game"].tolist()) == [0, 1, 2]
+            assert len(set(data["seed"].tolist())) == 3
+            assert (data["turns"] == CONFIG.max_turns).all()
+            assert "phase_combat" in data.files
+    print("✅ Batch of 3 games written to columnar file")
+
+
+if __name__ == "__main__":
+    test_ai_only_game_summary()
+    test_victory_by_conquest()
+    test_batch_writes_columns()
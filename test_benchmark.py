@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark Harness Test
+Runs a tiny seeded benchmark scenario and checks the JSON report
+"""
+
+import json
+import os
+import tempfile
+
+import benchmark
+
+
+TINY = benchmark.Scenario("tiny", systems=30, empires=3, ships=200, turns=5, seed=7)
+
+
+def test_scenario_is_reproducible():
+    """The same seed builds the same game and plays out the same turns"""
+    first = benchmark.run_scenario(TINY)
+    second = benchmark.run_scenario(TINY)
+
+    assert first["galaxy_generate"]["systems"] == TINY.systems
+    assert first["ships_at_start"] == TINY.ships
+    assert first["turns"] == TINY.turns
+    assert first["ships_at_end"] == second["ships_at_end"]
+    print(f"✅ Seeded scenario reproducible ({first['ships_at_end']} ships after {TINY.turns} turns)")
+
+
+def test_json_report_and_compare():
+    """main() writes a JSON report that can be compared against itself"""
+    benchmark.SCENARIOS["tiny"] = TINY
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bench.json")
+            assert benchmark.main(["--scenarios", "tiny", "--output", path]) == 0
+
+            with open(path, encoding="utf-8") as f:
+                report = json.load(f)
+            result = report["scenarios"]["tiny"]
+            for metric in ("end_turn", "process_combat_turn", "make_turn_decisions"):
+                assert result[metric]["turns_per_second"] > 0, metric
+            assert "commit" in report["environment"]
+
+            lines = benchmark.compare_results(report, report)
+            assert not any(line.endswith("REGRESJA") for line in lines)
+    finally:
+        del benchmark.SCENARIOS["tiny"]
+    print("✅ Benchmark JSON report written and compared")
+
+
+if __name__ == "__main__":
+    test_scenario_is_reproducible()
+    test_json_report_and_compare()
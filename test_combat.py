@@ -119,9 +119,338 @@ def test_combat_one_on_one():
     print("\n✅ Test passed!")
 
 
+def test_battle_detection_range():
+    """Test wykrywania bitew w zasięgu COMBAT_RANGE"""
+    print("\n\n=== TEST 4: Wykrywanie bitew (zasięg walki) ===")
+    war = {(0, 1): "war", (0, 2): "war", (1, 2): "peace"}
+
+    # 1 jednostka odstępu na granicy dawnej siatki 50x50 - bitwa
+    ships = [
+        Ship.create_ship(40, ShipType.FIGHTER, 0, 74.9, 100),
+        Ship.create_ship(41, ShipType.FIGHTER, 1, 75.1, 100),
+    ]
+    assert len(Battle.detect_battles(ships, war)) == 1, "Statki 0.2 jednostki od siebie muszą walczyć"
+
+    # Poza zasięgiem - brak bitwy
+    ships = [
+        Ship.create_ship(42, ShipType.FIGHTER, 0, 0, 0),
+        Ship.create_ship(43, ShipType.FIGHTER, 1, Battle.COMBAT_RANGE + 1, 0),
+    ]
+    assert Battle.detect_battles(ships, war) == [], "Statki poza zasięgiem nie walczą"
+
+    # Pokój - brak bitwy
+    ships = [
+        Ship.create_ship(44, ShipType.FIGHTER, 1, 0, 0),
+        Ship.create_ship(45, ShipType.FIGHTER, 2, 10, 0),
+    ]
+    assert Battle.detect_battles(ships, war) == [], "Imperia w pokoju nie walczą"
+
+    # Łańcuch: 1 <- 80 -> 0 <- 80 -> 2 to jedno starcie (1 i 2 są w pokoju)
+    ships = [
+        Ship.create_ship(46, ShipType.FIGHTER, 1, 0, 0),
+        Ship.create_ship(47, ShipType.FIGHTER, 0, 80, 0),
+        Ship.create_ship(48, ShipType.FIGHTER, 2, 160, 0),
+    ]
+    battles = Battle.detect_battles(ships, war)
+    assert len(battles) == 1, "Jedno starcie - jedna bitwa wszystkich frakcji"
+    assert sorted(battles[0].factions) == [0, 1, 2]
+    assert not battles[0].are_hostile(1, 2), "Frakcje w pokoju nie strzelają do siebie"
+
+    print("\n✅ Test passed!")
+
+
+def test_multi_faction_battle():
+    """Test bitwy trzech imperiów w jednym starciu"""
+    print("\n\n=== TEST 5: Bitwa wielostronna (3 imperia w stanie wojny) ===")
+    from src.combat.combat_manager import CombatManager
+    from src.models.empire import Empire
+    from src.models.ship_registry import ShipRegistry
+
+    empires = [Empire(id=i, name=f"Imperium {i}", color=(255, 255, 255)) for i in range(3)]
+    for empire in empires:
+        for other in empires:
+            if other is not empire:
+                empire.set_relation(other.id, "war")
+
+    ships = ShipRegistry(
+        Ship.create_ship(owner * 10 + i, ShipType.FIGHTER, owner, 500 + owner, 500)
+        for owner in range(3) for i in range(4)
+    )
+    manager = CombatManager()
+    stats = manager.process_combat_turn(ships, empires)
+
+    assert stats['battles_created'] == 1, "Jedno starcie - jedna bitwa, nie trzy pary"
+    result = stats['results'][0]
+    print(f"Rundy: {result.rounds}, straty: {result.losses}, zwycięzca: {result.winner_id}")
+    assert sorted(result.empire_ids) == [0, 1, 2]
+    assert sum(result.losses.values()) == stats['total_ships_destroyed'] == result.total_ships_destroyed
+    assert stats['total_ships_destroyed'] == 12 - len(ships), "Każdy zniszczony statek usunięty raz"
+    assert all(ship.is_alive for ship in ships)
+    alive_factions = [empire_id for empire_id, survivors in result.survivors.items() if survivors]
+    assert len(alive_factions) <= 1 or result.rounds == Battle.MAX_ROUNDS
+
+    print("\n✅ Test passed!")
+
+
+def test_vectorized_resolver_matches_scalar():
+    """Test resolvera tablicowego - te same statystyki wyników co pętla po statkach"""
+    print("\n\n=== TEST 6: Resolver tablicowy vs rundy po statkach ===")
+    import random
+    import src.combat.battle as battle_module
+
+    def fleets():
+        attackers = [Ship.create_ship(i, ShipType.FIGHTER, 0, 0, 0) for i in range(30)]
+        attackers += [Ship.create_ship(100 + i, ShipType.CRUISER, 0, 0, 0) for i in range(6)]
+        defenders = [Ship.create_ship(200 + i, ShipType.FIGHTER, 1, 0, 0) for i in range(24)]
+        defenders += [Ship.create_ship(300 + i, ShipType.CRUISER, 1, 0, 0) for i in range(9)]
+        return attackers, defenders
+
+    def run(min_ships: int, battles: int = 200) -> tuple[float, float, float]:
+        original = Battle.VECTORIZED_MIN_SHIPS
+        Battle.VECTORIZED_MIN_SHIPS = min_ships
+        try:
+            rng = random.Random(7)
+            results = [Battle(*fleets(), 0, 0, rng=rng).execute_full_battle() for _ in range(battles)]
+        finally:
+            Battle.VECTORIZED_MIN_SHIPS = original
+        return (
+            sum(r.attacker_ships_destroyed for r in results) / battles,
+            sum(r.defender_ships_destroyed for r in results) / battles,
+            sum(r.rounds for r in results) / battles,
+        )
+
+    scalar = run(min_ships=10**9)
+    vectorized = run(min_ships=0)
+    print(f"Straty atakujących / obrońców / rundy (pętla):    {scalar[0]:.2f} / {scalar[1]:.2f} / {scalar[2]:.2f}")
+    print(f"Straty atakujących / obrońców / rundy (tablicowo): {vectorized[0]:.2f} / {vectorized[1]:.2f} / {vectorized[2]:.2f}")
+    for before, after in zip(scalar, vectorized):
+        assert abs(before - after) <= 0.1 * before + 0.5, (scalar, vectorized)
+
+    # Doomstack - tysiące statków rozstrzyga resolver tablicowy w jednym wywołaniu
+    # (czas bitwy mierzy benchmark.py, pomiar "large_battle")
+    resolved = []
+    original = battle_module.ArrayBattle
+
+    class RecordingArrayBattle(original):
+        def resolve(self, max_rounds: int) -> int:
+            rounds = super().resolve(max_rounds)
+            resolved.append(rounds)
+            return rounds
+
+    attackers = [Ship.create_ship(i, ShipType.FIGHTER, 0, 0, 0) for i in range(3000)]
+    defenders = [Ship.create_ship(10_000 + i, ShipType.CRUISER, 1, 0, 0) for i in range(1500)]
+    battle_module.ArrayBattle = RecordingArrayBattle
+    try:
+        battle = Battle(attackers, defenders, 0, 0, rng=random.Random(1))
+        result = battle.execute_full_battle()
+    finally:
+        battle_module.ArrayBattle = original
+    print(f"Doomstack 3000 vs 1500: {result.rounds} rund")
+    assert resolved == [result.rounds] and battle.is_over
+    assert result.attacker_ships_destroyed + result.defender_ships_destroyed > 0
+    assert len(result.attacker_survivors) == 3000 - result.attacker_ships_destroyed
+    assert len(result.defender_survivors) == 1500 - result.defender_ships_destroyed
+    assert all(ship.is_alive for ship in result.attacker_survivors + result.defender_survivors)
+    assert all(ship.current_hp == 0 for ship in attackers + defenders if not ship.is_alive)
+
+    print("\n✅ Test passed!")
+
+
+def test_parallel_battles_match_sequential():
+    """Test równoległego rozstrzygania bitew - wynik taki sam jak po kolei"""
+    print("\n\n=== TEST 7: Bitwy w puli procesów vs po kolei ===")
+    import copy
+    import random
+    from src.combat.combat_manager import CombatManager
+    from src.models.empire import Empire
+    from src.models.ship_registry import ShipRegistry
+
+    empires = [Empire(id=i, name=f"Imperium {i}", color=(255, 255, 255)) for i in range(2)]
+    empires[0].set_relation(1, "war")
+    empires[1].set_relation(0, "war")
+
+    # 8 frontów daleko od siebie
+    ships = ShipRegistry(
+        Ship.create_ship(front * 100 + owner * 50 + i, ShipType.FIGHTER, owner, front * 1000, owner * 10)
+        for front in range(8) for owner in range(2) for i in range(20)
+    )
+    sequential_ships = copy.deepcopy(ships)
+
+    parallel = CombatManager(rng=random.Random(11), workers=2)
+    try:
+        parallel_stats = parallel.process_combat_turn(ships, empires)
+    finally:
+        parallel.close()
+    sequential_stats = CombatManager(rng=random.Random(11)).process_combat_turn(sequential_ships, empires)
+
+    print(f"Bitwy: {parallel_stats['battles_resolved']}, zniszczone: {parallel_stats['total_ships_destroyed']}")
+    assert parallel_stats['battles_resolved'] == sequential_stats['battles_resolved'] == 8
+    assert parallel_stats['total_ships_destroyed'] == sequential_stats['total_ships_destroyed'] > 0
+    assert [(s.id, s.current_hp) for s in ships] == [(s.id, s.current_hp) for s in sequential_ships]
+    assert [r.rounds for r in parallel_stats['results']] == [r.rounds for r in sequential_stats['results']]
+
+    print("\n✅ Test passed!")
+
+
+def test_lanchester_matches_exact():
+    """Test szacowania Lanchestera - średnie straty i rundy jak w dokładnej bitwie"""
+    print("\n\n=== TEST 8: Model Lanchestera vs dokładna bitwa ===")
+    import random
+
+    def fleets():
+        attackers = [Ship.create_ship(i, ShipType.FIGHTER, 0, 0, 0) for i in range(200)]
+        attackers += [Ship.create_ship(1000 + i, ShipType.CRUISER, 0, 0, 0) for i in range(40)]
+        defenders = [Ship.create_ship(2000 + i, ShipType.FIGHTER, 1, 0, 0) for i in range(150)]
+        defenders += [Ship.create_ship(3000 + i, ShipType.CRUISER, 1, 0, 0) for i in range(60)]
+        defenders += [Ship.create_ship(4000 + i, ShipType.BATTLESHIP, 1, 0, 0) for i in range(8)]
+        return attackers, defenders
+
+    def run(make_fleets, resolution: str, battles: int = 40) -> tuple[float, float, float]:
+        rng = random.Random(3)
+        results = []
+        for _ in range(battles):
+            battle = Battle(*make_fleets(), 0, 0, rng=random.Random(rng.getrandbits(64)))
+            battle.resolution = resolution
+            results.append(battle.execute_full_battle())
+        return (
+            sum(r.attacker_ships_destroyed for r in results) / battles,
+            sum(r.defender_ships_destroyed for r in results) / battles,
+            sum(r.rounds for r in results) / battles,
+        )
+
+    exact = run(fleets, Battle.EXACT)
+    estimated = run(fleets, Battle.LANCHESTER)
+    print(f"Straty atakujących / obrońców / rundy (dokładnie): {exact[0]:.1f} / {exact[1]:.1f} / {exact[2]:.1f}")
+    print(f"Straty atakujących / obrońców / rundy (Lanchester): {estimated[0]:.1f} / {estimated[1]:.1f} / {estimated[2]:.1f}")
+    for before, after in zip(exact, estimated):
+        assert abs(before - after) <= 0.1 * before + 1, (exact, estimated)
+
+    # Wyrównana bitwa dokładnie od progu LANCHESTER_MIN_SHIPS (tyle statków musi mieć bitwa szacowana)
+    from src.config import LANCHESTER_MIN_SHIPS
+
+    def even_fleets():
+        share = LANCHESTER_MIN_SHIPS / 270
+        attackers = [Ship.create_ship(i, ShipType.FIGHTER, 0, 0, 0) for i in range(round(100 * share))]
+        attackers += [Ship.create_ship(1000 + i, ShipType.CRUISER, 0, 0, 0) for i in range(round(30 * share))]
+        defenders = [Ship.create_ship(2000 + i, ShipType.FIGHTER, 1, 0, 0) for i in range(round(115 * share))]
+        defenders += [Ship.create_ship(3000 + i, ShipType.CRUISER, 1, 0, 0) for i in range(round(25 * share))]
+        return attackers, defenders
+
+    assert sum(map(len, even_fleets())) == LANCHESTER_MIN_SHIPS
+    exact = run(even_fleets, Battle.EXACT)
+    estimated = run(even_fleets, Battle.LANCHESTER)
+    print(f"Wyrównana bitwa {LANCHESTER_MIN_SHIPS} statków (dokładnie / Lanchester): "
+          f"{exact[0]:.1f} / {exact[1]:.1f} / {exact[2]:.1f} vs {estimated[0]:.1f} / {estimated[1]:.1f} / {estimated[2]:.1f}")
+    assert exact[0] > 0 and exact[1] > 0, "Obie strony ponoszą straty"
+    for before, after in zip(exact, estimated):
+        assert abs(before - after) <= 0.1 * before + 1, (exact, estimated)
+
+    # Wynik zapisany w statkach: zniszczone mają 0 HP, ocalali są uszkodzeni
+    attackers, defenders = fleets()
+    battle = Battle(attackers, defenders, 0, 0, rng=random.Random(1))
+    battle.resolution = Battle.LANCHESTER
+    result = battle.execute_full_battle()
+    assert len(result.defender_survivors) == len(defenders) - result.defender_ships_destroyed
+    assert all(0 < ship.current_hp <= ship.max_hp for ship in result.defender_survivors)
+    assert all(ship.current_hp == 0 for ship in attackers + defenders if not ship.is_alive)
+
+    print("\n✅ Test passed!")
+
+
+def test_hidden_ai_battles_are_estimated():
+    """Test wyboru rozstrzygania - szacujemy tylko duże bitwy AI poza wzrokiem gracza"""
+    print("\n\n=== TEST 9: Bitwy widoczne i niewidoczne dla gracza ===")
+    import random
+    from src.combat.combat_manager import CombatManager
+    from src.config import LANCHESTER_MIN_SHIPS
+    from src.models.empire import Empire
+    from src.models.galaxy import Galaxy, StarSystem
+
+    empires = [Empire(id=i, name=f"Imperium {i}", color=(255, 255, 255), is_player=(i == 0)) for i in range(3)]
+    for first in empires:
+        for second in empires:
+            if first is not second:
+                first.set_relation(second.id, "war")
+
+    galaxy = Galaxy(width=5000, height=1000)
+    for system_id in range(4):
+        galaxy.add_system(StarSystem.generate_random(system_id, 500 + system_id * 1000, 500))
+    galaxy.systems[1].explore(0)  # Gracz widzi tylko system 1
+
+    def stack(system_id: int, owners: tuple[int, int], per_side: int) -> list[Ship]:
+        system = galaxy.systems[system_id]
+        return [
+            Ship.create_ship(system_id * 10_000 + owner * 1000 + i, ShipType.FIGHTER, owner, system.x, system.y)
+            for owner in owners for i in range(per_side)
+        ]
+
+    half = LANCHESTER_MIN_SHIPS // 2
+    ships = (
+        stack(0, (1, 2), half)        # AI vs AI w nieodkrytym systemie - szacowana
+        + stack(1, (1, 2), half)      # AI vs AI w systemie odkrytym przez gracza - dokładna
+        + stack(2, (0, 1), half)      # Z udziałem gracza - dokładna
+        + stack(3, (1, 2), half // 2)  # Za mała na szacowanie - dokładna
+    )
+    manager = CombatManager(rng=random.Random(2), ai_battle_resolution=Battle.LANCHESTER)
+    manager.detect_and_create_battles(ships, empires, galaxy)
+    resolutions = {round(battle.location_x): battle.resolution for battle in manager.active_battles}
+    print(f"Rozstrzyganie bitew: {resolutions}")
+    assert resolutions == {500: Battle.LANCHESTER, 1500: Battle.EXACT, 2500: Battle.EXACT, 3500: Battle.EXACT}
+
+    # Bez galaktyki nie wiemy, co widzi gracz - wszystko dokładnie
+    blind = CombatManager(rng=random.Random(2), ai_battle_resolution=Battle.LANCHESTER)
+    blind.detect_and_create_battles(ships, empires)
+    assert all(battle.resolution == Battle.EXACT for battle in blind.active_battles)
+
+    print("\n✅ Test passed!")
+
+
+def test_battle_history_is_bounded():
+    """Test historii bitew - bufor cykliczny skróconych zapisów"""
+    print("\n\n=== TEST 10: Ograniczona historia bitew ===")
+    import random
+    from src.combat.battle import BattleRecord
+    from src.combat.combat_manager import CombatManager
+    from src.models.empire import Empire
+    from src.models.ship_registry import ShipRegistry
+
+    empires = [Empire(id=i, name=f"Imperium {i}", color=(255, 255, 255)) for i in range(2)]
+    empires[0].set_relation(1, "war")
+    empires[1].set_relation(0, "war")
+
+    manager = CombatManager(rng=random.Random(5), history_size=5)
+    for turn in range(1, 4):
+        ships = ShipRegistry(
+            Ship.create_ship(front * 100 + owner * 50 + i, ShipType.FIGHTER, owner, front * 1000, owner * 10)
+            for front in range(3) for owner in range(2) for i in range(3)
+        )
+        stats = manager.process_combat_turn(ships, empires, turn)
+        assert len(stats['results']) == 3, "Pełne wyniki tury zostają dla UI"
+
+    history = manager.get_recent_battles(10)
+    print(f"Bitew w historii: {len(history)} (z 9), tury: {[record.turn for record in history]}")
+    assert len(manager.battle_history) == 5
+    assert [record.turn for record in history] == [2, 2, 3, 3, 3]
+    assert [record.turn for record in manager.get_recent_battles(2)] == [3, 3]
+    for record in history:
+        assert isinstance(record, BattleRecord)
+        assert record.empire_ids == (0, 1) and record.initial_counts == (3, 3)
+        assert record.total_ships_destroyed == sum(record.losses) > 0
+        assert not hasattr(record, "__dict__"), "Zapis bez słownika atrybutów (slots)"
+
+    print("\n✅ Test passed!")
+
+
 if __name__ == "__main__":
     test_combat_basic()
     test_combat_different_types()
     test_combat_one_on_one()
+    test_battle_detection_range()
+    test_multi_faction_battle()
+    test_vectorized_resolver_matches_scalar()
+    test_parallel_battles_match_sequential()
+    test_lanchester_matches_exact()
+    test_hidden_ai_battles_are_estimated()
+    test_battle_history_is_bounded()
 
     print("\n\n🎉 WSZYSTKIE TESTY PRZESZŁY!")
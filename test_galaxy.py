@@ -0,0 +1,190 @@
+"""
+Testy galaktyki - indeks przestrzenny i generowanie
+"""
+import math
+import random
+from src.models.galaxy import Galaxy, StarSystem, POISSON_DISK_DENSITY
+from src.models.ship import Ship, Fleet
+from src.models.ship_registry import ShipRegistry
+from src.config import MIN_SYSTEM_DISTANCE, GALAXY_WIDTH, GALAXY_HEIGHT, GALAXY_MARGIN, ShipType
+
+
+def _brute_force_in_range(galaxy: Galaxy, x: float, y: float, radius: float) -> list[int]:
+    """Referencyjne wyszukiwanie liniowe (jak przed wprowadzeniem indeksu)"""
+    return [
+        s.id for s in galaxy.systems
+        if math.sqrt((s.x - x)**2 + (s.y - y)**2) <= radius
+    ]
+
+
+def test_spatial_index_matches_linear_scan():
+    """Indeks siatki zwraca te same wyniki co pełne skanowanie"""
+    print("=== TEST: Indeks przestrzenny galaktyki ===")
+    galaxy = Galaxy.generate(seed=1234)
+    rng = random.Random(99)
+
+    for _ in range(500):
+        x = rng.uniform(0, galaxy.width)
+        y = rng.uniform(0, galaxy.height)
+        radius = rng.choice([10, 50, 150, 400, 5000])
+        found = [s.id for s in galaxy.get_systems_in_range(x, y, radius)]
+        assert found == _brute_force_in_range(galaxy, x, y, radius)
+
+    for system in galaxy.systems:
+        assert galaxy.find_system_by_id(system.id) is system
+        assert galaxy.get_system_at(system.x + 5, system.y - 5) is system
+
+    assert galaxy.find_system_by_id(-1) is None
+    assert galaxy.get_system_at(-1000, -1000) is None
+    print(f"✅ {len(galaxy.systems)} systemów - indeks zgodny ze skanowaniem liniowym")
+
+
+def test_spatial_index_stays_in_sync():
+    """Systemy dodane do listy poza add_system() też trafiają do indeksu"""
+    galaxy = Galaxy(width=1000, height=1000)
+    galaxy.add_system(StarSystem.generate_random(0, 100, 100))
+    galaxy.systems.append(StarSystem.generate_random(1, 500, 500))
+
+    assert galaxy.find_system_by_id(1) is not None
+    assert galaxy.get_system_at(500, 500) is galaxy.systems[1]
+    assert galaxy.has_system_within(110, 100, 20)
+    assert not galaxy.has_system_within(300, 300, 20)
+    print("✅ Indeks zsynchronizowany z listą systemów")
+
+
+def test_poisson_generation():
+    """Tryb Poisson-disk: dokładna liczba systemów, odstępy i determinizm"""
+    print("=== TEST: Generowanie Poisson-disk ===")
+    num_systems = 2000  # Nie zmieści się na domyślnej mapie - wymusza powiększenie
+    galaxy = Galaxy.generate(num_systems, mode="poisson", seed=42)
+    assert len(galaxy.systems) == num_systems
+
+    for system in galaxy.systems:
+        assert 0 <= system.x <= galaxy.width and 0 <= system.y <= galaxy.height
+        neighbours = galaxy.get_systems_in_range(system.x, system.y, MIN_SYSTEM_DISTANCE)
+        for other in neighbours:
+            if other is not system:
+                distance = math.sqrt((other.x - system.x)**2 + (other.y - system.y)**2)
+                assert distance >= MIN_SYSTEM_DISTANCE, f"Systemy {system.id} i {other.id} za blisko"
+
+    again = Galaxy.generate(num_systems, mode="poisson", seed=42)
+    assert [(s.x, s.y) for s in again.systems] == [(s.x, s.y) for s in galaxy.systems]
+
+    # Powiększona mapa zachowuje proporcje
+    assert galaxy.width > GALAXY_WIDTH
+    assert math.isclose(
+        (galaxy.width - 2 * GALAXY_MARGIN) / (galaxy.height - 2 * GALAXY_MARGIN),
+        (GALAXY_WIDTH - 2 * GALAXY_MARGIN) / (GALAXY_HEIGHT - 2 * GALAXY_MARGIN)
+    )
+    print(f"✅ {num_systems} systemów na mapie {galaxy.width:.0f}x{galaxy.height:.0f}")
+
+    # Systemy, które się mieszczą, wypełniają mapę o zadanym rozmiarze (bez dziur po losowaniu)
+    small = Galaxy.generate(100, mode="poisson", seed=42)
+    assert len(small.systems) == 100
+    assert (small.width, small.height) == (GALAXY_WIDTH, GALAXY_HEIGHT)
+    xs = [system.x for system in small.systems]
+    ys = [system.y for system in small.systems]
+    spacing = math.sqrt(POISSON_DISK_DENSITY * (GALAXY_WIDTH - 2 * GALAXY_MARGIN)
+                        * (GALAXY_HEIGHT - 2 * GALAXY_MARGIN) / 100)
+    assert min(xs) < GALAXY_MARGIN + spacing and max(xs) > GALAXY_WIDTH - GALAXY_MARGIN - spacing
+    assert min(ys) < GALAXY_MARGIN + spacing and max(ys) > GALAXY_HEIGHT - GALAXY_MARGIN - spacing
+    for system in small.systems:
+        nearest = min(math.hypot(other.x - system.x, other.y - system.y)
+                      for other in small.systems if other is not system)
+        assert MIN_SYSTEM_DISTANCE <= nearest < 2 * spacing
+    print(f"✅ 100 systemów wypełnia mapę {GALAXY_WIDTH}x{GALAXY_HEIGHT}")
+
+
+def test_ownership_index():
+    """Indeks własności śledzi kolonizację i zmiany właściciela"""
+    galaxy = Galaxy(width=1000, height=1000)
+    first = StarSystem.generate_random(0, 100, 100)
+    second = StarSystem.generate_random(1, 500, 500)
+    galaxy.add_system(first)
+    galaxy.add_system(second)
+
+    assert galaxy.get_owned_planets(1) == []
+
+    # Kolonizacja w odwrotnej kolejności - indeks i tak trzyma kolejność galaktyki
+    second.planets[0].colonize(1)
+    first.planets[-1].colonize(1)
+    owned = galaxy.get_owned_planets(1)
+    assert [planet for _, planet in owned] == [first.planets[-1], second.planets[0]]
+    assert owned[0][0] is first and owned[1][0] is second
+
+    # Zmiana właściciela przenosi planetę między imperiami
+    second.planets[0].set_owner(2)
+    assert [planet for _, planet in galaxy.get_owned_planets(1)] == [first.planets[-1]]
+    assert [planet for _, planet in galaxy.get_owned_planets(2)] == [second.planets[0]]
+
+    first.planets[-1].set_owner(None)
+    assert galaxy.get_owned_planets(1) == []
+
+    # Przebudowa indeksu zachowuje własność
+    galaxy.rebuild_index()
+    assert [planet for _, planet in galaxy.get_owned_planets(2)] == [second.planets[0]]
+    print("✅ Indeks własności planet aktualny")
+
+
+def test_hyperlane_routes():
+    """Hiperlinie: spójny graf, trasy po krawędziach, wspólne trasy i lot po trasie"""
+    print("=== TEST: Hiperlinie i trasy ===")
+    galaxy = Galaxy.generate(500, mode="poisson", seed=7, hyperlanes=True)
+    graph = galaxy.hyperlanes
+    lanes = {frozenset(lane) for lane in graph.lanes()}
+
+    # Każdy system osiągalny z systemu 0 po hiperliniach
+    reached, frontier = {0}, [0]
+    while frontier:
+        for neighbour in graph.neighbours_of(frontier.pop()):
+            if neighbour not in reached:
+                reached.add(neighbour)
+                frontier.append(neighbour)
+    assert len(reached) == len(galaxy.systems)
+
+    # Trasa prowadzi po hiperliniach, a ta sama trasa to ten sam obiekt
+    route = graph.find_route(0, 499)
+    assert route.systems[0] == 0 and route.destination == 499
+    assert all(frozenset(pair) in lanes for pair in zip(route.systems, route.systems[1:]))
+    assert graph.find_route(0, 499) is route
+    assert graph.cache_info().hits == 1
+
+    # Wejście do sieci: najbliższy system z siatki, jak przy przeglądzie wszystkich systemów
+    for x, y in [(0.0, 0.0), (galaxy.width / 2, galaxy.height / 3), (galaxy.width * 3, -500.0)]:
+        nearest = min(galaxy.systems, key=lambda s: ((s.x - x)**2 + (s.y - y)**2, s.id))
+        assert galaxy.get_nearest_system(x, y) is nearest
+    assert Galaxy(width=100, height=100).get_nearest_system(50, 50) is None
+
+    # Statki w rejestrze, statek poza rejestrem i flota lecą tą samą trasą
+    start = galaxy.find_system_by_id(0)
+    target = galaxy.find_system_by_id(499)
+    registry = ShipRegistry(Ship.create_ship(i, ShipType.SCOUT, 0, start.x, start.y) for i in range(3))
+    loose = Ship.create_ship(3, ShipType.SCOUT, 0, start.x, start.y)
+    fleet = Fleet(id=0, name="Flota 1", owner_id=0,
+                  ships=[Ship.create_ship(4, ShipType.SCOUT, 0, start.x, start.y)])
+    for unit in list(registry) + [loose, fleet]:
+        assert galaxy.order_move(unit, target)
+        assert unit.route is route and unit.target_system_id == 499
+
+    arrived_turns = []
+    for turn in range(1, 1000):
+        arrived = registry.move_one_turn()
+        loose_arrived = loose.move_one_turn()
+        fleet_arrived = fleet.move_one_turn()
+        assert (len(arrived) == 3) == loose_arrived == fleet_arrived
+        assert registry[0].x == loose.x == fleet.x and registry[0].y == loose.y == fleet.y
+        if loose_arrived:
+            arrived_turns.append(turn)
+            break
+    assert arrived_turns, "Statki nie dotarły do celu"
+    assert (loose.x, loose.y) == (target.x, target.y) and loose.route is None and not loose.is_moving
+    assert registry[0].route is None and fleet.route is None
+    print(f"✅ {len(lanes)} hiperlinii, trasa {len(route.systems)} systemów przebyta w {arrived_turns[0]} turach")
+
+
+if __name__ == "__main__":
+    test_spatial_index_matches_linear_scan()
+    test_spatial_index_stays_in_sync()
+    test_poisson_generation()
+    test_ownership_index()
+    test_hyperlane_routes()
@@ -103,7 +103,522 @@ def test_game_simulation():
         traceback.print_exc()
         return False
 
+
+def test_headless_simulation():
+    """Run the Simulation core for 30 turns without importing pygame"""
+    import subprocess
+    import sys
+
+    # Osobny proces - ten moduł sam importuje pygame
+    code = (
+        "import sys\n"
+        "from src.game_logic import Simulation\n"
+        "sim = Simulation(verbose=False)\n"
+        "sim.initialize_new_game()\n"
+        "for _ in range(30):\n"
+        "    sim.end_turn()\n"
+        "assert sim.current_turn == 31\n"
+        "assert sim.galaxy.systems and sim.empires\n"
+        "assert 'pygame' not in sys.modules, 'Simulation imported pygame'\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+    print("✅ Headless simulation ran 30 turns without pygame")
+
+
+def test_seeded_simulation_is_reproducible():
+    """The same game seed replays bit-for-bit in separate processes"""
+    import subprocess
+    import sys
+
+    # Różne PYTHONHASHSEED - wynik nie może zależeć od kolejności w setach/dictach
+    code = (
+        "import hashlib\n"
+        "from src.game_logic import Simulation\n"
+        "sim = Simulation(verbose=False, seed=5)\n"
+        "sim.initialize_new_game()\n"
+        "for _ in range(40):\n"
+        "    sim.end_turn()\n"
+        "state = (\n"
+        "    [(s.id, s.owner_id, s.x, s.y, s.current_hp) for s in sim.ships],\n"
+        "    [(e.name, e.total_production, sorted(e.researched_technologies)) for e in sim.empires],\n"
+        "    [(p.owner_id, p.population) for system in sim.galaxy.systems for p in system.planets],\n"
+        ")\n"
+        "print(hashlib.sha256(repr(state).encode()).hexdigest())\n"
+    )
+    digests = set()
+    for hash_seed in ("1", "2"):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            env={**os.environ, "PYTHONHASHSEED": hash_seed},
+            capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+        digests.add(result.stdout.strip())
+
+    assert len(digests) == 1, digests
+    print("✅ Seeded simulation replays identically across processes")
+
+
+def test_turn_profiler_export():
+    """Profile a few turns and export the per-phase measurements"""
+    import csv
+    import json
+    import tempfile
+    from src.game_logic import Simulation
+
+    sim = Simulation(verbose=False)
+    sim.initialize_new_game()
+    sim.end_turn()  # Wyłączony profiler nic nie zbiera
+    assert sim.profiler.traces == []
+
+    sim.profiler.enable(track_allocations=True)
+    for _ in range(3):
+        sim.end_turn()
+    sim.profiler.disable()
+
+    traces = sim.profiler.traces
+    assert [t.turn for t in traces] == [3, 4, 5]
+    for trace in traces:
+        assert set(trace.phases) == {
+            "movement", "combat", "ai", "resources", "deficits", "research", "production"
+        }
+        assert sum(p.wall_time for p in trace.phases.values()) <= trace.wall_time
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "profile.json")
+        csv_path = os.path.join(tmp, "profile.csv")
+        sim.profiler.export_json(json_path)
+        sim.profiler.export_csv(csv_path)
+        with open(json_path, encoding="utf-8") as f:
+            assert len(json.load(f)) == 3
+        with open(csv_path, encoding="utf-8") as f:
+            assert len(list(csv.reader(f))) == 1 + 3 * 7
+
+    print(sim.profiler.summary())
+    print("✅ Turn profiler collected and exported 3 turns")
+
+
+def test_ship_registry():
+    """Remove destroyed ships from a large registry without rescanning it"""
+    import random
+    import time
+    from src.models.ship import Ship
+    from src.models.ship_registry import ShipRegistry
+
+    ships = ShipRegistry(Ship.create_ship(i, ShipType.FIGHTER, i % 8, 0, 0) for i in range(100_000))
+    doomed = random.Random(5).sample(list(ships), 1_000)
+
+    start = time.perf_counter()
+    for ship in doomed:
+        ships.remove(ship)
+    elapsed = time.perf_counter() - start
+
+    assert len(ships) == 99_000
+    assert all(ship not in ships and ships.get(ship.id) is None for ship in doomed)
+    assert all(ships.get(ship.id) is ship for ship in ships)
+    assert not ships.discard(doomed[0])
+    print(f"✅ Removed 1000 of 100000 ships in {elapsed * 1000:.2f} ms")
+
+
+def test_vectorized_movement_matches_ships():
+    """Registry movement over columns matches Ship.move_one_turn ship by ship"""
+    import copy
+    import random
+    import numpy as np
+    from src.models.ship import Ship
+    from src.models.ship_registry import ShipRegistry
+
+    rng = random.Random(7)
+    types = list(ShipType)
+    ships = ShipRegistry(
+        Ship.create_ship(i, rng.choice(types), i % 4, rng.uniform(0, 500), rng.uniform(0, 500))
+        for i in range(2_000)
+    )
+    for ship in ships:
+        if rng.random() < 0.8:
+            ship.move_to(rng.uniform(0, 500), rng.uniform(0, 500), rng.randrange(40))
+    expected = copy.deepcopy(ships)
+
+    for _ in range(5):
+        arrived = ships.move_one_turn()
+        expected_arrived = [i for i, ship in enumerate(expected) if ship.move_one_turn()]
+        assert arrived.tolist() == expected_arrived
+        assert [(s.x, s.y, s.is_moving, s.target_x) for s in ships] == \
+               [(s.x, s.y, s.is_moving, s.target_x) for s in expected]
+    assert np.array_equal(ships.column("x"), [s.x for s in ships])
+
+    # Usunięty statek zachowuje swoje pola poza rejestrem
+    ship = ships[10]
+    values = ship.values()
+    ships.remove(ship)
+    assert ship not in ships and ship.values() == values
+    print(f"✅ Vectorized movement of {len(expected)} ships matches per-ship movement")
+
+
+def test_fleet_moves_and_fights_as_one_unit():
+    """A 500-ship fleet moves in one step and drops its losses after combat"""
+    import numpy as np
+    from src.game_logic import Simulation
+    from src.models.ship import Ship
+
+    sim = Simulation(verbose=False, seed=3)
+    sim.initialize_new_game(num_systems=30, with_test_scenario=False)
+
+    doomstack = [Ship.create_ship(10_000 + i, ShipType.CRUISER, 0, 2000, 2000) for i in range(500)]
+    for ship in doomstack:
+        sim.ships.append(ship)
+    fleet = sim.create_fleet(doomstack)
+    assert fleet.total_attack == sum(s.attack for s in doomstack)
+    assert fleet.speed == doomstack[0].speed
+
+    fleet.move_to(3000, 2000)
+    sim._process_movement()
+    assert fleet.x == 2000 + fleet.speed * 10
+    assert all(s.x == fleet.x and not s.is_moving for s in doomstack)
+
+    # Fleet writes the registry's x/y columns; rows stay right after a swap-remove
+    sim.ships.remove(sim.ships[0])  # The last row (a fleet ship) moves into row 0
+    sim._process_movement()
+    rows = sim.ships.rows_of(np.array([s.id for s in doomstack]))
+    assert (rows >= 0).all() and (sim.ships.column("x")[rows] == fleet.x).all()
+    assert all(s.x == fleet.x and s.y == fleet.y for s in doomstack)
+
+    # Enemy fleet in range - the battle removes dead ships from both fleets
+    raiders = [Ship.create_ship(20_000 + i, ShipType.BATTLESHIP, 1, fleet.x, fleet.y) for i in range(50)]
+    for ship in raiders:
+        sim.ships.append(ship)
+    enemy = sim.create_fleet(raiders)
+    sim._process_combat()
+    for f in (fleet, enemy):
+        assert all(s.is_alive for s in f.ships)
+        assert f.total_hp == sum(s.current_hp for s in f.ships)
+        assert (f.id in sim.fleets) == bool(f.ships)
+    print(f"✅ Fleet of {len(doomstack)} ships moved as one unit, {len(fleet)} survived the battle")
+
+
+def test_world_snapshot_matches_galaxy_scan():
+    """The shared AI snapshot answers the same queries as scanning the galaxy"""
+    from src.ai import WorldSnapshot
+    from src.config import COLONIZABLE_PLANET_TYPES
+    from src.game_logic import Simulation
+
+    sim = Simulation(verbose=False, seed=21)
+    sim.initialize_new_game(with_test_scenario=False, num_systems=300, galaxy_mode="poisson", ai_only=True)
+    for _ in range(20):
+        sim.end_turn()
+
+    empires = [ai.empire for ai in sim.ai_controllers.values()]
+    snapshot = WorldSnapshot.build(sim.galaxy, sim.ships, empires)
+    list_snapshot = WorldSnapshot.build(sim.galaxy, list(sim.ships), empires)
+    for empire in empires:
+        expected_ships = [s for s in sim.ships if s.owner_id == empire.id]
+        assert snapshot.ships_of(empire.id) == expected_ships == list_snapshot.ships_of(empire.id)
+        assert snapshot.unexplored_systems(empire.id) == [
+            system for system in sim.galaxy.systems if not empire.has_explored(system.id)
+        ]
+        assert snapshot.colonizable_planets(empire.id, COLONIZABLE_PLANET_TYPES) == [
+            (system, planet) for system in sim.galaxy.systems if empire.has_explored(system.id)
+            for planet in system.get_colonizable_planets(COLONIZABLE_PLANET_TYPES)
+        ]
+        assert snapshot.planets_of(empire.id) == [
+            (system, planet) for system in sim.galaxy.systems for planet in system.planets
+            if planet.owner_id == empire.id
+        ]
+
+    # Kolonizacja po zbudowaniu migawki nie zmienia migawki, ale trafia do następnej
+    system, planet = snapshot.colonizable_planets(empires[0].id, COLONIZABLE_PLANET_TYPES)[0]
+    planet.colonize(empires[0].id)
+    assert (system, planet) in snapshot.colonizable_planets(empires[0].id, COLONIZABLE_PLANET_TYPES)
+    rebuilt = WorldSnapshot.build(sim.galaxy, sim.ships, empires)
+    assert (system, planet) not in rebuilt.colonizable_planets(empires[0].id, COLONIZABLE_PLANET_TYPES)
+    assert (system, planet) in rebuilt.planets_of(empires[0].id)
+    print(f"✅ World snapshot for {len(empires)} AI empires matches galaxy scans")
+
+
+def test_batched_scout_assignment():
+    """Batched scout matching equals brute-force greedy and skips claimed systems"""
+    import math
+    import random
+    import numpy as np
+    from src.ai.assignment import assign_nearest, assign_greedy
+    from src.game_logic import Simulation
+
+    rng = random.Random(3)
+    for _ in range(100):
+        units = [(rng.randint(0, 20), rng.randint(0, 20)) for _ in range(rng.randint(0, 10))]
+        targets = [(rng.randint(0, 20), rng.randint(0, 20)) for _ in range(rng.randint(0, 14))]
+        arrays = [np.array([p[axis] for p in points], dtype=float) for points in (units, targets) for axis in (0, 1)]
+
+        # Wzorzec: wszystkie pary posortowane po (odległość, jednostka, cel)
+        pairs = sorted(
+            (math.sqrt((tx - ux)**2 + (ty - uy)**2), i, j)
+            for i, (ux, uy) in enumerate(units) for j, (tx, ty) in enumerate(targets)
+        )
+        expected, used_units, used_targets = [], set(), set()
+        for _, i, j in pairs:
+            if i not in used_units and j not in used_targets:
+                used_units.add(i)
+                used_targets.add(j)
+                expected.append((i, j))
+        unit_indices, target_indices = assign_greedy(*arrays)
+        assert list(zip(unit_indices.tolist(), target_indices.tolist())) == expected
+
+        # Tryb "nearest": każdy scout po kolei bierze najbliższy wolny cel
+        free = list(range(len(targets)))
+        nearest = []
+        for ux, uy in units[:len(targets)]:
+            j = min(free, key=lambda j: math.sqrt((targets[j][0] - ux)**2 + (targets[j][1] - uy)**2))
+            free.remove(j)
+            nearest.append(j)
+        assert assign_nearest(*arrays)[1].tolist() == nearest
+
+    # Remis na granicy najbliższych celów: wygrywają cele o niższym indeksie
+    target_x = np.tile([5.0, 3.0, 4.0, 0.0], 125)
+    target_y = np.tile([0.0, 4.0, 3.0, 5.0], 125)
+    for units in (1, 5, 19):
+        unit_indices, target_indices = assign_greedy(np.zeros(units), np.zeros(units), target_x, target_y)
+        assert unit_indices.tolist() == list(range(units))
+        assert target_indices.tolist() == list(range(units))
+
+    # Scout w drodze trzyma swój cel - scout bez rozkazu leci gdzie indziej
+    sim = Simulation(verbose=False, seed=8)
+    sim.initialize_new_game(with_test_scenario=False, num_systems=200, galaxy_mode="poisson", ai_only=True)
+    ai = next(iter(sim.ai_controllers.values()))
+    scouts = [s for s in sim.ships if s.owner_id == ai.empire.id and s.ship_type == ShipType.SCOUT]
+    first, second = scouts[:2]
+    ai.make_turn_decisions(sim.ships)
+    assert first.is_moving and second.is_moving
+    assert first.target_system_id != second.target_system_id
+    claimed = first.target_system_id
+    second.is_moving = False
+    second.x, second.y = first.x, first.y
+    ai.make_turn_decisions(sim.ships)
+    assert second.is_moving and second.target_system_id != claimed
+    print("✅ Batched scout assignment matches greedy matching and respects claimed targets")
+
+
+def test_colonization_planner():
+    """Colony ships get the best-scored free systems, one ship per system"""
+    import numpy as np
+    from src.ai import WorldSnapshot
+    from src.ai.colonization import score_planets
+    from src.config import COLONIZABLE_PLANET_TYPES, COLONY_SCORE_DISTANCE
+    from src.game_logic import Simulation
+    from src.models.ship import Ship
+
+    sim = Simulation(verbose=False, seed=13)
+    sim.initialize_new_game(with_test_scenario=False, num_systems=600, galaxy_mode="poisson", ai_only=True)
+    ai = next(iter(sim.ai_controllers.values()))
+    empire = ai.empire
+    for system in sim.galaxy.systems:
+        empire.explore_system(system.id)
+
+    # Setki wolnych statków kolonistów w systemie macierzystym
+    home = sim.galaxy.find_system_by_id(empire.home_system_id)
+    for _ in range(300):
+        sim.ships.append(Ship.create_ship(sim.next_ship_id, ShipType.COLONY_SHIP, empire.id, home.x, home.y))
+        sim.next_ship_id += 1
+    snapshot = WorldSnapshot.build(sim.galaxy, sim.ships, [empire])
+    candidates = snapshot.colonizable_indices(empire.id, COLONIZABLE_PLANET_TYPES)
+
+    ai.make_turn_decisions(sim.ships, snapshot)
+    colony_ships = [s for s in sim.ships if s.owner_id == empire.id and s.ship_type == ShipType.COLONY_SHIP]
+    targets = [s.target_system_id for s in colony_ships if s.is_moving]
+    assert len(targets) == len(set(targets)), "Dwa statki lecą do tego samego systemu"
+    targeted_systems = len({int(snapshot.planet_system[p]) for p in candidates.tolist()})
+    assert len(targets) == min(len(colony_ships), targeted_systems)
+
+    # Wszystkie statki startują z jednego miejsca - wybrane systemy to najlepiej ocenione
+    distance = np.hypot(snapshot.system_x - home.x, snapshot.system_y - home.y)
+    scores = score_planets(snapshot.planet_traits, candidates) - COLONY_SCORE_DISTANCE * distance[snapshot.planet_system[candidates]]
+    best_by_system = {}
+    for planet, score in zip(candidates.tolist(), scores.tolist()):
+        system = snapshot.systems[snapshot.planet_system[planet]].id
+        best_by_system[system] = max(best_by_system.get(system, -np.inf), score)
+    ranked = sorted(best_by_system.values(), reverse=True)
+    assert min(best_by_system[t] for t in targets) >= ranked[len(targets) - 1] - 1e-9
+
+    # Zajęte systemy nie są wybierane ponownie przez nowe statki
+    extra = Ship.create_ship(sim.next_ship_id, ShipType.COLONY_SHIP, empire.id, home.x, home.y)
+    sim.ships.append(extra)
+    ai.make_turn_decisions(sim.ships)
+    assert not extra.is_moving or extra.target_system_id not in targets
+    assert ai.colonization.claimed_systems >= set(targets)
+    print(f"✅ Colonization planner sent {len(targets)} colony ships to distinct top-scored systems")
+
+
+def test_colony_ships_settle_planned_planets():
+    """A colony ship settles the planet the planner scored, including tech-unlocked types"""
+    from src.config import COLONIZABLE_PLANET_TYPES, PlanetType
+    from src.game_logic import Simulation
+    from src.models.ship import Ship
+
+    sim = Simulation(verbose=False, seed=31)
+    sim.initialize_new_game(with_test_scenario=False, num_systems=300, galaxy_mode="poisson", ai_only=True)
+    ai = next(iter(sim.ai_controllers.values()))
+    empire = ai.empire
+    empire.researched_technologies.update({"ice_colonization", "rock_colonization"})
+    for system in sim.galaxy.systems:
+        empire.explore_system(system.id)
+
+    home = sim.galaxy.find_system_by_id(empire.home_system_id)
+    for _ in range(60):
+        sim.ships.append(Ship.create_ship(sim.next_ship_id, ShipType.COLONY_SHIP, empire.id, home.x, home.y))
+        sim.next_ship_id += 1
+    ai.make_turn_decisions(sim.ships)
+
+    planned = {}
+    for ship in sim.ships:
+        if ship.owner_id == empire.id and ship.ship_type == ShipType.COLONY_SHIP and ship.is_moving:
+            system, planet = sim.galaxy.planet_entries()[ship.target_planet_index]
+            assert system.id == ship.target_system_id and not planet.is_colonized
+            planned[ship.id] = (system, planet)
+    assert len(planned) == 61  # Razem ze startowym statkiem kolonistów
+
+    # Zaplanowane planety, których stara kolonizacja "pierwsza podstawowa planeta" by nie wybrała
+    advanced = [p for _, p in planned.values() if p.planet_type in (PlanetType.ICE, PlanetType.ROCK)]
+    not_first = [p for s, p in planned.values() if p not in s.get_colonizable_planets(COLONIZABLE_PLANET_TYPES)[:1]]
+    assert advanced and not_first
+
+    # Tylko ruch (bez decyzji innych AI) - statki kolonizują po dotarciu
+    for _ in range(1000):
+        if not any(ship.id in planned for ship in sim.ships):
+            break
+        sim._process_movement()
+    assert all(planet.owner_id == empire.id for _, planet in planned.values())
+    print(f"✅ {len(planned)} colony ships settled their planned planets ({len(advanced)} ice/rock)")
+
+
+def test_time_budgeted_ai_carries_work_over():
+    """An exhausted AI budget does one step per turn and resumes where it stopped"""
+    from src.ai import TimeBudget
+    from src.game_logic import Simulation
+
+    ticks = iter(range(100))
+    budget = TimeBudget(2.0, clock=lambda: next(ticks) / 1000)  # Zegar: 1 ms na odczyt
+    assert budget.limited and not budget.expired() and budget.expired()
+    assert not TimeBudget(None).expired() and TimeBudget(None).remaining_ms() is None
+
+    sim = Simulation(verbose=False, seed=17)
+    sim.initialize_new_game(with_test_scenario=False, num_systems=100, galaxy_mode="poisson", ai_only=True)
+    ai = next(iter(sim.ai_controllers.values()))
+    for system in sim.galaxy.systems[:3]:
+        for planet in system.planets:
+            if not planet.is_colonized:
+                planet.colonize(ai.empire.id)
+    planets = sim.galaxy.get_owned_planets(ai.empire.id)
+
+    # Budżet 0: w każdej turze jeden rozkaz (dwa scouty = dwie tury eksploracji)
+    # lub jedna planeta w produkcji
+    for expected_step in (0, 1, 2, 3):
+        ai.make_turn_decisions(sim.ships, time_budget_ms=0)
+        assert ai._resume_step == expected_step
+    assert not any(planet.production_queue for _, planet in planets[1:])
+    for turn in range(1, len(planets) + 1):
+        ai.make_turn_decisions(sim.ships, time_budget_ms=0)
+        served = [bool(planet.production_queue) for _, planet in planets]
+        assert served == [i < turn for i in range(len(planets))]
+    assert ai._resume_step == 0 and ai._production_cursor == 0
+
+    # Bez limitu wszystkie kroki w jednej turze
+    sim.ai_time_budget_ms = None
+    sim.end_turn()
+    assert ai._resume_step == 0
+    print(f"✅ Budgeted AI served {len(planets)} planets across turns and resumed each step")
+
+
+def test_budgeted_ai_sends_ships_in_slices():
+    """On a large galaxy an exhausted budget sends one scout or colony ship per turn"""
+    import pickle
+    from src.game_logic import Simulation
+    from src.models.ship import Ship
+
+    def setup():
+        sim = Simulation(verbose=False, seed=29)
+        sim.initialize_new_game(with_test_scenario=False, num_systems=3000, galaxy_mode="poisson", ai_only=True)
+        sim.galaxy.build_hyperlanes()
+        ai = next(iter(sim.ai_controllers.values()))
+        for system in sim.galaxy.systems[::2]:
+            ai.empire.explore_system(system.id)
+        home = sim.galaxy.find_system_by_id(ai.empire.home_system_id)
+        for ship_type in [ShipType.SCOUT] * 30 + [ShipType.COLONY_SHIP] * 30:
+            sim.ships.append(Ship.create_ship(sim.next_ship_id, ship_type, ai.empire.id, home.x, home.y))
+            sim.next_ship_id += 1
+        return sim, ai
+
+    def targets(sim, ai):
+        return {s.id: s.target_system_id for s in sim.ships if s.owner_id == ai.empire.id and s.is_moving}
+
+    # Wzorzec: bez limitu wszystkie statki w jednej turze
+    sim, ai = setup()
+    ai.make_turn_decisions(sim.ships)
+    expected = targets(sim, ai)
+    assert len(expected) == 32 + 31
+
+    # Budżet 0: eksploracja i kolonizacja wysyłają po jednym statku na turę
+    sim, ai = setup()
+    turns = 0
+    while len(targets(sim, ai)) < len(expected):
+        orders = ai.make_turn_decisions(sim.ships, time_budget_ms=0)
+        assert len(orders) == 1
+        turns += 1
+        # Niewysłane przydziały przechodzą przez stan kontrolera (jak z procesu roboczego)
+        ai.load_decision_state(pickle.loads(pickle.dumps(ai.decision_state())))
+        if turns == 1:
+            assert ai._resume_step == 0 and len(ai._pending_exploration) == 31
+    assert turns == len(expected) and not ai._pending_exploration and not ai._pending_colonization
+    assert targets(sim, ai) == expected
+    print(f"✅ Budgeted AI sent {len(expected)} ships on a 3000-system galaxy one order per turn")
+
+
+def test_parallel_ai_matches_sequential():
+    """AI empires deciding in a process pool play the same game as sequential AI"""
+    from src.ai import ParallelAI
+    from src.game_logic import Simulation
+
+    def play(workers):
+        sim = Simulation(verbose=False, seed=23)
+        sim.parallel_ai = ParallelAI(workers=workers)
+        sim.initialize_new_game(with_test_scenario=False, num_systems=150, galaxy_mode="poisson",
+                                ai_only=True, num_ai_empires=4, hyperlanes=True)
+        try:
+            for _ in range(15):
+                sim.end_turn()
+        finally:
+            sim.close()
+        return (
+            [(s.id, s.x, s.y, s.target_system_id, s.current_hp) for s in sim.ships],
+            [(e.current_research, sorted(e.researched_technologies)) for e in sim.empires],
+            [[(item.item_type, item.building_id, item.ship_type) for item in p.production_queue]
+             for system in sim.galaxy.systems for p in system.planets],
+            [ai.rng.getstate() for ai in sim.ai_controllers.values()],
+        )
+
+    sequential, parallel = play(0), play(2)
+    assert parallel == sequential
+    print(f"✅ Parallel AI (2 workers) matched sequential AI: {len(sequential[0])} ships after 15 turns")
+
+
 if __name__ == "__main__":
     import sys
+    test_headless_simulation()
+    test_seeded_simulation_is_reproducible()
+    test_turn_profiler_export()
+    test_ship_registry()
+    test_vectorized_movement_matches_ships()
+    test_fleet_moves_and_fights_as_one_unit()
+    test_world_snapshot_matches_galaxy_scan()
+    test_batched_scout_assignment()
+    test_colonization_planner()
+    test_colony_ships_settle_planned_planets()
+    test_time_budgeted_ai_carries_work_over()
+    test_budgeted_ai_sends_ships_in_slices()
+    test_parallel_ai_matches_sequential()
     success = test_game_simulation()
     sys.exit(0 if success else 1)